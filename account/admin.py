@@ -9,6 +9,27 @@ from .models import *
 admin.site.register(Callback)
 
 
+@admin.register(OutboxEmail)
+class AdminOutboxEmail(admin.ModelAdmin):
+    actions = None
+    list_display = ("id", "subject", "to", "status", "attempts", "created_at", "sent_at")
+    list_filter = ("status",)
+
+
+@admin.register(ImageTask)
+class AdminImageTask(admin.ModelAdmin):
+    actions = None
+    list_display = ("name", "attempts", "last_error", "created_at")
+
+
+@admin.register(Recommendation)
+class AdminRecommendation(admin.ModelAdmin):
+    actions = None
+    list_display = ("kind", "object", "region", "rank", "user", "score", "reasons")
+    list_filter = ("kind", "object")
+    raw_id_fields = ("user",)
+
+
 class UploadInline(admin.StackedInline):
     model = Upload
     extra = 0
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework.authentication import TokenAuthentication
+
+TOKEN_PREFIX = "token"
+
+
+def get_token_cache_key(key):
+    return f"{TOKEN_PREFIX}:{key}"
+
+
+def invalidate_tokens(*keys):
+    cache.delete_many([get_token_cache_key(key) for key in keys])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication caching the token -> user resolution for
+    ``TOKEN_CACHE_TIMEOUT`` seconds. Entries are dropped on logout and
+    whenever the user is saved (password change, ``is_active`` flip, ...).
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = get_token_cache_key(key)
+        user = cache.get(cache_key)
+        if user is not None:
+            return (user, self.get_model()(key=key, user=user))
+
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, user, settings.TOKEN_CACHE_TIMEOUT)
+        return (user, token)
@@ -0,0 +1,72 @@
+import os
+import time
+from collections import Counter
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models import FileField
+
+from .images import WIDTHS, derivative_name, get_derivative_widths, get_widths_key, manifest_name
+from .storage import BLOBS_DIR, ContentAddressedStorage, blob_storage
+
+# Unreferenced blobs younger than this may belong to a row that is not
+# committed yet
+GRACE_PERIOD = 24 * 60 * 60
+
+
+def get_blob_fields():
+    for model in apps.get_models():
+        if model._meta.proxy:
+            continue
+        for field in model._meta.concrete_fields:
+            if isinstance(field, FileField) and isinstance(field.storage, ContentAddressedStorage):
+                yield model, field
+
+
+def count_references():
+    """
+    Return a ``Counter`` of how many rows reference every stored file name
+    across all fields using ``blob_storage``.
+    """
+    references = Counter()
+    for model, field in get_blob_fields():
+        names = model._base_manager.exclude(**{field.name: ""}).values_list(field.name, flat=True)
+        references.update(names.iterator())
+    return references
+
+
+def iter_blobs(storage=blob_storage):
+    root = storage.path(BLOBS_DIR)
+    for directory, _, files in os.walk(root):
+        for file in files:
+            path = os.path.join(directory, file)
+            yield os.path.relpath(path, storage.location).replace(os.sep, "/"), os.stat(path)
+
+
+def collect_blobs(grace_period=GRACE_PERIOD, dry_run=False, storage=blob_storage):
+    """
+    Delete blobs no row references anymore, with their WebP derivatives.
+    Returns the number of kept blobs, deleted blobs and freed bytes.
+    """
+    references = count_references()
+    deadline = time.time() - grace_period
+    kept = deleted = freed = 0
+    for name, stat in iter_blobs(storage):
+        if references[name] or stat.st_mtime > deadline:
+            kept += 1
+            continue
+        deleted += 1
+        freed += stat.st_size
+        if not dry_run:
+            storage.purge(name)
+            purge_derivatives(name, storage)
+    return kept, deleted, freed
+
+
+def purge_derivatives(name, storage=blob_storage):
+    # Sets interrupted before their manifest was written use WIDTHS
+    widths = set(get_derivative_widths(name, storage) or ()) | set(WIDTHS)
+    for width in widths:
+        storage.purge(derivative_name(name, width))
+    storage.purge(manifest_name(name))
+    cache.delete(get_widths_key(name))
@@ -0,0 +1,82 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from helper.models import StudentMission, StudentSkill
+from helper.serializers import SkillSerializer
+from .models import Student, StudentDashboard, StudentEmployer, StudentProfessional
+
+BATCH_SIZE = 500
+
+
+def group_by_student(queryset, **fields):
+    """
+    ``{student_id: [{name: value, ...}, ...]}`` of ``queryset`` rows, with
+    ``fields`` mapping the stored names to the queried fields.
+    """
+    grouped = defaultdict(list)
+    for row in queryset.order_by("pk").values("student_id", *fields.values()):
+        grouped[row["student_id"]].append({name: row[field] for name, field in fields.items()})
+    return grouped
+
+
+def refresh_dashboards(*pks, batch_size=BATCH_SIZE):
+    """
+    Rebuild the ``StudentDashboard`` rows of the ``pks`` students with seven
+    queries per batch, whatever the number of students. Students are
+    locked while their rows are rebuilt, so concurrent writes of the same
+    student are applied one after the other.
+    """
+    pks = list(pks)
+    for i in range(0, len(pks), batch_size):
+        with transaction.atomic():
+            refresh_batch(pks[i:i + batch_size])
+
+
+def refresh_batch(pks):
+    students = list(
+        Student._base_manager.select_for_update()
+        .filter(pk__in=pks)
+        .only("pk", "coins", "role", "motivation")
+    )
+    pks = [student.pk for student in students]
+
+    missions = group_by_student(
+        StudentMission.objects.filter(student_id__in=pks),
+        mission="mission_id",
+        stage="stage",
+        is_complete="is_complete",
+        is_unlocked="is_unlocked",
+    )
+    skills = defaultdict(list)
+    for skill in StudentSkill.objects.filter(student_id__in=pks).order_by("pk"):
+        skills[skill.student_id].append(skill)
+    # Same keys as StudentEmployerSerializer and StudentProfessionalSerializer
+    employers = group_by_student(
+        StudentEmployer.objects.filter(student_id__in=pks),
+        pk="employer_id",
+        company_name_other="employer__company_name_other",
+        company_logo="employer__company_logo",
+        company_description_other="employer__company_description_other",
+    )
+    professionals = group_by_student(
+        StudentProfessional.objects.filter(student_id__in=pks),
+        pk="professional_id",
+        profession_name_other="professional__profession_name_other",
+        profession_definition_other="professional__profession_definition_other",
+    )
+
+    StudentDashboard.objects.filter(student_id__in=pks).delete()
+    StudentDashboard.objects.bulk_create([
+        StudentDashboard(
+            student_id=student.pk,
+            coins=student.coins,
+            missions=missions[student.pk],
+            skills=SkillSerializer(skills[student.pk], many=True).data,
+            role=student.role,
+            motivation=student.motivation,
+            employers=employers[student.pk],
+            professionals=professionals[student.pk],
+        )
+        for student in students
+    ])
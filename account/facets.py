@@ -0,0 +1,68 @@
+from django.db import connection
+from django.db.models import BooleanField, ExpressionWrapper, F
+
+# Facet kinds, each counting the rows its filter would return: per value
+# of a column filtered with ``=``, per value of a column filtered with
+# ``__gte``, per element of an array column filtered with
+# ``__contained_by``, or of rows matching a condition
+VALUE = "value"
+MIN = "min"
+ARRAY = "array"
+FLAG = "flag"
+
+
+def facet_counts(queryset, facets):
+    """
+    Count ``queryset`` rows per option of every facet in one statement.
+
+    ``facets`` are ``(name, field or Q, kind)`` tuples. Returns
+    ``{name: [{"value": ..., "count": ...}, ...]}`` with the most frequent
+    values first, and ``{name: count}`` for flags. ``MIN`` options count
+    the rows with at least that value, ``ARRAY`` options every element
+    found in the column and the rows that element alone contains, so each
+    count is the size of the list filtered with that option.
+    """
+    annotations = {}
+    for i, (name, field, kind) in enumerate(facets):
+        if kind == FLAG:
+            annotations[f"facet_{i}"] = ExpressionWrapper(field, output_field=BooleanField())
+        else:
+            annotations[f"facet_{i}"] = F(field)
+    base = queryset.order_by().annotate(**annotations).values(*annotations)
+    base_sql, params = base.query.sql_with_params()
+
+    selects = []
+    for i, (name, field, kind) in enumerate(facets):
+        column = f"facet_{i}"
+        if kind == FLAG:
+            selects.append(f"SELECT {i}, NULL, count(*) FROM filtered WHERE {column}")
+        elif kind == MIN:
+            selects.append(
+                f"SELECT {i}, {column}::text, (sum(count(*)) OVER (ORDER BY {column} DESC))::bigint "
+                f"FROM filtered WHERE {column} IS NOT NULL GROUP BY {column}"
+            )
+        elif kind == ARRAY:
+            selects.append(
+                f"SELECT {i}, value, count(*) FILTER (WHERE {column} <@ ARRAY[value]) "
+                f"FROM filtered, (SELECT DISTINCT unnest({column}) AS value FROM filtered) AS options "
+                f"GROUP BY value"
+            )
+        else:
+            selects.append(f"SELECT {i}, {column}::text, count(*) FROM filtered WHERE {column} IS NOT NULL GROUP BY {column}")
+    sql = f"""
+        WITH filtered AS MATERIALIZED ({base_sql})
+        {" UNION ALL ".join(selects)}
+        ORDER BY 1, 3 DESC, 2
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    counts = {name: 0 if kind == FLAG else [] for name, field, kind in facets}
+    for i, value, count in rows:
+        name, field, kind = facets[i]
+        if kind == FLAG:
+            counts[name] = count
+        else:
+            counts[name].append({"value": value, "count": count})
+    return counts
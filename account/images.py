@@ -0,0 +1,212 @@
+import io
+import json
+import os
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from events.models import Event
+from .models import Employer, Professional, NPO, College, Student, ImageTask
+from .signals import images_processed
+
+DERIVATIVES_DIR = "derivatives"
+WIDTHS_PREFIX = "derivatives"
+# Widths of the generated WebP images, never larger than the original
+WIDTHS = (64, 128, 256, 512)
+WEBP_QUALITY = 80
+BATCH_SIZE = 20
+MAX_ATTEMPTS = 3
+
+IMAGE_FIELDS = (
+    (Employer, "company_logo"),
+    (NPO, "company_logo"),
+    (College, "college_logo"),
+    (Professional, "photo"),
+    (Student, "photo"),
+    (Event, "photo"),
+)
+
+
+def derivative_name(name, width):
+    """
+    ``employers/logo.png`` -> ``derivatives/employers/logo.256.webp``.
+    Uploads get unique names, so derivatives of a replaced image never
+    collide with the new ones.
+    """
+    return f"{DERIVATIVES_DIR}/{os.path.splitext(name)[0]}.{width}.webp"
+
+
+def manifest_name(name):
+    """
+    ``employers/logo.png`` -> ``derivatives/employers/logo.json``, the list
+    of generated widths, written last so that it marks a complete set.
+    """
+    return f"{DERIVATIVES_DIR}/{os.path.splitext(name)[0]}.json"
+
+
+def get_widths_key(name):
+    return f"{WIDTHS_PREFIX}:{name}"
+
+
+def has_derivatives(name, storage=default_storage):
+    return storage.exists(manifest_name(name))
+
+
+def get_widths(image_width):
+    """
+    Widths of the derivatives of an image ``image_width`` wide: the
+    ``WIDTHS`` it can be reduced to, and its own width unless it is wider
+    than all of them.
+    """
+    widths = [width for width in WIDTHS if width < image_width]
+    if image_width <= WIDTHS[-1]:
+        widths.append(image_width)
+    return widths
+
+
+def get_derivative_widths(name, storage=default_storage):
+    """
+    Widths of the derivatives of ``name``, ``None`` until ``process_images``
+    generated them. Cached without expiry, as uploads get unique names.
+    """
+    key = get_widths_key(name)
+    widths = cache.get(key)
+    if widths is None:
+        try:
+            with storage.open(manifest_name(name)) as file:
+                widths = json.load(file)
+        except FileNotFoundError:
+            return None
+        cache.set(key, widths, None)
+    return widths
+
+
+def get_image_names(instance):
+    names = []
+    for model, field in IMAGE_FIELDS:
+        if isinstance(instance, model):
+            file = getattr(instance, field)
+            if file:
+                names.append(file.name)
+    return names
+
+
+def enqueue(*names):
+    """
+    Queue images without derivatives for ``process_images`` once the
+    current transaction commits.
+    """
+    names = {name for name in names if name and not has_derivatives(name)}
+    if not names:
+        return
+    transaction.on_commit(lambda: ImageTask.objects.bulk_create(
+        [ImageTask(name=name) for name in names], ignore_conflicts=True
+    ))
+
+
+def resize(image, width):
+    if image.width <= width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+
+
+def make_derivatives(name, storage=default_storage):
+    """
+    Write the WebP derivatives of the ``name`` image, never upscaling it,
+    then the manifest of their widths.
+    """
+    with storage.open(name) as file:
+        image = Image.open(file)
+        # JPEG decodes straight to a reduced size
+        image.draft("RGB", (WIDTHS[-1], WIDTHS[-1]))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            transparent = image.mode in ("LA", "PA") or "transparency" in image.info
+            image = image.convert("RGBA" if transparent else "RGB")
+
+        widths = get_widths(image.width)
+        for width in reversed(widths):
+            image = resize(image, width)
+            buffer = io.BytesIO()
+            image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+            overwrite(storage, derivative_name(name, width), buffer.getvalue())
+
+    overwrite(storage, manifest_name(name), json.dumps(widths).encode())
+    cache.set(get_widths_key(name), widths, None)
+
+
+def overwrite(storage, name, content):
+    if storage.exists(name):
+        storage.delete(name)
+    storage.save(name, ContentFile(content))
+
+
+def process_pending(batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    """
+    Generate derivatives of one batch of queued images, locked with
+    ``SKIP LOCKED`` so several workers can run at once, and send
+    ``images_processed`` for them. Returns the number of processed and
+    failed images.
+    """
+    processed = failed = 0
+    names = []
+    with transaction.atomic():
+        tasks = list(
+            ImageTask.objects
+            .select_for_update(skip_locked=True)
+            .filter(attempts__lt=max_attempts)
+            .order_by("created_at")[:batch_size]
+        )
+        done = []
+        for task in tasks:
+            try:
+                make_derivatives(task.name)
+            except FileNotFoundError:
+                # The image was replaced or deleted meanwhile
+                done.append(task.pk)
+            except Exception as e:
+                task.attempts += 1
+                task.last_error = str(e)
+                task.save(update_fields=("attempts", "last_error"))
+                failed += 1
+            else:
+                done.append(task.pk)
+                names.append(task.name)
+                processed += 1
+        ImageTask.objects.filter(pk__in=done).delete()
+        if names:
+            images_processed.send(sender=ImageTask, names=names)
+    return processed, failed
+
+
+class ImageSetField(serializers.Field):
+    """
+    Read-only ``{"src", "srcset"}`` of the WebP derivatives of an image
+    field, ``None`` until ``process_images`` generated them.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        widths = get_derivative_widths(value.name, value.storage) if value else None
+        if not widths:
+            return None
+
+        request = self.context.get("request")
+        urls = []
+        for width in widths:
+            url = value.storage.url(derivative_name(value.name, width))
+            if request is not None:
+                url = request.build_absolute_uri(url)
+            urls.append((width, url))
+        return {
+            "src": urls[-1][1],
+            "srcset": ", ".join(f"{url} {width}w" for width, url in urls),
+        }
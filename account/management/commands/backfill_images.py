@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from account.images import IMAGE_FIELDS, has_derivatives
+from account.models import ImageTask
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Queue existing logos and photos without WebP derivatives for process_images"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Queue images that already have derivatives")
+
+    def handle(self, *args, **options):
+        queued = 0
+        for model, field in IMAGE_FIELDS:
+            names = (
+                model._default_manager
+                .exclude(**{field: ""})
+                .values_list(field, flat=True)
+                .distinct()
+            )
+            tasks = [
+                ImageTask(name=name) for name in names.iterator()
+                if options["force"] or not has_derivatives(name)
+            ]
+            for offset in range(0, len(tasks), BATCH_SIZE):
+                ImageTask.objects.bulk_create(tasks[offset:offset + BATCH_SIZE], ignore_conflicts=True)
+            queued += len(tasks)
+            self.stdout.write(f"{model.__name__}.{field}: {len(tasks)} images queued")
+
+        self.stdout.write(f"{queued} images queued, run process_images to generate them")
@@ -0,0 +1,59 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from account.authentication import CachedTokenAuthentication, get_token_cache_key
+
+
+class Command(BaseCommand):
+    help = "Compare authenticated request throughput of token authentication classes"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", help="Authenticate as this user (default: any user with a token)")
+        parser.add_argument("--requests", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        token = Token.objects.select_related("user")
+        if options["email"]:
+            token = token.filter(user__email=options["email"])
+        token = token.first()
+        if token is None:
+            raise CommandError("No token found, log in first")
+
+        cache.delete(get_token_cache_key(token.key))
+        factory = APIRequestFactory()
+        for authentication_class in (TokenAuthentication, CachedTokenAuthentication):
+            view = self.make_view(authentication_class)
+            with override_settings(ALLOWED_HOSTS=["*"]), CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                for _ in range(options["requests"]):
+                    request = factory.get("/", HTTP_AUTHORIZATION=f"Token {token.key}")
+                    response = view(request)
+                    if response.status_code != 200:
+                        raise CommandError(f"{authentication_class.__name__}: {response.status_code}")
+                elapsed = time.perf_counter() - start
+
+            self.stdout.write(
+                f"{authentication_class.__name__}: {options['requests'] / elapsed:.0f} req/s, "
+                f"{len(queries) / options['requests']:.2f} queries/request"
+            )
+
+    def make_view(self, authentication_class):
+        class View(APIView):
+            authentication_classes = [authentication_class]
+            permission_classes = [IsAuthenticated]
+
+            def get(self, request):
+                return Response({"id": request.user.pk})
+
+        return View.as_view()
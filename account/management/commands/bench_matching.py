@@ -0,0 +1,69 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from account.matching import SKILLS, Matcher
+from account.models import Recommendation
+from helper.scoring import MOTIVATION, ROLES
+
+
+class Command(BaseCommand):
+    help = "Benchmark the similarity matcher on synthetic profiles and students"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", type=int, default=100_000)
+        parser.add_argument("--students", type=int, default=1000)
+        parser.add_argument("--class-size", type=int, default=30)
+        parser.add_argument("--tokens", type=int, default=50, help="Distinct tokens per feature block")
+        parser.add_argument("-k", type=int, default=6)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options["seed"])
+        tokens = options["tokens"]
+        scopes = [f"scope {i}" for i in range(tokens)]
+        skills = [f"skill {i}" for i in range(tokens)] + list(ROLES.values())
+        qualities = [f"quality {i}" for i in range(tokens)] + list(MOTIVATION.values())
+
+        rows = [
+            (pk, {
+                "scope": rnd.sample(scopes, rnd.randint(1, 3)),
+                "skill": rnd.sample(skills, rnd.randint(1, 5)),
+                "quality": rnd.sample(qualities, rnd.randint(1, 5)),
+            })
+            for pk in range(1, options["profiles"] + 1)
+        ]
+        skill_scopes = {object: rnd.sample(scopes, 10) for object in SKILLS}
+
+        start = time.perf_counter()
+        matcher = Matcher(Recommendation.Kind.PROFESSIONAL, None, rows, skill_scopes)
+        self.stdout.write(
+            f"build: {time.perf_counter() - start:.2f}s, "
+            f"matrix {matcher.matrix.shape[0]}x{matcher.matrix.shape[1]}, {matcher.matrix.nbytes / 2 ** 20:.0f} MiB"
+        )
+
+        students = [
+            {
+                "skills": {object: rnd.randint(0, 20) for object in SKILLS},
+                "competencies": rnd.sample(skills + qualities, 3),
+                "role": {label: rnd.choice((52, 30, 7, 6, 5)) for label in ROLES.values()},
+                "motivation": {label: rnd.choice((52, 30, 7, 6, 5)) for label in MOTIVATION.values()},
+            }
+            for _ in range(options["students"])
+        ]
+        k = options["k"]
+
+        single = min(options["students"], 100)
+        start = time.perf_counter()
+        for student in students[:single]:
+            matcher.top_k(matcher.encode([student]), k)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"one at a time: {elapsed / single * 1000:.3f} ms/student")
+
+        size = options["class_size"]
+        start = time.perf_counter()
+        for offset in range(0, len(students), size):
+            matcher.top_k(matcher.encode(students[offset:offset + size]), k)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"classes of {size}: {elapsed / len(students) * 1000:.3f} ms/student")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from account import recommendations
+
+
+class Command(BaseCommand):
+    help = "Rebuild the professional and employer recommendation lists of every skill and region"
+
+    def handle(self, *args, **options):
+        count = recommendations.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"{count} recommendations built"))
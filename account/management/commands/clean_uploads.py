@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from account.uploads import clean_expired
+
+
+class Command(BaseCommand):
+    help = "Delete resumable uploads left unfinished for UPLOAD_EXPIRE seconds"
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{clean_expired()} unfinished uploads deleted")
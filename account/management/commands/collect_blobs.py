@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from account.blobs import GRACE_PERIOD, collect_blobs
+
+
+class Command(BaseCommand):
+    help = "Delete stored files no longer referenced by uploads or profiles"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--grace-period", type=int, default=GRACE_PERIOD, help="Keep blobs younger than this many seconds")
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be deleted")
+
+    def handle(self, *args, **options):
+        kept, deleted, freed = collect_blobs(options["grace_period"], options["dry_run"])
+        self.stdout.write(f"{deleted} blobs deleted ({freed / 1024 / 1024:.1f} MB), {kept} kept")
@@ -0,0 +1,106 @@
+import re
+from itertools import combinations
+
+from django.core.management.base import BaseCommand
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from account.models import Employer, Professional
+from account.views import EmployerViewset, ProfessionalViewset
+
+SEQ_SCAN_RE = re.compile(r"Seq Scan on (\w+)")
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN every filter combination of the catalogue endpoints and report sequential scans"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=None,
+            help="Maximum number of filters combined in one query (all by default)",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE instead of EXPLAIN",
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full plan of every query with a sequential scan",
+        )
+
+    def handle(self, *args, **options):
+        targets = (
+            (EmployerViewset, "/api/auth/employers/", self.employer_params()),
+            (ProfessionalViewset, "/api/auth/professionals/", self.professional_params()),
+        )
+
+        total = 0
+        flagged = 0
+        for viewset, path, params in targets:
+            depth = options["depth"] or len(params)
+            for size in range(0, depth + 1):
+                for names in combinations(params, size):
+                    query_params = {name: params[name] for name in names}
+                    plan = self.explain(viewset, path, query_params, options["analyze"])
+                    total += 1
+
+                    tables = sorted(set(SEQ_SCAN_RE.findall(plan)))
+                    if not tables:
+                        continue
+
+                    flagged += 1
+                    self.stdout.write(
+                        self.style.WARNING(f"{path} {query_params or '{}'}: seq scan on {', '.join(tables)}")
+                    )
+                    if options["verbose_plans"]:
+                        self.stdout.write(plan)
+
+        self.stdout.write(f"{flagged} of {total} filter combinations use sequential scans")
+
+    def explain(self, viewset, path, params, analyze):
+        request = APIRequestFactory().get(path, params)
+        view = viewset(action="list", request=Request(request), format_kwarg=None)
+        queryset = view.filter_queryset(view.get_queryset())
+        return queryset.explain(analyze=analyze)
+
+    def employer_params(self):
+        sample = Employer.objects.values(
+            "company_region", "company_professions", "company_scope",
+            "company_count_employees", "company_avg_wage",
+        ).first() or {}
+
+        return {
+            "video": "",
+            "training": "",
+            "pwd": "",
+            "adaptation": "",
+            "type": sample.get("company_count_employees") or "100",
+            "wage": sample.get("company_avg_wage") or 30000,
+            "scope": sample.get("company_scope") or "scope",
+            "region": ",".join(sample.get("company_region") or ["region"]),
+            "professions": ",".join(sample.get("company_professions") or ["profession"]),
+        }
+
+    def professional_params(self):
+        sample = Professional.objects.values(
+            "scope", "region", "timetable", "employment_type", "business_trips",
+            "wage", "soft_skils", "profession_hobbies", "favorite_school_subjects",
+        ).first() or {}
+
+        return {
+            "scope": ",".join(sample.get("scope") or ["scope"]),
+            "region": sample.get("region") or "region",
+            "timetable": sample.get("timetable") or "timetable",
+            "employment": sample.get("employment_type") or "employment",
+            "trips": sample.get("business_trips") or "trips",
+            "pwd": "",
+            "wage": sample.get("wage") or "wage",
+            "skils": ",".join(sample.get("soft_skils") or ["skill"]),
+            "hobbies": ",".join(sample.get("profession_hobbies") or ["hobby"]),
+            "school-subjects": ",".join(sample.get("favorite_school_subjects") or ["subject"]),
+        }
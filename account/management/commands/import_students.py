@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import Teacher
+from account.onboarding import BATCH_SIZE, read_students, register_students
+
+
+class Command(BaseCommand):
+    help = "Register students in bulk from a CSV or JSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file with a header line or JSON list of students")
+        parser.add_argument("--format", choices=("csv", "json"), default=None)
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--teacher-code", default=None, help="Link every student to this teacher")
+
+    def handle(self, *args, **options):
+        teacher = None
+        if options["teacher_code"]:
+            try:
+                teacher = Teacher.objects.get(code=options["teacher_code"])
+            except Teacher.DoesNotExist:
+                raise CommandError("Teacher with code %s not found" % options["teacher_code"])
+
+        with open(options["path"], encoding="utf-8-sig") as file:
+            rows = read_students(file, format=options["format"])
+
+        report = register_students(rows, teacher=teacher, batch_size=options["batch_size"])
+
+        for rejected in report["rejected"]:
+            self.stderr.write(f"Row {rejected['row']}: {rejected['errors']}")
+        self.stdout.write(
+            f"Created {report['created']} students, rejected {len(report['rejected'])} "
+            f"in {report['seconds']}s ({report['rows_per_second']} rows/s)"
+        )
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from account.images import BATCH_SIZE, MAX_ATTEMPTS, process_pending
+
+
+class Command(BaseCommand):
+    help = "Generate WebP derivatives of queued images in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Process queued images and exit")
+        parser.add_argument("--interval", type=float, default=5, help="Seconds to wait when the queue is empty")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+
+    def handle(self, *args, **options):
+        while True:
+            processed, failed = process_pending(options["batch_size"], options["max_attempts"])
+            if processed or failed:
+                self.stdout.write(f"Processed {processed}, failed {failed}")
+
+            if processed + failed < options["batch_size"]:
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
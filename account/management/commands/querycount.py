@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from account.testing import assert_constant_queries
+from account.views import EmployerViewset, ProfessionalViewset, NPOViewset
+
+
+class Command(BaseCommand):
+    help = "Check that catalogue list endpoints run a constant number of queries"
+
+    endpoints = (
+        (EmployerViewset, "/api/auth/employers/"),
+        (ProfessionalViewset, "/api/auth/professionals/"),
+        (NPOViewset, "/api/auth/non-profit/"),
+    )
+
+    def handle(self, *args, **options):
+        failed = False
+        for viewset, path in self.endpoints:
+            view = viewset.as_view({"get": "list"})
+            try:
+                count = assert_constant_queries(view, path)
+            except AssertionError as e:
+                failed = True
+                self.stderr.write(self.style.ERROR(str(e)))
+            else:
+                self.stdout.write(f"{path}: {count} queries")
+
+        if failed:
+            raise CommandError("Some list endpoints run per-row queries")
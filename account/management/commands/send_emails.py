@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from account.outbox import BATCH_SIZE, MAX_ATTEMPTS, send_pending
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox emails in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Send due emails and exit")
+        parser.add_argument("--interval", type=float, default=5, help="Seconds to wait when the queue is empty")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                sent, failed = send_pending(options["batch_size"], options["max_attempts"])
+            except Exception as e:
+                # Backend is unreachable, nothing was marked as attempted
+                self.stderr.write(f"Email backend error: {e}")
+                sent = failed = 0
+                if options["once"]:
+                    raise
+
+            if sent or failed:
+                self.stdout.write(f"Sent {sent}, failed {failed}")
+
+            if options["once"]:
+                if sent + failed < options["batch_size"]:
+                    break
+                continue
+
+            if sent + failed < options["batch_size"]:
+                time.sleep(options["interval"])
@@ -0,0 +1,265 @@
+import threading
+import uuid
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connection
+
+from helper.models import SkillScope, StudentSkill
+from helper.scoring import POINTS
+from .models import Employer, Professional, Recommendation
+
+VERSION_PREFIX = "matcher"
+
+# Weight of each feature block in the similarity, every block is a cosine
+BLOCKS = {
+    "scope": 1.0,
+    "skill": 0.5,
+    "quality": 0.5,
+}
+SKILLS = StudentSkill.Object.names
+TOP_K_BLOCK = 512
+BATCH_SIZE = 64
+
+
+def profile_rows(kind):
+    """
+    Yield ``(pk, {block: tokens})`` for every whitelisted profile of ``kind``.
+    """
+    if kind == Recommendation.Kind.PROFESSIONAL:
+        rows = (
+            Professional.objects.filter(whitelist=True)
+            .values_list("pk", "scope", "soft_skils", "profession_qualities")
+        )
+        for pk, scope, soft_skils, qualities in rows.iterator():
+            yield pk, {"scope": scope, "skill": soft_skils, "quality": qualities}
+    else:
+        rows = (
+            Employer.objects.filter(whitelist=True)
+            .values_list("pk", "company_scope", "soft_skils")
+        )
+        for pk, scope, soft_skils in rows.iterator():
+            yield pk, {"scope": [scope], "skill": soft_skils, "quality": []}
+
+
+def normalize(matrix, columns):
+    """
+    L2-normalize the ``columns`` slice of every row in place.
+    """
+    block = matrix[:, columns]
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    np.divide(block, norms, out=block, where=norms > 0)
+    matrix[:, columns] = block
+
+
+class Matcher:
+    """
+    Dense feature matrix of every whitelisted profile of one kind.
+
+    Columns are the one-hot ``scope``, ``skill`` (soft skills) and
+    ``quality`` tokens found among profiles. Each block is normalized, so
+    the product of a student vector with the matrix is the weighted sum
+    of per-block cosine similarities.
+    """
+
+    def __init__(self, kind, version, rows, scopes):
+        self.kind = kind
+        self.version = version
+
+        rows = list(rows)
+        self.vocabulary = {block: {} for block in BLOCKS}
+        for _, tokens in rows:
+            for block, values in tokens.items():
+                for value in values or ():
+                    self.vocabulary[block].setdefault(value, len(self.vocabulary[block]))
+
+        self.columns = {}
+        offset = 0
+        for block in BLOCKS:
+            size = len(self.vocabulary[block])
+            self.columns[block] = slice(offset, offset + size)
+            offset += size
+        self.width = offset
+
+        self.pks = np.array([pk for pk, _ in rows], dtype=np.int64)
+        self.matrix = np.zeros((len(rows), self.width), dtype=np.float32)
+        for i, (_, tokens) in enumerate(rows):
+            for block, values in tokens.items():
+                for value in values or ():
+                    self.matrix[i, self.column(block, value)] = 1
+        for block in BLOCKS:
+            normalize(self.matrix, self.columns[block])
+
+        # Skill object -> scope columns, to spread a student's skill
+        # points over the scopes of the matching professions
+        self.skill_scopes = np.zeros((len(SKILLS), self.width), dtype=np.float32)
+        for i, object in enumerate(SKILLS):
+            for value in scopes.get(object, ()):
+                if value in self.vocabulary["scope"]:
+                    self.skill_scopes[i, self.column("scope", value)] = 1
+
+    def column(self, block, value):
+        return self.columns[block].start + self.vocabulary[block][value]
+
+    def encode(self, students):
+        """
+        Encode students into a ``(len(students), width)`` matrix.
+
+        ``students`` are dicts with ``skills`` (skill object -> points),
+        ``competencies``, ``role`` and ``motivation``. Skill points select
+        scopes, competencies and role/motivation labels are matched
+        against the soft skill and quality tokens of profiles.
+        """
+        skills = np.zeros((len(students), len(SKILLS)), dtype=np.float32)
+        for i, student in enumerate(students):
+            for j, object in enumerate(SKILLS):
+                skills[i, j] = student["skills"].get(object, 0)
+        vectors = skills @ self.skill_scopes
+
+        top = max(POINTS.values())
+        for i, student in enumerate(students):
+            traits = {value: 1.0 for value in student.get("competencies") or ()}
+            for labels in (student.get("role") or {}, student.get("motivation") or {}):
+                for label, points in labels.items():
+                    traits[label] = max(traits.get(label, 0), points / top)
+            for value, weight in traits.items():
+                for block in ("skill", "quality"):
+                    if value in self.vocabulary[block]:
+                        vectors[i, self.column(block, value)] = weight
+
+        for block, weight in BLOCKS.items():
+            normalize(vectors, self.columns[block])
+            vectors[:, self.columns[block]] *= weight
+        return vectors
+
+    def top_k(self, vectors, k=6):
+        """
+        Return, for every row of ``vectors``, the ``k`` best ``(pk, score)``
+        pairs. All rows are scored with a single matrix product.
+        """
+        if not len(self.pks) or not len(vectors):
+            return [[] for _ in range(len(vectors))]
+
+        k = min(k, len(self.pks))
+        scores = vectors @ self.matrix.T
+        best = top_k_indices(scores, k)
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        return [
+            [(int(pk), round(float(score), 4)) for pk, score in zip(self.pks[row], row_scores)]
+            for row, row_scores in zip(best, best_scores)
+        ]
+
+
+def top_k_indices(scores, k):
+    """
+    Return the column indices of the ``k`` largest values of every row,
+    best first.
+
+    Rows are cut in blocks of ``TOP_K_BLOCK`` columns: the ``k`` largest
+    values always lie in the ``k`` blocks with the largest maximum, so only
+    those are partitioned instead of the whole row.
+    """
+    rows, width = scores.shape
+    full = width - width % TOP_K_BLOCK
+    maxes = scores[:, :full].reshape(rows, -1, TOP_K_BLOCK).max(axis=2)
+    if full < width:
+        maxes = np.hstack([maxes, scores[:, full:].max(axis=1, keepdims=True)])
+
+    count = min(k, maxes.shape[1])
+    blocks = np.argpartition(maxes, -count, axis=1)[:, -count:]
+    candidates = (blocks[:, :, None] * TOP_K_BLOCK + np.arange(TOP_K_BLOCK)).reshape(rows, -1)
+    values = np.take_along_axis(scores, np.minimum(candidates, width - 1), axis=1)
+    values[candidates >= width] = -np.inf
+
+    best = np.argpartition(values, -k, axis=1)[:, -k:]
+    order = np.argsort(-np.take_along_axis(values, best, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(candidates, np.take_along_axis(best, order, axis=1), axis=1)
+
+
+_matchers = {}
+# Kind -> thread building its next matcher
+_rebuilds = {}
+_rebuilds_lock = threading.Lock()
+
+
+def get_version_key(kind):
+    return f"{VERSION_PREFIX}:{kind}:version"
+
+
+def get_version(kind):
+    key = get_version_key(kind)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(*kinds):
+    cache.set_many({get_version_key(kind): uuid.uuid4().hex for kind in kinds}, None)
+
+
+def build_matcher(kind, version):
+    scopes = dict(SkillScope.objects.values_list("object", "scope"))
+    return Matcher(kind, version, profile_rows(kind), scopes)
+
+
+def rebuild(kind, version):
+    try:
+        _matchers[kind] = build_matcher(kind, version)
+    finally:
+        # Threads get their own connection, which Django never closes
+        connection.close()
+        with _rebuilds_lock:
+            del _rebuilds[kind]
+
+
+def get_matcher(kind):
+    """
+    Return the process-local matcher of ``kind``. Only the first one is
+    built in the request: once profiles or skill scopes change, the
+    outdated matcher is served while a background thread builds the new
+    one, one build per kind at a time.
+    """
+    version = get_version(kind)
+    matcher = _matchers.get(kind)
+    if matcher is None:
+        matcher = _matchers[kind] = build_matcher(kind, version)
+    elif matcher.version != version:
+        with _rebuilds_lock:
+            if kind not in _rebuilds:
+                thread = threading.Thread(target=rebuild, args=(kind, version), daemon=True)
+                _rebuilds[kind] = thread
+                thread.start()
+    return matcher
+
+
+def student_features(students):
+    """
+    Build ``Matcher.encode`` input for ``Student`` instances with
+    prefetched ``skills``.
+    """
+    return [
+        {
+            "skills": {skill.object: skill.points for skill in student.skills.all()},
+            "competencies": student.competencies,
+            "role": student.role,
+            "motivation": student.motivation,
+        }
+        for student in students
+    ]
+
+
+def match_students(students, kind, k=6):
+    """
+    Return ``{student pk: [(profile pk, score), ...]}`` for ``students``,
+    scored ``BATCH_SIZE`` at a time to bound the score matrix size.
+    """
+    matcher = get_matcher(kind)
+    matches = {}
+    for offset in range(0, len(students), BATCH_SIZE):
+        batch = students[offset:offset + BATCH_SIZE]
+        vectors = matcher.encode(student_features(batch))
+        for student, student_matches in zip(batch, matcher.top_k(vectors, k)):
+            matches[student.pk] = student_matches
+    return matches
@@ -0,0 +1,473 @@
+# Generated by Django 4.0.2 on 2026-10-18 10:15
+
+import account.managers
+from django.conf import settings
+import django.contrib.postgres.fields
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('email', models.EmailField(error_messages={'unique': 'Пользователь с таким email уже существует.'}, max_length=254, unique=True, validators=[django.core.validators.EmailValidator()], verbose_name='Email адрес')),
+                ('type', models.CharField(choices=[('PROFESSIONAL', 'Профессионал'), ('EMPLOYER', 'Организация'), ('NPO', 'НКО'), ('EMPAGENCY', 'Орган занятости'), ('COLLEGE', 'ССУЗ'), ('STUDENT', 'Учащийся'), ('TEACHER', 'Учитель')], max_length=50, verbose_name='Тип')),
+                ('first_name', models.CharField(max_length=100, verbose_name='Имя')),
+                ('last_name', models.CharField(max_length=100, verbose_name='Фамилия')),
+                ('middle_name', models.CharField(blank=True, max_length=100, verbose_name='Отчество')),
+                ('verification', models.CharField(choices=[('CREATED', 'Создан'), ('MODERATION', 'На модерации'), ('VERIFIED', 'Верифицирован')], default='CREATED', max_length=50, verbose_name='Уровень верификации')),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.Group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.Permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'Пользователь',
+                'verbose_name_plural': 'Пользователи',
+            },
+            managers=[
+                ('objects', account.managers.UserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Callback',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='Имя')),
+                ('email', models.EmailField(max_length=254, verbose_name='Почта')),
+                ('phone', models.CharField(max_length=255, verbose_name='Номер телефона')),
+                ('text', models.TextField(verbose_name='Текст')),
+            ],
+            options={
+                'verbose_name': 'Обратная связь',
+                'verbose_name_plural': 'Обратная связь',
+            },
+        ),
+        migrations.CreateModel(
+            name='College',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('post', models.CharField(max_length=255, verbose_name='Должность')),
+                ('phone', models.CharField(max_length=255, verbose_name='Мобильный телефон')),
+                ('work_phone', models.CharField(max_length=255, verbose_name='Рабочий телефон')),
+                ('authorization', models.FileField(upload_to='', verbose_name='Доверенность')),
+                ('college_TIN', models.CharField(max_length=10, verbose_name='ИНН колледжа')),
+                ('college_logo', models.ImageField(upload_to='', verbose_name='Логотип колледжа')),
+                ('college_name', models.CharField(max_length=255, verbose_name='Название колледжа')),
+                ('college_address', models.TextField(verbose_name='Адрес колледжа')),
+                ('college_name_abr', models.CharField(max_length=255, verbose_name='Сокращенное название колледжа')),
+                ('college_description', models.TextField(verbose_name='Описание колледжа')),
+                ('college_region', models.CharField(max_length=255, verbose_name='Регион колледжа')),
+                ('college_site', models.URLField(verbose_name='Сайт колледжа')),
+                ('college_video', models.URLField(verbose_name='Видео о колледже')),
+                ('college_social', django.contrib.postgres.fields.ArrayField(base_field=models.URLField(), blank=True, default=list, size=None, verbose_name='Социальные сети')),
+                ('college_employers', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Работадатели')),
+                ('educational_level', models.CharField(max_length=255, verbose_name='Уровень получаемого образования')),
+                ('educational_professions', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Профессии преподаваемые в колледже')),
+                ('educational_cost', models.PositiveSmallIntegerField(verbose_name='Стоимость обучения в год')),
+                ('has_state_funded_place', models.BooleanField(verbose_name='Есть ли бюджетные места?')),
+                ('count_state_funded_place', models.PositiveSmallIntegerField(blank=True, verbose_name='Количество бюджетных мест')),
+                ('has_events', models.BooleanField(verbose_name='Проводятся ли профориентационные мероприятия?')),
+                ('event_types', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Виды мероприятий')),
+                ('event_regularity', models.CharField(blank=True, max_length=255, verbose_name='Частота мероприятий')),
+                ('event_format', models.CharField(blank=True, max_length=255, verbose_name='Формат мероприятий')),
+                ('event_employer_name', models.CharField(blank=True, max_length=255, verbose_name='ФИО сотрудника по мероприятиям')),
+                ('event_employer_post', models.CharField(blank=True, max_length=255, verbose_name='Должность сотрудника по мероприятиям')),
+                ('event_employer_phone', models.CharField(blank=True, max_length=255, verbose_name='Номер телефона сотрудника по мепроприятиям')),
+                ('has_monitoring', models.BooleanField(verbose_name='Проводится ли мониторинг трудоустройства выпускников?')),
+                ('monitoring_url', models.URLField(blank=True, verbose_name='Ссылка на данные мониторинга')),
+                ('employment_percent', models.CharField(blank=True, max_length=255, verbose_name='Какой процент выпускников трудоустраивается в первый год?')),
+                ('has_special_conditions', models.BooleanField(verbose_name='Имеются ли особые условия поступления')),
+                ('special_conditions', models.TextField(blank=True, verbose_name='Особые условия поступления')),
+                ('has_dormitory', models.BooleanField(verbose_name='Есть ли общежитие?')),
+                ('famous_graduates', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Известные выпускники')),
+                ('has_foreign_practice', models.BooleanField(verbose_name='Наличие зарубежной практики')),
+                ('has_targeted_training', models.BooleanField(verbose_name='Возможно ли поступление по целевому обучению')),
+                ('has_pwd_education', models.BooleanField(verbose_name='Обучение студентов с ограниченными возможностями')),
+                ('extracurricular_activity', django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None, verbose_name='Внеучебная работа')),
+            ],
+            options={
+                'verbose_name': 'ССУЗ',
+                'verbose_name_plural': 'ССУЗы',
+            },
+        ),
+        migrations.CreateModel(
+            name='Employer',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('post', models.CharField(max_length=255, verbose_name='Должность')),
+                ('phone', models.CharField(max_length=255, verbose_name='Мобильный телефон')),
+                ('work_phone', models.CharField(max_length=255, verbose_name='Рабочий телефон')),
+                ('authorization', models.FileField(upload_to='employers', verbose_name='Доверенность')),
+                ('privacy_policy', models.BooleanField(default=False, verbose_name='Политика конфиденциальности')),
+                ('company_name', models.CharField(max_length=255, unique=True, verbose_name='Название организации')),
+                ('company_name_alt', models.CharField(max_length=255, unique=True, verbose_name='Альтернативное название организации')),
+                ('company_name_other', models.CharField(blank=True, max_length=255, verbose_name='Другое название')),
+                ('company_region', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Регион организации')),
+                ('company_admin_region', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Административный регион организации')),
+                ('company_scope', models.TextField(verbose_name='Сфера деятельности')),
+                ('company_logo', models.ImageField(upload_to='employers', verbose_name='Логотип организации')),
+                ('company_TIN', models.CharField(max_length=10, unique=True, verbose_name='ИНН организации')),
+                ('company_description', models.TextField(verbose_name='Об организации')),
+                ('company_description_other', models.TextField(blank=True, verbose_name='Другое описание')),
+                ('company_count_employees', models.CharField(max_length=255, verbose_name='Число сотрудников')),
+                ('company_avg_wage', models.PositiveIntegerField(verbose_name='Средняя заработная плата')),
+                ('company_site', models.URLField(verbose_name='Сайт организации')),
+                ('company_video', models.URLField(blank=True, null=True, verbose_name='Видео')),
+                ('company_social', django.contrib.postgres.fields.ArrayField(base_field=models.URLField(), size=None, verbose_name='Социальные сети')),
+                ('company_professions', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Востребованные профессии')),
+                ('company_tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Теги')),
+                ('has_pwd', models.BooleanField(verbose_name='Работают ли люди с ограниченными возможностями?')),
+                ('pwd_professions', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Профессии людей с ограниченными возможностями')),
+                ('excursions', models.CharField(max_length=255, verbose_name='Экскурсии')),
+                ('excursion_employee_id', models.CharField(max_length=255, verbose_name='Номер сотрудника по экскурсии')),
+                ('excursion_employee_full_name', models.CharField(max_length=255, verbose_name='ФИО сотрудника по экскурсии')),
+                ('excursion_employee_post', models.CharField(max_length=255, verbose_name='Должность сотруднка по экскурсии')),
+                ('has_corporate_training', models.BooleanField(default=False, verbose_name='Имеется корпоративное обучение?')),
+                ('corporate_training_name', models.CharField(blank=True, max_length=255, verbose_name='Название программы корпоративного обучения')),
+                ('professions_required', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='В будущем востребованные профессии')),
+                ('professions_not_required', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, size=None, verbose_name='В будущем не востребованные профессии')),
+                ('professional_competencies', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='В будущем востребованные профессиональные компетенции')),
+                ('has_adaptation', models.BooleanField(default=False, verbose_name='Имеется ли программа адаптации?')),
+                ('adaptation_stages', models.TextField(verbose_name='Стадии адаптации')),
+                ('support_programms', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Программа поддержки')),
+                ('support_conditions', models.TextField(blank=True, verbose_name='Условия поддержки')),
+                ('educational_institution', django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None, verbose_name='Какие обр. учереждения необходимо закончить?')),
+                ('educational_courses', django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None, verbose_name='Какие обр. направление необходимо закончить?')),
+                ('has_student_events', models.BooleanField(default=False, verbose_name='Проводит ли организация мероприятия для школьников/студентов?')),
+                ('soft_skils', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Надпрофессиональные компетенции')),
+                ('has_work_practice', models.BooleanField(default=False, verbose_name='Есть ли практика?')),
+                ('has_educational_products', models.BooleanField(default=False, verbose_name='Есть ли образовательные продукты?')),
+                ('has_targeted_training', models.BooleanField(default=False, verbose_name='Есть ли целевое обучение?')),
+                ('whitelist', models.BooleanField(default=False, verbose_name='Белый список')),
+            ],
+            options={
+                'verbose_name': 'Организация',
+                'verbose_name_plural': 'Организации',
+            },
+        ),
+        migrations.CreateModel(
+            name='EmploymentAgency',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('post', models.CharField(max_length=255, verbose_name='Должность')),
+                ('phone', models.CharField(max_length=255, verbose_name='Мобильный телефон')),
+                ('work_phone', models.CharField(max_length=255, verbose_name='Рабочий телефон')),
+                ('authorization', models.FileField(upload_to='', verbose_name='Доверенность')),
+                ('company_TIN', models.CharField(max_length=10, unique=True, verbose_name='ИНН организации')),
+                ('company_name', models.CharField(max_length=255, verbose_name='Название организации')),
+                ('company_name_abr', models.CharField(blank=True, max_length=255, verbose_name='Сокращенное название организации')),
+                ('company_region', models.CharField(max_length=255, verbose_name='Регион организации')),
+                ('company_address', models.TextField(verbose_name='Адрес организации')),
+                ('company_site', models.URLField(verbose_name='Сайт организации')),
+            ],
+            options={
+                'verbose_name': 'Орган занятости',
+                'verbose_name_plural': 'Органы занятости',
+            },
+        ),
+        migrations.CreateModel(
+            name='NPO',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('post', models.CharField(max_length=255, verbose_name='Должность')),
+                ('phone', models.CharField(max_length=255, verbose_name='Мобильный телефон')),
+                ('work_phone', models.CharField(max_length=255, verbose_name='Рабочий телефон')),
+                ('authorization', models.FileField(upload_to='', verbose_name='Доверенность')),
+                ('privacy_policy', models.BooleanField(default=False, verbose_name='Политика конфиденциальности')),
+                ('company_name', models.CharField(max_length=255, unique=True, verbose_name='Название организации')),
+                ('company_region', models.CharField(max_length=255, verbose_name='Регион организации')),
+                ('company_TIN', models.CharField(max_length=10, unique=True, verbose_name='ИНН организации')),
+                ('company_address', models.TextField(verbose_name='Адрес организации')),
+                ('company_logo', models.ImageField(upload_to='', verbose_name='Логотип организации')),
+                ('company_director', models.CharField(max_length=255, verbose_name='ФИО руководителя')),
+                ('company_count_employees', models.CharField(max_length=255, verbose_name='Число сотрудников')),
+                ('company_avg_wage', models.PositiveIntegerField(verbose_name='Средняя заработная плата')),
+                ('company_site', models.URLField(verbose_name='Сайт организации')),
+                ('company_video', models.URLField(blank=True, null=True, verbose_name='Видео')),
+                ('company_social', django.contrib.postgres.fields.ArrayField(base_field=models.URLField(), size=None, verbose_name='Социальные сети')),
+                ('company_professions', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Востребованные профессии')),
+            ],
+            options={
+                'verbose_name': 'НКО',
+                'verbose_name_plural': 'НКО',
+            },
+        ),
+        migrations.CreateModel(
+            name='Professional',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('region', models.CharField(max_length=255, verbose_name='Регион')),
+                ('locality', models.CharField(max_length=255, verbose_name='Населенный пункт')),
+                ('photo', models.ImageField(upload_to='professionals', verbose_name='Фото')),
+                ('phone', models.CharField(max_length=255, verbose_name='Мобильный телефон')),
+                ('work_phone', models.CharField(max_length=255, verbose_name='Рабочий телефон')),
+                ('birth_date', models.DateField(verbose_name='Дата рождения')),
+                ('wage', models.CharField(max_length=255, verbose_name='Уровень заработной платы')),
+                ('jobs_count', models.IntegerField(verbose_name='Количество мест работы')),
+                ('speciality', models.CharField(max_length=255, verbose_name='Специальность по диплому')),
+                ('education', models.CharField(max_length=255, verbose_name='Образование')),
+                ('work_on_speciality', models.BooleanField(verbose_name='Работа по специальности')),
+                ('work_on_speciality_tips', models.TextField(verbose_name='Почему стоит работать по специальности')),
+                ('graduation_exams', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Экзаменационные предметы')),
+                ('films', models.TextField(verbose_name='Фильмы')),
+                ('books', models.TextField(verbose_name='Книги')),
+                ('profession_hobbies', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=100), size=None, verbose_name='Увлечения для профессии')),
+                ('profession_qualities', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=100), size=None, verbose_name='Качества необходимые для профессии')),
+                ('profession_technology', models.TextField(verbose_name='Техника использующаяся в профессии')),
+                ('educational_institution', models.CharField(max_length=255, verbose_name='Образовательное учреждение')),
+                ('required_professions_opinion', models.TextField(blank=True, verbose_name='Мнение о востребованных профессиях')),
+                ('professional_competencies', models.TextField(verbose_name='Какие профессиональные компетенции потребуется в будущем?')),
+                ('not_required_professions_opinion', models.TextField(verbose_name='Какие профессии не будут востребованы в будущем?')),
+                ('soft_skils', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Надпрофессиональные компетенции')),
+                ('is_ready_to_mentor', models.BooleanField(verbose_name='Готовность быть наставником')),
+                ('is_ready_to_excursion', models.BooleanField(verbose_name='Готовность к проведению экскурсии')),
+                ('is_ready_to_tell_about', models.BooleanField(verbose_name='Готовность рассказать о профессии')),
+                ('favorite_school_subjects', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Любимые школьные предметы')),
+                ('scope', django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None, verbose_name='Сфера деятельности')),
+                ('seniority', models.CharField(max_length=100, verbose_name='Стаж работы')),
+                ('timetable', models.CharField(max_length=255, verbose_name='График работы')),
+                ('profession_name', models.CharField(max_length=255, verbose_name='Название профессии')),
+                ('profession_name_other', models.CharField(blank=True, max_length=255, verbose_name='Другое название профессии')),
+                ('profession_definition', models.TextField(verbose_name='Определение профессии')),
+                ('profession_definition_other', models.TextField(blank=True, verbose_name='Другое определение профессии')),
+                ('employment_type', models.CharField(max_length=100, verbose_name='Тип занятости')),
+                ('business_trips', models.TextField(verbose_name='Командировки')),
+                ('time_of_work', models.CharField(max_length=255, verbose_name='Количество лет работы в организации')),
+                ('workplace_environment', models.TextField(verbose_name='Предметы окружения на работе')),
+                ('workplace_video', models.URLField(blank=True, verbose_name='Видео рабочего места')),
+                ('workday_description', models.TextField(verbose_name='Описание рабочего дня')),
+                ('workday_start', models.CharField(max_length=100, verbose_name='Начало рабочего дня')),
+                ('workday_end', models.CharField(max_length=100, verbose_name='Конец рабочего дня')),
+                ('work_difficulties', models.TextField(verbose_name='Трудности на работе')),
+                ('work_myths', models.TextField(verbose_name='Мифы и стереотипы о работе')),
+                ('how_find_work', models.TextField(verbose_name='Как нашел эту работу?')),
+                ('company_name', models.CharField(max_length=255, verbose_name='Название организации')),
+                ('company_TIN', models.CharField(max_length=10, verbose_name='ИНН организации')),
+                ('has_pwd', models.BooleanField(verbose_name='Работают ли люди с ограниченными возможностями?')),
+                ('has_corporate_training', models.BooleanField(verbose_name='Имеется корпоративное обучение?')),
+                ('tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Теги')),
+                ('whitelist', models.BooleanField(default=False, verbose_name='Белый список')),
+            ],
+            options={
+                'verbose_name': 'Профессионал',
+                'verbose_name_plural': 'Профессионалы',
+            },
+        ),
+        migrations.CreateModel(
+            name='Student',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('photo', models.ImageField(blank=True, upload_to='', verbose_name='Фото')),
+                ('region', models.CharField(max_length=255, verbose_name='Регион')),
+                ('locality', models.CharField(max_length=255, verbose_name='Населенный пункт')),
+                ('phone', models.CharField(max_length=255, verbose_name='Мобильный телефон')),
+                ('school', models.CharField(max_length=255, verbose_name='Школа')),
+                ('school_class', models.CharField(max_length=5, verbose_name='Класс')),
+                ('birth_date', models.DateField(verbose_name='Дата рождения')),
+                ('coins', models.PositiveIntegerField(default=0, verbose_name='Монеты')),
+                ('achievements', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=75), blank=True, default=list, size=None)),
+                ('role', models.JSONField(blank=True, default=dict, verbose_name='Роль в команде')),
+                ('motivation', models.JSONField(blank=True, default=dict, verbose_name='Тип мотивации')),
+                ('competencies', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None)),
+                ('entrepreneurship', models.PositiveIntegerField(default=0, verbose_name='Предпринимательство')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='Время окончания прохождения')),
+                ('rate', models.PositiveIntegerField(default=0, validators=[django.core.validators.MaxValueValidator(5)], verbose_name='Оценка')),
+            ],
+            options={
+                'verbose_name': 'Учащийся',
+                'verbose_name_plural': 'Учащиеся',
+            },
+        ),
+        migrations.CreateModel(
+            name='Teacher',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('post', models.CharField(max_length=255, verbose_name='Должность')),
+                ('region', models.CharField(max_length=255, verbose_name='Регион')),
+                ('locality', models.CharField(max_length=255, verbose_name='Населенный пункт')),
+                ('phone', models.CharField(max_length=255, verbose_name='Номер телефона')),
+                ('count_members', models.IntegerField(verbose_name='Количество участников')),
+                ('school_name', models.TextField(verbose_name='Название образовательной организации')),
+                ('code', models.CharField(blank=True, max_length=6, unique=True, verbose_name='Код')),
+            ],
+            options={
+                'verbose_name': 'Учитель',
+                'verbose_name_plural': 'Учителя',
+            },
+        ),
+        migrations.CreateModel(
+            name='Upload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(upload_to='professionals', verbose_name='Файл')),
+                ('type', models.CharField(max_length=70, verbose_name='Тип загрузки')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='uploads', to=settings.AUTH_USER_MODEL, verbose_name='Пользователь')),
+            ],
+            options={
+                'verbose_name': 'Загрузка',
+                'verbose_name_plural': 'Загрузки',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserCollege',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'ССУЗ',
+                'verbose_name_plural': 'ССУЗы',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+        ),
+        migrations.CreateModel(
+            name='UserEmployer',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Организация',
+                'verbose_name_plural': 'Организации',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+        ),
+        migrations.CreateModel(
+            name='UserEmploymentAgency',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Орган занятости',
+                'verbose_name_plural': 'Органы занятости',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+        ),
+        migrations.CreateModel(
+            name='UserNPO',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'НКО',
+                'verbose_name_plural': 'НКО',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+        ),
+        migrations.CreateModel(
+            name='UserProfessional',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Профессионал',
+                'verbose_name_plural': 'Профессионалы',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+        ),
+        migrations.CreateModel(
+            name='UserStudent',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Учащийся',
+                'verbose_name_plural': 'Учащиеся',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+        ),
+        migrations.CreateModel(
+            name='UserTeacher',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Учитель',
+                'verbose_name_plural': 'Учителя',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+        ),
+        migrations.CreateModel(
+            name='TeacherStudent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.student', verbose_name='Ученик')),
+                ('teacher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.teacher', verbose_name='Учитель')),
+            ],
+            options={
+                'verbose_name': 'Ученик',
+                'verbose_name_plural': 'Ученики',
+                'unique_together': {('teacher', 'student')},
+            },
+        ),
+        migrations.AddField(
+            model_name='teacher',
+            name='students',
+            field=models.ManyToManyField(through='account.TeacherStudent', to='account.Student', verbose_name='Ученики'),
+        ),
+        migrations.CreateModel(
+            name='StudentProfessional',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('professional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.professional', verbose_name='Профессионал')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.student', verbose_name='Школьник')),
+            ],
+            options={
+                'verbose_name': 'Профессия',
+                'verbose_name_plural': 'Профессии',
+                'unique_together': {('student', 'professional')},
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentEmployer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('employer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.employer', verbose_name='Организация')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.student', verbose_name='Школьник')),
+            ],
+            options={
+                'verbose_name': 'Организация',
+                'verbose_name_plural': 'Организации',
+                'unique_together': {('student', 'employer')},
+            },
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='employers',
+            field=models.ManyToManyField(through='account.StudentEmployer', to='account.Employer'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='professionals',
+            field=models.ManyToManyField(through='account.StudentProfessional', to='account.Professional'),
+        ),
+    ]
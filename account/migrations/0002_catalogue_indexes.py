@@ -0,0 +1,62 @@
+# Generated by Django 4.0.2 on 2026-10-18 10:15
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['company_region'], name='employer_region_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='employer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['company_professions'], name='employer_professions_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='employer',
+            index=models.Index(fields=['company_scope'], name='employer_scope_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employer',
+            index=models.Index(fields=['company_avg_wage'], name='employer_avg_wage_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employer',
+            index=models.Index(condition=models.Q(('whitelist', True)), fields=['company_scope'], name='employer_whitelist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['scope'], name='professional_scope_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['soft_skils'], name='professional_soft_skils_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['profession_hobbies'], name='professional_hobbies_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['favorite_school_subjects'], name='professional_subjects_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=models.Index(fields=['region'], name='professional_region_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=models.Index(condition=models.Q(('whitelist', True)), fields=['user'], name='professional_whitelist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('verification', 'VERIFIED')), fields=['id'], name='user_verified_idx'),
+        ),
+    ]
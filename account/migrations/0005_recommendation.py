@@ -0,0 +1,38 @@
+# Generated by Django 4.0.2 on 2026-10-18 10:25
+
+from django.conf import settings
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Recommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('PROFESSIONAL', 'Профессионал'), ('EMPLOYER', 'Организация')], max_length=50, verbose_name='Тип')),
+                ('object', models.CharField(choices=[('SOCIAL', 'Работа с людьми'), ('RESEARCH', 'Исследовательская деятельность'), ('PRACTIC', 'Практическая деятельность'), ('CREATIVE', 'Творческая деятельность'), ('EXTREMAL', 'Экстремальная деятельность'), ('INFORMATION', 'Работа с информацией')], max_length=255, verbose_name='Объект')),
+                ('region', models.CharField(blank=True, max_length=255, verbose_name='Регион')),
+                ('rank', models.PositiveIntegerField(verbose_name='Место')),
+                ('score', models.PositiveIntegerField(verbose_name='Баллы')),
+                ('reasons', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None, verbose_name='Причины')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to=settings.AUTH_USER_MODEL, verbose_name='Пользователь')),
+            ],
+            options={
+                'verbose_name': 'Рекомендация',
+                'verbose_name_plural': 'Рекомендации',
+                'ordering': ('kind', 'object', 'region', 'rank'),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['kind', 'object', 'region', 'rank'], name='recommendation_lookup_idx'),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# array_to_string() is only stable, generated columns need an immutable function
+ARRAY_TO_TEXT = """
+CREATE FUNCTION search_array_to_text(varchar[]) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$
+"""
+
+
+def search_vector(table, weighted):
+    """
+    Add a stored ``search_vector`` column of ``(expression, weight)`` pairs
+    with its GIN index.
+    """
+    vector = " || ".join(
+        f"setweight(to_tsvector('russian', {expression}), '{weight}')"
+        for expression, weight in weighted
+    )
+    return migrations.RunSQL(
+        sql=[
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED",
+            f"CREATE INDEX {table}_search_gin ON {table} USING gin (search_vector)",
+        ],
+        reverse_sql=f"ALTER TABLE {table} DROP COLUMN search_vector",
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_recommendation'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(ARRAY_TO_TEXT, "DROP FUNCTION search_array_to_text(varchar[])"),
+        migrations.AddIndex(
+            model_name='college',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['college_name'], name='college_name_trgm', opclasses=('gin_trgm_ops',)),
+        ),
+        migrations.AddIndex(
+            model_name='employer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['company_name'], name='employer_name_trgm', opclasses=('gin_trgm_ops',)),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['profession_name'], name='professional_name_trgm', opclasses=('gin_trgm_ops',)),
+        ),
+        search_vector("account_employer", (
+            ("coalesce(company_name, '')", "A"),
+            ("search_array_to_text(company_tags)", "B"),
+            ("coalesce(company_description, '')", "C"),
+        )),
+        search_vector("account_professional", (
+            ("coalesce(profession_name, '')", "A"),
+            ("search_array_to_text(tags)", "B"),
+            ("coalesce(profession_definition, '')", "C"),
+        )),
+        search_vector("account_college", (
+            ("coalesce(college_name, '')", "A"),
+            ("search_array_to_text(educational_professions)", "B"),
+        )),
+    ]
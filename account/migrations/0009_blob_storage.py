@@ -0,0 +1,54 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:19
+
+import account.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0008_upload_session'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='college',
+            name='authorization',
+            field=models.FileField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Доверенность'),
+        ),
+        migrations.AlterField(
+            model_name='college',
+            name='college_logo',
+            field=models.ImageField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Логотип колледжа'),
+        ),
+        migrations.AlterField(
+            model_name='employer',
+            name='authorization',
+            field=models.FileField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Доверенность'),
+        ),
+        migrations.AlterField(
+            model_name='employer',
+            name='company_logo',
+            field=models.ImageField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Логотип организации'),
+        ),
+        migrations.AlterField(
+            model_name='employmentagency',
+            name='authorization',
+            field=models.FileField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Доверенность'),
+        ),
+        migrations.AlterField(
+            model_name='npo',
+            name='authorization',
+            field=models.FileField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Доверенность'),
+        ),
+        migrations.AlterField(
+            model_name='npo',
+            name='company_logo',
+            field=models.ImageField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Логотип организации'),
+        ),
+        migrations.AlterField(
+            model_name='upload',
+            name='file',
+            field=models.FileField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Файл'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:21
+
+import account.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0009_blob_storage'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='professional',
+            name='photo',
+            field=models.ImageField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Фото'),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='photo',
+            field=models.ImageField(blank=True, storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Фото'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0010_media_blob_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentDashboard',
+            fields=[
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard', serialize=False, to='account.student')),
+                ('coins', models.PositiveIntegerField(default=0, verbose_name='Монеты')),
+                ('missions', models.JSONField(default=list, verbose_name='Миссии')),
+                ('skills', models.JSONField(default=list, verbose_name='Суперспособности')),
+                ('role', models.JSONField(default=dict, verbose_name='Роль в команде')),
+                ('motivation', models.JSONField(default=dict, verbose_name='Тип мотивации')),
+                ('employers', models.JSONField(default=list, verbose_name='Организации')),
+                ('professionals', models.JSONField(default=list, verbose_name='Профессии')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+            ],
+            options={
+                'verbose_name': 'Панель учащегося',
+                'verbose_name_plural': 'Панели учащихся',
+            },
+        ),
+    ]
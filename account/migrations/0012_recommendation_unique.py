@@ -0,0 +1,27 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0011_student_dashboard'),
+    ]
+
+    operations = [
+        # Lists duplicated by concurrent refreshes keep their first rows
+        migrations.RunSQL(
+            """
+            DELETE FROM account_recommendation r
+            USING account_recommendation d
+            WHERE r.kind = d.kind AND r.object = d.object AND r.region = d.region
+              AND r.user_id = d.user_id AND r.id > d.id
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='recommendation',
+            constraint=models.UniqueConstraint(fields=('kind', 'object', 'region', 'user'), name='recommendation_user_unique'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+class EagerLoadingMixin:
+    """
+    Serializer mixin declaring the relations and columns the serializer reads,
+    so views can load them together with the main queryset.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    only_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        if cls.only_fields:
+            queryset = queryset.only(*cls.only_fields)
+        return queryset
+
+
+class EagerLoadingViewMixin:
+    """
+    Viewset mixin applying the projections declared by the serializer
+    of the current read action to the queryset. Writes keep full rows.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        serializer_class = self.serializer_class
+        if not hasattr(serializer_class, "setup_eager_loading"):
+            return queryset
+        # Detail actions may serialize another model than the viewset one
+        if serializer_class.Meta.model is not queryset.model:
+            return queryset
+        return serializer_class.setup_eager_loading(queryset)
@@ -1,11 +1,16 @@
+import uuid
+
 from django.db import models
 from django.core import validators
+from django.utils import timezone
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 
 from .managers import UserManager
+from .storage import blob_storage
+from helper.catalogue import get_catalogue
 from helper.models import (
-    Mission,
     StudentMission,
     StudentSkill,
 )
@@ -46,6 +51,7 @@ class User(AbstractUser):
         choices=Verifiaction.choices,
         default=Verifiaction.CREATED,
     )
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ()
@@ -55,6 +61,13 @@ class User(AbstractUser):
     class Meta:
         verbose_name = "Пользователь"
         verbose_name_plural = "Пользователи"
+        indexes = (
+            models.Index(
+                fields=("id",),
+                name="user_verified_idx",
+                condition=models.Q(verification="VERIFIED"),
+            ),
+        )
 
     def save(self, *args, **kwargs):
         if not self.pk and self.type == self.Types.TEACHER:
@@ -73,7 +86,7 @@ class Employer(models.Model):
     post = models.CharField(verbose_name="Должность", max_length=255)
     phone = models.CharField(verbose_name="Мобильный телефон", max_length=255)
     work_phone = models.CharField(verbose_name="Рабочий телефон", max_length=255)
-    authorization = models.FileField(verbose_name="Доверенность", upload_to="employers")
+    authorization = models.FileField(verbose_name="Доверенность", storage=blob_storage)
     privacy_policy = models.BooleanField(verbose_name="Политика конфиденциальности", default=False)
 
     # Company attributes
@@ -83,7 +96,7 @@ class Employer(models.Model):
     company_region = ArrayField(models.CharField(max_length=255), verbose_name="Регион организации")
     company_admin_region = ArrayField(models.CharField(max_length=255), blank=True, default=list, verbose_name="Административный регион организации")
     company_scope = models.TextField(verbose_name="Сфера деятельности")
-    company_logo = models.ImageField(verbose_name="Логотип организации", upload_to="employers")
+    company_logo = models.ImageField(verbose_name="Логотип организации", storage=blob_storage)
     company_TIN = models.CharField(verbose_name="ИНН организации", max_length=10, unique=True)
     company_description = models.TextField(verbose_name="Об организации")
     company_description_other = models.TextField(verbose_name="Другое описание", blank=True)
@@ -132,12 +145,25 @@ class Employer(models.Model):
     has_targeted_training = models.BooleanField(verbose_name="Есть ли целевое обучение?", default=False)
 
     whitelist = models.BooleanField(verbose_name="Белый список", default=False)
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
 
     objects = EmployerManager
 
     class Meta:
         verbose_name = "Организация"
         verbose_name_plural = "Организации"
+        indexes = (
+            GinIndex(fields=("company_region",), name="employer_region_gin"),
+            GinIndex(fields=("company_professions",), name="employer_professions_gin"),
+            models.Index(fields=("company_scope",), name="employer_scope_idx"),
+            models.Index(fields=("company_avg_wage",), name="employer_avg_wage_idx"),
+            GinIndex(fields=("company_name",), name="employer_name_trgm", opclasses=("gin_trgm_ops",)),
+            models.Index(
+                fields=("company_scope",),
+                name="employer_whitelist_idx",
+                condition=models.Q(whitelist=True),
+            ),
+        )
 
     def save(self, *args, **kwargs) -> None:
         if self.user.verification == User.Verifiaction.CREATED:
@@ -156,7 +182,7 @@ class Professional(models.Model):
 
     region = models.CharField(verbose_name="Регион", max_length=255)
     locality = models.CharField(verbose_name="Населенный пункт", max_length=255)
-    photo = models.ImageField(verbose_name="Фото", upload_to="professionals")
+    photo = models.ImageField(verbose_name="Фото", storage=blob_storage)
     phone = models.CharField(verbose_name="Мобильный телефон", max_length=255)
     work_phone = models.CharField(verbose_name="Рабочий телефон", max_length=255)
     birth_date = models.DateField(verbose_name="Дата рождения")
@@ -212,12 +238,26 @@ class Professional(models.Model):
     tags = ArrayField(models.CharField(max_length=255), verbose_name="Теги", blank=True, default=list)
 
     whitelist = models.BooleanField(verbose_name="Белый список", default=False)
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
 
     objects = ProfessionalManager
 
     class Meta:
         verbose_name = "Профессионал"
         verbose_name_plural = "Профессионалы"
+        indexes = (
+            GinIndex(fields=("scope",), name="professional_scope_gin"),
+            GinIndex(fields=("soft_skils",), name="professional_soft_skils_gin"),
+            GinIndex(fields=("profession_hobbies",), name="professional_hobbies_gin"),
+            GinIndex(fields=("favorite_school_subjects",), name="professional_subjects_gin"),
+            models.Index(fields=("region",), name="professional_region_idx"),
+            GinIndex(fields=("profession_name",), name="professional_name_trgm", opclasses=("gin_trgm_ops",)),
+            models.Index(
+                fields=("user",),
+                name="professional_whitelist_idx",
+                condition=models.Q(whitelist=True),
+            ),
+        )
 
     def save(self, *args, **kwargs) -> None:
         if self.user.verification == User.Verifiaction.CREATED:
@@ -237,7 +277,7 @@ class NPO(models.Model):
     post = models.CharField(verbose_name="Должность", max_length=255)
     phone = models.CharField(verbose_name="Мобильный телефон", max_length=255)
     work_phone = models.CharField(verbose_name="Рабочий телефон", max_length=255)
-    authorization = models.FileField(verbose_name="Доверенность")
+    authorization = models.FileField(verbose_name="Доверенность", storage=blob_storage)
     privacy_policy = models.BooleanField(verbose_name="Политика конфиденциальности", default=False)
 
     # Company attributes
@@ -245,7 +285,7 @@ class NPO(models.Model):
     company_region = models.CharField(verbose_name="Регион организации", max_length=255)
     company_TIN = models.CharField(verbose_name="ИНН организации", max_length=10, unique=True)
     company_address = models.TextField(verbose_name="Адрес организации")
-    company_logo = models.ImageField(verbose_name="Логотип организации")
+    company_logo = models.ImageField(verbose_name="Логотип организации", storage=blob_storage)
     company_director = models.CharField(verbose_name="ФИО руководителя", max_length=255)
     company_count_employees = models.CharField(verbose_name="Число сотрудников", max_length=255)
     company_avg_wage = models.PositiveIntegerField(verbose_name="Средняя заработная плата")
@@ -253,6 +293,7 @@ class NPO(models.Model):
     company_video = models.URLField(verbose_name="Видео", blank=True, null=True)
     company_social = ArrayField(models.URLField(), verbose_name="Социальные сети")
     company_professions = ArrayField(models.CharField(max_length=255), verbose_name="Востребованные профессии")
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
 
     objects = NPOManager
 
@@ -278,11 +319,11 @@ class College(models.Model):
     post = models.CharField(verbose_name="Должность", max_length=255)
     phone = models.CharField(verbose_name="Мобильный телефон", max_length=255)
     work_phone = models.CharField(verbose_name="Рабочий телефон", max_length=255)
-    authorization = models.FileField(verbose_name="Доверенность")
+    authorization = models.FileField(verbose_name="Доверенность", storage=blob_storage)
 
     # College attributes
     college_TIN = models.CharField(verbose_name="ИНН колледжа", max_length=10)
-    college_logo = models.ImageField(verbose_name="Логотип колледжа")
+    college_logo = models.ImageField(verbose_name="Логотип колледжа", storage=blob_storage)
     college_name = models.CharField(verbose_name="Название колледжа", max_length=255)
     college_address = models.TextField(verbose_name="Адрес колледжа")
     college_name_abr = models.CharField(verbose_name="Сокращенное название колледжа", max_length=255)
@@ -326,12 +367,16 @@ class College(models.Model):
     has_targeted_training = models.BooleanField(verbose_name="Возможно ли поступление по целевому обучению")
     has_pwd_education = models.BooleanField(verbose_name="Обучение студентов с ограниченными возможностями")
     extracurricular_activity = ArrayField(models.TextField(), verbose_name="Внеучебная работа")
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
 
     objects = CollegeManager()
 
     class Meta:
         verbose_name = "ССУЗ"
         verbose_name_plural = "ССУЗы"
+        indexes = (
+            GinIndex(fields=("college_name",), name="college_name_trgm", opclasses=("gin_trgm_ops",)),
+        )
 
     def save(self, *args, **kwargs) -> None:
         if self.user.verification == User.Verifiaction.CREATED:
@@ -351,7 +396,7 @@ class EmploymentAgency(models.Model):
     post = models.CharField(verbose_name="Должность", max_length=255)
     phone = models.CharField(verbose_name="Мобильный телефон", max_length=255)
     work_phone = models.CharField(verbose_name="Рабочий телефон", max_length=255)
-    authorization = models.FileField(verbose_name="Доверенность")
+    authorization = models.FileField(verbose_name="Доверенность", storage=blob_storage)
 
     company_TIN = models.CharField(verbose_name="ИНН организации", max_length=10, unique=True)
     company_name = models.CharField(verbose_name="Название организации", max_length=255)
@@ -380,7 +425,7 @@ class StudentManager(BaseUserManager):
 
 class Student(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True)
-    photo = models.ImageField(verbose_name="Фото", blank=True)
+    photo = models.ImageField(verbose_name="Фото", blank=True, storage=blob_storage)
     region = models.CharField(verbose_name="Регион", max_length=255)
     locality = models.CharField(verbose_name="Населенный пункт", max_length=255)
     phone = models.CharField(verbose_name="Мобильный телефон", max_length=255)
@@ -412,6 +457,8 @@ class Student(models.Model):
         verbose_name_plural = "Учащиеся"
 
     def save(self, *args, **kwargs):
+        from .dashboard import refresh_dashboards
+
         super().save(*args, **kwargs)
 
         if self.user.verification == User.Verifiaction.CREATED:
@@ -419,7 +466,7 @@ class Student(models.Model):
             self.user.save()
 
             missions_bulk = []
-            for object in Mission.objects.all():
+            for object in get_catalogue().missions:
                 missions_bulk.append(StudentMission(student=self, mission=object))
 
             skills_bulk = []
@@ -429,6 +476,8 @@ class Student(models.Model):
             StudentMission.objects.bulk_create(missions_bulk)
             StudentSkill.objects.bulk_create(skills_bulk)
 
+        refresh_dashboards(self.pk)
+
     def __str__(self) -> str:
         return f"{self.user.last_name} {self.user.first_name}"
 
@@ -453,6 +502,26 @@ class StudentProfessional(models.Model):
         unique_together = ("student", "professional")
 
 
+class StudentDashboard(models.Model):
+    """
+    Denormalized dashboard of a student, rebuilt by ``refresh_dashboards``
+    in the transaction of every gamification write.
+    """
+    student = models.OneToOneField(Student, on_delete=models.CASCADE, primary_key=True, related_name="dashboard")
+    coins = models.PositiveIntegerField(verbose_name="Монеты", default=0)
+    missions = models.JSONField(verbose_name="Миссии", default=list)
+    skills = models.JSONField(verbose_name="Суперспособности", default=list)
+    role = models.JSONField(verbose_name="Роль в команде", default=dict)
+    motivation = models.JSONField(verbose_name="Тип мотивации", default=dict)
+    employers = models.JSONField(verbose_name="Организации", default=list)
+    professionals = models.JSONField(verbose_name="Профессии", default=list)
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
+
+    class Meta:
+        verbose_name = "Панель учащегося"
+        verbose_name_plural = "Панели учащихся"
+
+
 class Teacher(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True)
 
@@ -482,7 +551,7 @@ class TeacherStudent(models.Model):
 
 class Upload(models.Model):
     user = models.ForeignKey(User, verbose_name="Пользователь", related_name="uploads", on_delete=models.CASCADE)
-    file = models.FileField(verbose_name="Файл", upload_to="professionals")
+    file = models.FileField(verbose_name="Файл", storage=blob_storage)
     type = models.CharField(verbose_name="Тип загрузки", max_length=70)
 
     class Meta:
@@ -490,6 +559,26 @@ class Upload(models.Model):
         verbose_name_plural = "Загрузки"
 
 
+class UploadSession(models.Model):
+    class Types(models.TextChoices):
+        WORKPLACE = "workplace", "Фото рабочего места"
+        IMAGES = "images", "Фото колледжа"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, verbose_name="Пользователь", related_name="upload_sessions", on_delete=models.CASCADE)
+    type = models.CharField(verbose_name="Тип загрузки", max_length=70, choices=Types.choices)
+    filename = models.CharField(verbose_name="Имя файла", max_length=255)
+    size = models.PositiveBigIntegerField(verbose_name="Размер")
+    offset = models.PositiveBigIntegerField(verbose_name="Получено байт", default=0)
+    upload = models.OneToOneField(Upload, verbose_name="Загрузка", null=True, blank=True, on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(verbose_name="Создано", auto_now_add=True)
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
+
+    class Meta:
+        verbose_name = "Загрузка по частям"
+        verbose_name_plural = "Загрузки по частям"
+
+
 class Callback(models.Model):
     name = models.CharField(verbose_name="Имя", max_length=255)
     email = models.EmailField(verbose_name="Почта")
@@ -501,6 +590,81 @@ class Callback(models.Model):
         verbose_name_plural = "Обратная связь"
 
 
+class OutboxEmail(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "В очереди"
+        SENT = "SENT", "Отправлено"
+        FAILED = "FAILED", "Не отправлено"
+
+    subject = models.TextField(verbose_name="Тема")
+    body = models.TextField(verbose_name="Текст", blank=True)
+    content_subtype = models.CharField(verbose_name="Тип текста", max_length=20, default="plain")
+    alternatives = models.JSONField(verbose_name="Альтернативные версии", default=list, blank=True)
+    from_email = models.CharField(verbose_name="Отправитель", max_length=255)
+    to = ArrayField(models.CharField(max_length=255), verbose_name="Получатели", default=list, blank=True)
+    cc = ArrayField(models.CharField(max_length=255), verbose_name="Копия", default=list, blank=True)
+    bcc = ArrayField(models.CharField(max_length=255), verbose_name="Скрытая копия", default=list, blank=True)
+    reply_to = ArrayField(models.CharField(max_length=255), verbose_name="Ответить", default=list, blank=True)
+    headers = models.JSONField(verbose_name="Заголовки", default=dict, blank=True)
+
+    status = models.CharField(verbose_name="Статус", max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(verbose_name="Попытки", default=0)
+    next_attempt_at = models.DateTimeField(verbose_name="Следующая попытка", default=timezone.now)
+    last_error = models.TextField(verbose_name="Последняя ошибка", blank=True)
+    created_at = models.DateTimeField(verbose_name="Создано", auto_now_add=True)
+    sent_at = models.DateTimeField(verbose_name="Отправлено", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Письмо"
+        verbose_name_plural = "Исходящие письма"
+        indexes = (
+            models.Index(
+                fields=("next_attempt_at",),
+                name="outbox_pending_idx",
+                condition=models.Q(status="PENDING"),
+            ),
+        )
+
+
+class Recommendation(models.Model):
+    class Kind(models.TextChoices):
+        PROFESSIONAL = "PROFESSIONAL", "Профессионал"
+        EMPLOYER = "EMPLOYER", "Организация"
+
+    kind = models.CharField(verbose_name="Тип", max_length=50, choices=Kind.choices)
+    object = models.CharField(verbose_name="Объект", max_length=255, choices=StudentSkill.Object.choices)
+    region = models.CharField(verbose_name="Регион", max_length=255, blank=True)
+    user = models.ForeignKey(User, verbose_name="Пользователь", related_name="recommendations", on_delete=models.CASCADE)
+    rank = models.PositiveIntegerField(verbose_name="Место")
+    score = models.PositiveIntegerField(verbose_name="Баллы")
+    reasons = ArrayField(models.CharField(max_length=255), verbose_name="Причины", default=list, blank=True)
+
+    class Meta:
+        verbose_name = "Рекомендация"
+        verbose_name_plural = "Рекомендации"
+        ordering = ("kind", "object", "region", "rank")
+        indexes = (
+            models.Index(fields=("kind", "object", "region", "rank"), name="recommendation_lookup_idx"),
+        )
+        constraints = (
+            models.UniqueConstraint(fields=("kind", "object", "region", "user"), name="recommendation_user_unique"),
+        )
+
+
+class ImageTask(models.Model):
+    name = models.CharField(verbose_name="Файл", max_length=255, unique=True)
+    attempts = models.PositiveIntegerField(verbose_name="Попытки", default=0)
+    last_error = models.TextField(verbose_name="Последняя ошибка", blank=True)
+    created_at = models.DateTimeField(verbose_name="Создано", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Обработка изображения"
+        verbose_name_plural = "Очередь изображений"
+
+    def __str__(self):
+        return self.name
+
+
 # Proxy models
 class UserEmaployerManager(BaseUserManager):
     def get_queryset(self, *args, **kwargs):
@@ -0,0 +1,193 @@
+import csv
+import io
+import json
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+
+from rest_framework import serializers
+
+from helper.catalogue import get_catalogue
+from helper.models import StudentMission, StudentSkill
+from .dashboard import refresh_dashboards
+from .models import User, Student, Teacher, TeacherStudent
+
+BATCH_SIZE = 500
+# COPY reads unquoted empty CSV fields as NULL by default, which would
+# turn empty strings into NULL
+COPY_NULL = r"\N"
+
+
+class StudentRowSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    password = serializers.CharField(required=False, allow_blank=True)
+    last_name = serializers.CharField(max_length=100)
+    first_name = serializers.CharField(max_length=100)
+    middle_name = serializers.CharField(max_length=100, required=False, allow_blank=True, default="")
+    region = serializers.CharField(max_length=255)
+    locality = serializers.CharField(max_length=255)
+    phone = serializers.CharField(max_length=255)
+    school = serializers.CharField(max_length=255)
+    school_class = serializers.CharField(max_length=5)
+    birth_date = serializers.DateField()
+    code = serializers.CharField(max_length=6, required=False, allow_blank=True)
+
+
+def copy_value(value):
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def copy_rows(model, fields, rows):
+    """
+    Insert ``rows`` (tuples of ``fields`` values) with PostgreSQL ``COPY``,
+    falling back to ``bulk_create`` on other databases.
+    """
+    if not rows:
+        return
+
+    if connection.vendor != "postgresql":
+        model.objects.bulk_create([model(**dict(zip(fields, row))) for row in rows])
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([copy_value(value) for value in row])
+    buffer.seek(0)
+
+    columns = ", ".join(
+        connection.ops.quote_name(model._meta.get_field(field).column) for field in fields
+    )
+    table = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')", buffer)
+
+
+def register_students(rows, teacher=None, batch_size=BATCH_SIZE):
+    """
+    Register students from a list of dicts in batches of ``batch_size``.
+
+    Every batch runs a constant number of statements whatever its size:
+    users and students are bulk inserted, teacher links, missions and
+    skills are copied, then dashboards are built. Rows are linked to ``teacher`` when given, or to
+    the teacher owning their ``code``.
+    """
+    report = {"created": 0, "rejected": []}
+    start = time.perf_counter()
+
+    for offset in range(0, len(rows), batch_size):
+        batch = rows[offset:offset + batch_size]
+        report["created"] += register_batch(batch, offset, teacher, report["rejected"])
+
+    elapsed = time.perf_counter() - start
+    report["seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = round(len(rows) / elapsed, 1) if elapsed else 0
+    return report
+
+
+def register_batch(rows, offset, teacher, rejected):
+    valid = []
+    for i, row in enumerate(rows, start=offset):
+        serializer = StudentRowSerializer(data=row)
+        if serializer.is_valid():
+            data = serializer.validated_data
+            data["email"] = User.objects.normalize_email(data["email"])
+            valid.append((i, data))
+        else:
+            rejected.append({"row": i, "errors": serializer.errors})
+
+    emails = [data["email"] for _, data in valid]
+    existing = set(User.objects.filter(email__in=emails).values_list("email", flat=True))
+
+    teachers = {}
+    if teacher is None:
+        codes = {data["code"] for _, data in valid if data.get("code")}
+        teachers = dict(Teacher.objects.filter(code__in=codes).values_list("code", "pk"))
+
+    accepted = []
+    seen = set()
+    for i, data in valid:
+        if data["email"] in existing or data["email"] in seen:
+            rejected.append({"row": i, "errors": {"email": ["Пользователь с таким email уже существует."]}})
+            continue
+        if teacher is None and data.get("code") and data["code"] not in teachers:
+            rejected.append({"row": i, "errors": {"code_not_found": "Указанный промокод не найден"}})
+            continue
+        seen.add(data["email"])
+        accepted.append(data)
+
+    if not accepted:
+        return 0
+
+    with transaction.atomic():
+        users = User.objects.bulk_create([
+            User(
+                email=data["email"],
+                password=make_password(data.get("password") or None),
+                type=User.Types.STUDENT,
+                last_name=data["last_name"],
+                first_name=data["first_name"],
+                middle_name=data["middle_name"],
+                verification=User.Verifiaction.MODERATION,
+            )
+            for data in accepted
+        ])
+
+        Student.objects.bulk_create([
+            Student(
+                user=user,
+                region=data["region"],
+                locality=data["locality"],
+                phone=data["phone"],
+                school=data["school"],
+                school_class=data["school_class"],
+                birth_date=data["birth_date"],
+            )
+            for user, data in zip(users, accepted)
+        ])
+
+        links = []
+        for user, data in zip(users, accepted):
+            teacher_id = teacher.pk if teacher is not None else teachers.get(data.get("code"))
+            if teacher_id:
+                links.append((teacher_id, user.pk))
+        copy_rows(TeacherStudent, ("teacher_id", "student_id"), links)
+
+        missions = get_catalogue().missions
+        copy_rows(
+            StudentMission,
+            ("mission_id", "student_id", "stage", "answers", "reaction", "is_complete", "is_unlocked"),
+            [
+                (mission.pk, user.pk, 0, {}, "", False, mission.order == 1)
+                for user in users
+                for mission in missions
+            ]
+        )
+        copy_rows(
+            StudentSkill,
+            ("student_id", "object", "points"),
+            [(user.pk, object, 0) for user in users for object in StudentSkill.Object.names]
+        )
+        refresh_dashboards(*(user.pk for user in users))
+
+    return len(users)
+
+
+def read_students(file, format=None):
+    """
+    Read student rows from a CSV (with a header line) or JSON list file object.
+    """
+    name = getattr(file, "name", "")
+    format = format or ("json" if name.endswith(".json") else "csv")
+    content = file.read()
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig")
+
+    if format == "json":
+        return json.loads(content)
+    return list(csv.DictReader(io.StringIO(content)))
@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.utils import timezone
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+RETRY_DELAY = 60
+
+
+class OutboxEmailBackend(BaseEmailBackend):
+    """
+    Email backend storing messages in the ``OutboxEmail`` table instead of
+    sending them. The ``send_emails`` worker delivers them with the backend
+    configured in ``OUTBOX_EMAIL_BACKEND``.
+    """
+
+    def send_messages(self, email_messages):
+        from .models import OutboxEmail
+
+        OutboxEmail.objects.bulk_create([
+            OutboxEmail(
+                subject=message.subject,
+                body=message.body,
+                content_subtype=message.content_subtype,
+                alternatives=[list(alternative) for alternative in getattr(message, "alternatives", [])],
+                from_email=message.from_email or settings.DEFAULT_FROM_EMAIL or "",
+                to=list(message.to),
+                cc=list(message.cc),
+                bcc=list(message.bcc),
+                reply_to=list(message.reply_to),
+                headers=message.extra_headers,
+            )
+            for message in email_messages
+        ])
+        return len(email_messages)
+
+
+def build_message(email, connection):
+    message = mail.EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email,
+        to=email.to,
+        cc=email.cc,
+        bcc=email.bcc,
+        reply_to=email.reply_to,
+        headers=email.headers,
+        alternatives=[tuple(alternative) for alternative in email.alternatives],
+        connection=connection,
+    )
+    message.content_subtype = email.content_subtype
+    return message
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def send_pending(batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    """
+    Send one batch of due emails over a single backend connection.
+
+    Rows are locked with ``SKIP LOCKED`` so several workers can run at once.
+    Failed emails are retried with exponential backoff and marked as failed
+    after ``max_attempts``. Returns the number of sent and failed emails.
+    """
+    from .models import OutboxEmail
+
+    sent = failed = 0
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=OutboxEmail.Status.PENDING, next_attempt_at__lte=timezone.now())
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        if not emails:
+            return sent, failed
+
+        connection = mail.get_connection(settings.OUTBOX_EMAIL_BACKEND)
+        connection.open()
+        try:
+            for email in emails:
+                try:
+                    build_message(email, connection).send()
+                except Exception as e:
+                    failed += 1
+                    email.attempts += 1
+                    email.last_error = str(e)
+                    if email.attempts >= max_attempts:
+                        email.status = OutboxEmail.Status.FAILED
+                    else:
+                        email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+                else:
+                    sent += 1
+                    email.attempts += 1
+                    email.status = OutboxEmail.Status.SENT
+                    email.sent_at = timezone.now()
+        finally:
+            connection.close()
+
+        OutboxEmail.objects.bulk_update(
+            emails, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+        )
+
+    return sent, failed
@@ -0,0 +1,48 @@
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+
+
+class CatalogueCursorPagination(CursorPagination):
+    ordering = "user_id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class CataloguePagination(PageNumberPagination):
+    """
+    Page-number pagination for the catalogue endpoints.
+
+    Passing ``?pagination=cursor`` (or a ``cursor`` returned in a previous
+    response) switches to keyset pagination ordered on ``user_id``, so deep
+    pages are fetched with ``WHERE user_id > ...`` instead of an OFFSET scan.
+    """
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    mode_query_param = "pagination"
+    cursor_class = CatalogueCursorPagination
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def is_cursor_mode(self, request):
+        if request.query_params.get(self.mode_query_param) == "cursor":
+            return True
+        return self.cursor_class.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_cursor_mode(request):
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.cursor_paginator = self.cursor_class()
+        page = self.cursor_paginator.paginate_queryset(queryset, request, view=view)
+        self.display_page_controls = self.cursor_paginator.display_page_controls
+        return page
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
@@ -37,4 +37,10 @@ class IsEmploymentAgency(BasePermission):
 class IsStudent(BasePermission):
     def has_permission(self, request, view):
         user = request.user
-        return user.type == User.Types.STUDENT
\ No newline at end of file
+        return user.type == User.Types.STUDENT
+
+
+class IsTeacher(BasePermission):
+    def has_permission(self, request, view):
+        user = request.user
+        return user.type == User.Types.TEACHER
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+PROFILE_PREFIX = "profile"
+
+
+def get_profile_key(user_id):
+    return f"{PROFILE_PREFIX}:{user_id}"
+
+
+def get_cached_profile(user_id):
+    return cache.get(get_profile_key(user_id))
+
+
+def set_cached_profile(user_id, data):
+    cache.set(get_profile_key(user_id), data, settings.PROFILE_CACHE_TIMEOUT)
+
+
+def invalidate_profiles(*user_ids):
+    """
+    Drop the cached ``/users/me/`` payloads of ``user_ids`` now and once the
+    current transaction commits, so a concurrent read cannot re-cache
+    uncommitted data.
+    """
+    keys = [get_profile_key(user_id) for user_id in user_ids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
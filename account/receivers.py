@@ -1,15 +1,204 @@
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
 
+from rest_framework.authtoken.models import Token
 from djoser.signals import user_registered
 
+from helper.models import SkillScope
+from . import images, matching, recommendations
+from .dashboard import refresh_dashboards
+from .authentication import invalidate_tokens
 from .email import TeacherRegisterEmail
+from .models import (
+    Employer,
+    Professional,
+    NPO,
+    College,
+    EmploymentAgency,
+    Student,
+    Teacher,
+    Upload,
+    Recommendation,
+    StudentEmployer,
+    StudentProfessional,
+)
+from .profiles import invalidate_profiles
+from .response_cache import invalidate_tags
+from .signals import images_processed, profiles_bulk_saved
 
 User = get_user_model()
 
+# Cached responses depending on each user type: profiles are listed in
+# their catalogue and organizer names are shown on events
+CATALOGUE_TAGS = {
+    User.Types.EMPLOYER: ("employers", "events"),
+    User.Types.PROFESSIONAL: ("professionals",),
+    User.Types.NPO: ("npo", "events"),
+    User.Types.COLLEGE: ("events",),
+}
+# Admin and export save proxy models, so global ``post_save`` and
+# ``post_delete`` receivers below don't filter senders and match instances
+# with ``isinstance`` against these models instead
+PROFILE_TYPES = (
+    (Employer, User.Types.EMPLOYER),
+    (Professional, User.Types.PROFESSIONAL),
+    (NPO, User.Types.NPO),
+    (College, User.Types.COLLEGE),
+)
+
 @receiver(user_registered)
 def user_registered(sender, user, request, **kwargs):
     if user.type == User.Types.TEACHER:
         context = {"user": user}
         to = [user.email]
         TeacherRegisterEmail(request, context).send(to)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_catalogue(sender, instance, update_fields=None, **kwargs):
+    if isinstance(instance, User):
+        # Logins only update last_login
+        if update_fields is not None and "verification" not in update_fields:
+            return
+        invalidate_tags(*CATALOGUE_TAGS.get(instance.type, ()))
+        return
+
+    for model, type in PROFILE_TYPES:
+        if isinstance(instance, model):
+            invalidate_tags(*CATALOGUE_TAGS[type])
+            return
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_tokens(instance.key)
+
+
+@receiver(post_save)
+def invalidate_user_tokens(sender, instance, update_fields=None, **kwargs):
+    if not isinstance(instance, User):
+        return
+    # Logins only update last_login
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    invalidate_tokens(*Token.objects.filter(user_id=instance.pk).values_list("key", flat=True))
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_profile(sender, instance, update_fields=None, **kwargs):
+    if isinstance(instance, User):
+        # Logins only update last_login
+        if update_fields is not None and set(update_fields) == {"last_login"}:
+            return
+        invalidate_profiles(instance.pk)
+    elif isinstance(instance, (Employer, Professional, College, EmploymentAgency, Teacher, Upload)):
+        invalidate_profiles(instance.user_id)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def refresh_recommendations(sender, instance, **kwargs):
+    if isinstance(instance, Professional):
+        kind = Recommendation.Kind.PROFESSIONAL
+    elif isinstance(instance, Employer):
+        kind = Recommendation.Kind.EMPLOYER
+    else:
+        return
+    transaction.on_commit(lambda: recommendations.refresh_profiles(kind, instance.pk))
+    transaction.on_commit(lambda: matching.bump_version(kind))
+
+
+@receiver(profiles_bulk_saved)
+def enqueue_bulk_saved_images(sender, pks, **kwargs):
+    for model, field in images.IMAGE_FIELDS:
+        if issubclass(sender, model):
+            images.enqueue(*model._default_manager.filter(pk__in=pks).values_list(field, flat=True))
+
+
+@receiver(profiles_bulk_saved)
+def refresh_bulk_saved_profiles(sender, pks, **kwargs):
+    """
+    Set-wise counterpart of the receivers above for profiles written in bulk.
+    """
+    for model, type in PROFILE_TYPES:
+        if issubclass(sender, model):
+            invalidate_tags(*CATALOGUE_TAGS[type])
+            break
+    invalidate_profiles(*pks)
+    invalidate_tokens(*Token.objects.filter(user_id__in=pks).values_list("key", flat=True))
+
+    if issubclass(sender, Professional):
+        kind = Recommendation.Kind.PROFESSIONAL
+    elif issubclass(sender, Employer):
+        kind = Recommendation.Kind.EMPLOYER
+    else:
+        return
+    transaction.on_commit(lambda: recommendations.refresh_profiles(kind, *pks))
+    transaction.on_commit(lambda: matching.bump_version(kind))
+
+
+@receiver(post_save, sender=SkillScope)
+@receiver(post_delete, sender=SkillScope)
+def refresh_skill_recommendations(sender, instance, **kwargs):
+    transaction.on_commit(lambda: recommendations.refresh_object(instance.object))
+    transaction.on_commit(lambda: matching.bump_version(*Recommendation.Kind.values))
+
+
+@receiver(post_save)
+def enqueue_images(sender, instance, **kwargs):
+    images.enqueue(*images.get_image_names(instance))
+
+
+@receiver(images_processed)
+def touch_image_profiles(sender, names, **kwargs):
+    """
+    Profiles showing the processed images got their ``*_srcset``, so their
+    ``updated_at`` and cached responses are renewed as on ``save()``.
+    """
+    fields = dict(images.IMAGE_FIELDS)
+    user_ids = []
+    for model, type in PROFILE_TYPES:
+        pks = list(model._base_manager.filter(**{f"{fields[model]}__in": names}).values_list("pk", flat=True))
+        if pks:
+            model._base_manager.filter(pk__in=pks).update(updated_at=timezone.now())
+            invalidate_tags(*CATALOGUE_TAGS[type])
+            user_ids.extend(pks)
+    user_ids.extend(Student._base_manager.filter(photo__in=names).values_list("pk", flat=True))
+    invalidate_profiles(*user_ids)
+
+
+@receiver(post_save, sender=StudentEmployer)
+@receiver(post_delete, sender=StudentEmployer)
+@receiver(post_save, sender=StudentProfessional)
+@receiver(post_delete, sender=StudentProfessional)
+def refresh_saved_items(sender, instance, **kwargs):
+    # After commit, as the student may be deleted with its saved items
+    transaction.on_commit(lambda: refresh_dashboards(instance.student_id))
+
+
+def refresh_saved_by(model, pks):
+    """
+    Rebuild dashboards of the students who saved the ``model`` profiles.
+    """
+    if issubclass(model, Employer):
+        students = StudentEmployer.objects.filter(employer_id__in=pks)
+    elif issubclass(model, Professional):
+        students = StudentProfessional.objects.filter(professional_id__in=pks)
+    else:
+        return
+    transaction.on_commit(lambda: refresh_dashboards(*students.values_list("student_id", flat=True).distinct()))
+
+
+@receiver(post_save)
+def refresh_profile_saved_items(sender, instance, **kwargs):
+    refresh_saved_by(type(instance), [instance.pk])
+
+
+@receiver(profiles_bulk_saved)
+def refresh_bulk_saved_items(sender, pks, **kwargs):
+    refresh_saved_by(sender, pks)
@@ -0,0 +1,190 @@
+from collections import defaultdict
+
+from django.db import connection, transaction
+
+from helper.models import SkillScope
+from .models import Employer, Professional, Recommendation
+
+LIMIT = 50
+
+# (field, points) a whitelisted profile earns when the field is set,
+# the names of the fields earning points are stored as the reasons
+PROFESSIONAL_CRITERIA = (
+    ("is_ready_to_mentor", 3),
+    ("is_ready_to_excursion", 2),
+    ("is_ready_to_tell_about", 1),
+)
+EMPLOYER_CRITERIA = (
+    ("has_student_events", 3),
+    ("has_work_practice", 2),
+    ("has_targeted_training", 2),
+    ("has_educational_products", 1),
+)
+CRITERIA = {
+    Recommendation.Kind.PROFESSIONAL: PROFESSIONAL_CRITERIA,
+    Recommendation.Kind.EMPLOYER: EMPLOYER_CRITERIA,
+}
+
+
+def get_professionals():
+    fields = [field for field, _ in PROFESSIONAL_CRITERIA]
+    return Professional.objects.filter(whitelist=True).only("user", "scope", *fields)
+
+
+def get_employers():
+    fields = [field for field, _ in EMPLOYER_CRITERIA]
+    return Employer.objects.filter(whitelist=True).only("user", "company_scope", "company_region", *fields)
+
+
+def professional_groups(professional, scopes):
+    """
+    Professionals are recommended for every skill whose scope covers
+    their own, whatever their region.
+    """
+    return {
+        (object, "") for object, scope in scopes.items()
+        if set(professional.scope) <= set(scope)
+    }
+
+
+def employer_groups(employer, scopes):
+    """
+    Employers are recommended for every skill including their scope,
+    in each region they work in.
+    """
+    return {
+        (object, region) for object, scope in scopes.items()
+        if employer.company_scope in scope
+        for region in employer.company_region
+    }
+
+
+def rank(kind, object, region, profiles):
+    """
+    Build ``Recommendation`` rows for ``profiles`` ordered by score,
+    then by primary key so that equal scores keep a stable order.
+    """
+    rows = []
+    for profile in profiles:
+        reasons = [field for field, _ in CRITERIA[kind] if getattr(profile, field)]
+        score = sum(points for field, points in CRITERIA[kind] if getattr(profile, field))
+        rows.append((score, profile.pk, reasons))
+
+    rows.sort(key=lambda row: (-row[0], row[1]))
+    return [
+        Recommendation(
+            kind=kind, object=object, region=region,
+            user_id=pk, rank=i, score=score, reasons=reasons
+        )
+        for i, (score, pk, reasons) in enumerate(rows[:LIMIT], start=1)
+    ]
+
+
+def get_scopes():
+    return dict(SkillScope.objects.values_list("object", "scope"))
+
+
+def rebuild():
+    """
+    Recompute every recommendation list from scratch. Returns the number of rows.
+    """
+    with transaction.atomic():
+        # Wait for running refreshes and block new ones until the rebuild
+        # commits, so the profiles read below include every refresh
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {Recommendation._meta.db_table} IN SHARE ROW EXCLUSIVE MODE")
+
+        scopes = get_scopes()
+        groups = defaultdict(lambda: defaultdict(list))
+        for professional in get_professionals():
+            for group in professional_groups(professional, scopes):
+                groups[Recommendation.Kind.PROFESSIONAL][group].append(professional)
+        for employer in get_employers():
+            for group in employer_groups(employer, scopes):
+                groups[Recommendation.Kind.EMPLOYER][group].append(employer)
+
+        rows = [
+            row
+            for kind, kind_groups in groups.items()
+            for (object, region), profiles in kind_groups.items()
+            for row in rank(kind, object, region, profiles)
+        ]
+        Recommendation.objects.all().delete()
+        Recommendation.objects.bulk_create(rows)
+    return len(rows)
+
+
+def lock_group(kind, object, region):
+    """
+    Hold a transaction level lock on one list, so concurrent refreshes of
+    the same list run one after the other.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+            [f"recommendation:{kind}:{object}:{region}"],
+        )
+
+
+def refresh_groups(kind, groups, scopes=None):
+    """
+    Recompute the ``(object, region)`` lists of ``kind`` in ``groups``.
+
+    Every list is locked before its profiles are read, so the rows are
+    ranked from the data committed by any refresh that ran before.
+    Lists are locked in a fixed order to avoid deadlocks.
+    """
+    if not groups:
+        return
+    scopes = get_scopes() if scopes is None else scopes
+
+    with transaction.atomic():
+        for object, region in sorted(groups):
+            lock_group(kind, object, region)
+            Recommendation.objects.filter(kind=kind, object=object, region=region).delete()
+
+            scope = scopes.get(object)
+            if scope is None:
+                continue
+            if kind == Recommendation.Kind.PROFESSIONAL:
+                profiles = get_professionals().filter(scope__contained_by=scope)
+            else:
+                profiles = get_employers().filter(company_scope__in=scope, company_region__contains=[region])
+            Recommendation.objects.bulk_create(rank(kind, object, region, profiles))
+
+
+def refresh_profiles(kind, *pks):
+    """
+    Recompute the lists profiles were part of and the ones they belong to now.
+    """
+    scopes = get_scopes()
+    groups = set(
+        Recommendation.objects
+        .filter(kind=kind, user_id__in=pks)
+        .values_list("object", "region")
+    )
+    if kind == Recommendation.Kind.PROFESSIONAL:
+        for profile in get_professionals().filter(pk__in=pks):
+            groups |= professional_groups(profile, scopes)
+    else:
+        for profile in get_employers().filter(pk__in=pks):
+            groups |= employer_groups(profile, scopes)
+    refresh_groups(kind, groups, scopes)
+
+
+def refresh_object(object):
+    """
+    Recompute every list of a skill object after its ``SkillScope`` changed.
+    """
+    scopes = get_scopes()
+    regions = set(
+        Recommendation.objects
+        .filter(kind=Recommendation.Kind.EMPLOYER, object=object)
+        .values_list("region", flat=True)
+    )
+    scope = scopes.get(object, [])
+    for regions_list in get_employers().filter(company_scope__in=scope).values_list("company_region", flat=True):
+        regions.update(regions_list)
+
+    refresh_groups(Recommendation.Kind.PROFESSIONAL, {(object, "")}, scopes)
+    refresh_groups(Recommendation.Kind.EMPLOYER, {(object, region) for region in regions}, scopes)
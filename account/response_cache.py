@@ -0,0 +1,84 @@
+import hashlib
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from rest_framework import status
+from rest_framework.response import Response
+
+TAG_PREFIX = "tag"
+RESPONSE_PREFIX = "response"
+
+
+def get_tag_versions(tags):
+    keys = [f"{TAG_PREFIX}:{tag}" for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid.uuid4().hex, None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate_tags(*tags):
+    """
+    Invalidate every cached response tagged with one of ``tags``
+    once the current transaction commits.
+    """
+    if not tags:
+        return
+
+    def invalidate():
+        cache.set_many({f"{TAG_PREFIX}:{tag}": uuid.uuid4().hex for tag in tags}, None)
+
+    transaction.on_commit(invalidate)
+
+
+def normalize_params(query_params):
+    """
+    Sort query params and their comma separated values, so that
+    ``?region=b,a&scope=x`` and ``?scope=x&region=a,b`` share a cache entry.
+    """
+    params = []
+    for name in sorted(query_params.keys()):
+        for value in sorted(query_params.getlist(name)):
+            params.append((name, ",".join(sorted(value.split(",")))))
+    return params
+
+
+def make_key(request, tags, extra=None):
+    versions = get_tag_versions(tags)
+    params = normalize_params(request.query_params)
+    raw = repr((request.get_host(), request.path, params, versions, extra))
+    return f"{RESPONSE_PREFIX}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def cache_response(*tags, timeout=None, vary=None):
+    """
+    Cache successful responses of a viewset action for anonymous users.
+    Entries are keyed on host, path and normalized query params and are
+    dropped when any of ``tags`` is invalidated.
+
+    ``vary(view, request)`` may return a value the response depends on
+    besides the tagged data, e.g. the current time, to add to the key.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            if not request.user.is_anonymous:
+                return method(view, request, *args, **kwargs)
+
+            key = make_key(request, tags, vary(view, request) if vary else None)
+            data = cache.get(key)
+            if data is not None:
+                return Response(data, status=status.HTTP_200_OK)
+
+            response = method(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, timeout or settings.RESPONSE_CACHE_TIMEOUT)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,27 @@
+import random
+
+from django.core.cache import cache
+
+POOL_SIZE = 500
+POOL_TIMEOUT = 60 * 5
+
+
+def random_sample(queryset, count, key, pool_size=POOL_SIZE, timeout=POOL_TIMEOUT):
+    """
+    Return up to ``count`` random objects from ``queryset``.
+
+    Instead of ``order_by("?")``, which sorts the whole table on every call,
+    a shuffled pool of primary keys is cached under ``key`` and refreshed
+    every ``timeout`` seconds. Each call then costs one ``pk IN (...)`` lookup
+    whatever the table size.
+    """
+    pool = cache.get(key)
+    if pool is None:
+        pool = list(queryset.order_by().values_list("pk", flat=True))
+        if len(pool) > pool_size:
+            pool = random.sample(pool, pool_size)
+        cache.set(key, pool, timeout)
+
+    pks = random.sample(pool, min(count, len(pool)))
+    objects = {obj.pk: obj for obj in queryset.filter(pk__in=pks)}
+    return [objects[pk] for pk in pks if pk in objects]
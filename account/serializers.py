@@ -5,13 +5,20 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.utils.crypto import get_random_string
 from django.contrib.auth.base_user import BaseUserManager
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Prefetch, Q
+from django.db.models.fields.files import FieldFile
 
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import ValidationError
 from djoser.serializers import UserCreatePasswordRetypeSerializer as DjoserUserCreateSerializer
 
+from helper.catalogue import get_catalogue
 from helper.serializers import SkillSerializer
+from .images import ImageSetField
+from .mixins import EagerLoadingMixin
+from .profiles import get_cached_profile, set_cached_profile
 from .models import (
     Employer,
     Professional,
@@ -21,7 +28,9 @@ from .models import (
     Teacher,
     TeacherStudent,
     Student,
+    StudentDashboard,
     Upload,
+    UploadSession,
     Callback
 )
 
@@ -29,6 +38,11 @@ User = get_user_model()
 
 
 class UserSerializer(serializers.ModelSerializer):
+    """
+    Serialize the user together with its profile. The profile is read
+    in one query and the payload is cached until the user, its profile
+    or its uploads are saved.
+    """
 
     class Meta:
         model = User
@@ -37,42 +51,28 @@ class UserSerializer(serializers.ModelSerializer):
                    "groups", "user_permissions")
 
     def to_representation(self, instance):
+        data = get_cached_profile(instance.pk)
+        if data is not None:
+            return data
+
         data = super().to_representation(instance)
-        if instance.type == User.Types.EMPLOYER:
-            try:
-                employer = Employer.objects.get(pk=instance.id)
-            except Employer.DoesNotExist:
-                pass
-            else:
-                data.update(EmployerDetailSerializer(employer).data)
-        elif instance.type == User.Types.PROFESSIONAL:
-            try:
-                professional = Professional.objects.get(pk=instance.id)
-            except Professional.DoesNotExist:
-                pass
-            else:
-                data.update(ProfessionalDetailSerializer(professional).data)
-        elif instance.type == User.Types.COLLEGE:
-            try:
-                college = College.objects.get(pk=instance.id)
-            except College.DoesNotExist:
-                pass
-            else:
-                data.update(CollegeDetailSerializer(college).data)
-        elif instance.type == User.Types.EMPAGENCY:
-            try:
-                empagency = EmploymentAgency.objects.get(pk=instance.id)
-            except EmploymentAgency.DoesNotExist:
-                pass
-            else:
-                data.update(EmploymentAgencySerializer(empagency).data)
-        elif instance.type == User.Types.TEACHER:
-            try:
-                teacher = TeacherSerializer.objects.get(pk=instance.id)
-            except Teacher.DoesNotExist:
-                pass
-            else:
-                data.update(TeacherSerializer(teacher).data)
+        profile = PROFILE_SERIALIZERS.get(instance.type)
+        if profile is not None:
+            model, serializer_class = profile
+            queryset = model.objects.filter(pk=instance.pk)
+            if model is Professional:
+                queryset = queryset.annotate(workplace_files=ArrayAgg(
+                    "user__uploads__file",
+                    filter=Q(user__uploads__type="workplace"),
+                    ordering="user__uploads__id",
+                ))
+            obj = queryset.first()
+            if obj is not None:
+                # The user is already loaded, nested serializers read it from there
+                obj.user = instance
+                data.update(serializer_class(obj).data)
+
+        set_cached_profile(instance.pk, data)
         return data
 
 
@@ -96,12 +96,15 @@ class CreateUserSerializer(DjoserUserCreateSerializer):
         return super().validate(attrs)
 
 
-class EmployerSerializer(serializers.ModelSerializer):
-    id = serializers.IntegerField(source="user.id")
+class EmployerSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    id = serializers.IntegerField(source="user_id")
+    company_logo_srcset = ImageSetField(source="company_logo")
+
+    only_fields = ("user", "company_logo", "company_name", "company_region")
 
     class Meta:
         model = Employer
-        fields = ("id", "company_logo", "company_name", "company_region")
+        fields = ("id", "company_logo", "company_logo_srcset", "company_name", "company_region")
 
 
 class EmployerCreateSerializer(serializers.ModelSerializer):
@@ -110,25 +113,33 @@ class EmployerCreateSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class EmployerDetailSerializer(serializers.ModelSerializer):
+class EmployerDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ("user",)
+
     last_name = serializers.CharField(source="user.last_name")
     first_name = serializers.CharField(source="user.first_name")
     middle_name = serializers.CharField(source="user.middle_name")
+    company_logo_srcset = ImageSetField(source="company_logo")
 
     class Meta:
         model = Employer
         fields = "__all__"
 
 
-class ProfessionalSerialzier(serializers.ModelSerializer):
-    id = serializers.IntegerField(source="user.id")
+class ProfessionalSerialzier(EagerLoadingMixin, serializers.ModelSerializer):
+    id = serializers.IntegerField(source="user_id")
     last_name = serializers.CharField(source="user.last_name")
     first_name = serializers.CharField(source="user.first_name")
     middle_name = serializers.CharField(source="user.middle_name")
+    photo_srcset = ImageSetField(source="photo")
+
+    select_related_fields = ("user",)
+    only_fields = ("user", "user__last_name", "user__first_name", "user__middle_name",
+                   "photo", "company_name", "region", "speciality")
 
     class Meta:
         model = Professional
-        fields = ("id", "photo", "company_name", "region", "speciality",
+        fields = ("id", "photo", "photo_srcset", "company_name", "region", "speciality",
                   "last_name", "first_name", "middle_name")
 
 
@@ -138,26 +149,45 @@ class ProfessionalCreateSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class ProfessionalDetailSerializer(serializers.ModelSerializer):
+class ProfessionalDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     last_name = serializers.CharField(source="user.last_name")
     first_name = serializers.CharField(source="user.first_name")
     middle_name = serializers.CharField(source="user.middle_name")
+    photo_srcset = ImageSetField(source="photo")
     workplace_photo = serializers.SerializerMethodField()
 
+    select_related_fields = ("user",)
+    prefetch_related_fields = (
+        Prefetch(
+            "user__uploads",
+            queryset=Upload.objects.filter(type="workplace"),
+            to_attr="workplace_uploads"
+        ),
+    )
+
     def get_workplace_photo(self, obj):
-        uploads = Upload.objects.filter(user_id=obj.user.id, type="workplace")
-        return (obj.file.url for obj in uploads)
+        if hasattr(obj, "workplace_files"):
+            storage = Upload._meta.get_field("file").storage
+            return [storage.url(name) for name in obj.workplace_files or []]
+
+        uploads = getattr(obj.user, "workplace_uploads", None)
+        if uploads is None:
+            uploads = Upload.objects.filter(user_id=obj.user_id, type="workplace")
+        return [upload.file.url for upload in uploads]
 
     class Meta:
         model = Professional
         fields = "__all__"
 
 
-class NPOSerializer(serializers.ModelSerializer):
+class NPOSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    company_logo_srcset = ImageSetField(source="company_logo")
+
+    only_fields = ("user", "company_logo", "company_name", "company_region")
 
     class Meta:
         model = NPO
-        fields = ("company_logo", "company_name", "company_region")
+        fields = ("company_logo", "company_logo_srcset", "company_name", "company_region")
 
 
 class NPOCreateSerializer(serializers.ModelSerializer):
@@ -166,10 +196,13 @@ class NPOCreateSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class NPODetailSerializer(serializers.ModelSerializer):
+class NPODetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ("user",)
+
     last_name = serializers.CharField(source="user.last_name")
     first_name = serializers.CharField(source="user.first_name")
     middle_name = serializers.CharField(source="user.middle_name")
+    company_logo_srcset = ImageSetField(source="company_logo")
 
     class Meta:
         model = NPO
@@ -177,6 +210,7 @@ class NPODetailSerializer(serializers.ModelSerializer):
 
 
 class CollegeSerializer(serializers.ModelSerializer):
+    college_logo_srcset = ImageSetField(source="college_logo")
 
     class Meta:
         model = College
@@ -189,10 +223,13 @@ class CollegeCreateSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class CollegeDetailSerializer(serializers.ModelSerializer):
+class CollegeDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ("user",)
+
     last_name = serializers.CharField(source="user.last_name")
     first_name = serializers.CharField(source="user.first_name")
     middle_name = serializers.CharField(source="user.middle_name")
+    college_logo_srcset = ImageSetField(source="college_logo")
 
     class Meta:
         model = College
@@ -217,24 +254,34 @@ class TeacherSerializer(serializers.ModelSerializer):
         return super().save(**kwargs, code=code)
 
 
-class StudentEmployerSerializer(serializers.ModelSerializer):
+class StudentEmployerSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    company_logo_srcset = ImageSetField(source="company_logo")
+
+    only_fields = ("user", "company_name_other", "company_logo", "company_description_other")
+
     class Meta:
         model = Employer
-        fields = ("pk", "company_name_other", "company_logo", "company_description_other")
+        fields = ("pk", "company_name_other", "company_logo", "company_logo_srcset", "company_description_other")
+
 
+class StudentProfessionalSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    only_fields = ("user", "profession_name_other", "profession_definition_other")
 
-class StudentProfessionalSerializer(serializers.ModelSerializer):
     class Meta:
         model = Professional
         fields = ("pk", "profession_name_other", "profession_definition_other")
 
 
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ("user",)
+    prefetch_related_fields = ("skills", "employers", "professionals")
+
     email = serializers.CharField(source="user.email", read_only=True)
     last_name = serializers.CharField(source="user.last_name", read_only=True)
     first_name = serializers.CharField(source="user.first_name", read_only=True)
     middle_name = serializers.CharField(source="user.middle_name", read_only=True)
     skills = SkillSerializer(many=True, read_only=True)
+    photo_srcset = ImageSetField(source="photo")
     employers = StudentEmployerSerializer(many=True, read_only=True)
     professionals = StudentProfessionalSerializer(many=True, read_only=True)
     code = serializers.CharField(write_only=True, required=False)
@@ -270,6 +317,46 @@ class StudentSerializer(serializers.ModelSerializer):
         return data
 
 
+class StudentDashboardSerializer(serializers.ModelSerializer):
+    """
+    Serialize the dashboard row as is, completing missions from the
+    catalogue and employer logo names with their URLs.
+    """
+    missions = serializers.SerializerMethodField()
+    employers = serializers.SerializerMethodField()
+
+    class Meta:
+        model = StudentDashboard
+        exclude = ("student",)
+
+    def get_missions(self, obj):
+        catalogue = get_catalogue()
+        missions = []
+        for mission in obj.missions:
+            catalogue_mission = catalogue.get(mission["mission"])
+            if catalogue_mission is not None:
+                missions.append({
+                    **mission,
+                    "order": catalogue_mission.order,
+                    "questions_count": catalogue.questions_count(catalogue_mission.pk),
+                })
+        return sorted(missions, key=lambda mission: mission["order"])
+
+    def get_employers(self, obj):
+        field = Employer._meta.get_field("company_logo")
+        logo = serializers.ImageField()
+        logo_srcset = ImageSetField()
+        employers = []
+        for employer in obj.employers:
+            file = FieldFile(None, field, employer["company_logo"])
+            employers.append({
+                **employer,
+                "company_logo": logo.to_representation(file),
+                "company_logo_srcset": logo_srcset.to_representation(file),
+            })
+        return employers
+
+
 class TokenSerializer(serializers.ModelSerializer):
     id = serializers.CharField(source="user.id")
     auth_token = serializers.CharField(source="key")
@@ -281,7 +368,22 @@ class TokenSerializer(serializers.ModelSerializer):
         fields = ("id", "auth_token", "type", "verification")
 
 
+class UploadSessionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadSession
+        fields = ("id", "type", "filename", "size", "offset", "upload")
+
+
 class CallbackSerializer(serializers.ModelSerializer):
     class Meta:
         model = Callback
         fields = "__all__"
+
+
+PROFILE_SERIALIZERS = {
+    User.Types.EMPLOYER: (Employer, EmployerDetailSerializer),
+    User.Types.PROFESSIONAL: (Professional, ProfessionalDetailSerializer),
+    User.Types.COLLEGE: (College, CollegeDetailSerializer),
+    User.Types.EMPAGENCY: (EmploymentAgency, EmploymentAgencySerializer),
+    User.Types.TEACHER: (Teacher, TeacherSerializer),
+}
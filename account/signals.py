@@ -0,0 +1,9 @@
+from django.dispatch import Signal
+
+# Sent after profiles were written in bulk, bypassing ``save()`` and
+# ``post_save``, with ``pks`` of the written profiles
+profiles_bulk_saved = Signal()
+
+# Sent once ``process_images`` wrote the WebP derivatives of the ``names``
+# images, which changes the ``*_srcset`` of every row showing them
+images_processed = Signal()
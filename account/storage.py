@@ -0,0 +1,43 @@
+import hashlib
+import os
+
+from django.core.files.storage import FileSystemStorage
+
+BLOBS_DIR = "blobs"
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Media storage keeping every file once, named by the SHA-256 of its
+    content: ``blobs/3f/3f9a...e1.pdf``. Saving a file that is already
+    stored returns the existing name, so the ``upload_to`` of the field is
+    ignored. Blobs may be shared by several rows, so they are never deleted
+    through the field, only by ``collect_blobs`` once nothing references
+    them.
+    """
+
+    def hash_name(self, name, content):
+        sha256 = hashlib.sha256()
+        for chunk in content.chunks():
+            sha256.update(chunk)
+        digest = sha256.hexdigest()
+        extension = os.path.splitext(name)[1].lower()
+        return f"{BLOBS_DIR}/{digest[:2]}/{digest}{extension}"
+
+    def _save(self, name, content):
+        name = self.hash_name(name, content)
+        if self.exists(name):
+            # Mark the blob as used again so collect_blobs keeps it until
+            # the row referencing it is committed
+            os.utime(self.path(name))
+            return name
+        return super()._save(name, content)
+
+    def delete(self, name):
+        pass
+
+    def purge(self, name):
+        super().delete(name)
+
+
+blob_storage = ContentAddressedStorage()
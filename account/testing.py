@@ -0,0 +1,41 @@
+from django.db import connections, DEFAULT_DB_ALIAS
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+
+def count_queries(view, path, params=None, user=None, using=DEFAULT_DB_ALIAS):
+    """
+    Call ``view`` with a GET request and return the number of executed queries.
+    """
+    request = APIRequestFactory().get(path, params or {})
+    if user is not None:
+        force_authenticate(request, user=user)
+
+    with override_settings(ALLOWED_HOSTS=["*"]):
+        with CaptureQueriesContext(connections[using]) as context:
+            response = view(request)
+            response.render()
+
+    assert response.status_code == 200, (
+        "%s returned %s: %s" % (path, response.status_code, response.content[:200])
+    )
+    return len(context.captured_queries)
+
+
+def assert_constant_queries(view, path, params=None, user=None, page_sizes=(1, 100)):
+    """
+    Assert that a paginated list ``view`` runs the same number of queries
+    whatever the page size, i.e. that it has no per-row N+1 lookups.
+    Returns the query count.
+    """
+    counts = {}
+    for page_size in page_sizes:
+        counts[page_size] = count_queries(
+            view, path, params={**(params or {}), "page_size": page_size}, user=user
+        )
+
+    assert len(set(counts.values())) == 1, (
+        "%s query count depends on page size: %s" % (path, counts)
+    )
+    return counts[page_sizes[0]]
@@ -0,0 +1,43 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from account.models import Employer, User
+
+
+def create_employer(i, **kwargs):
+    user = User.objects.create_user(
+        email=f"employer{i}@example.com", password="x", type=User.Types.EMPLOYER,
+        verification=User.Verifiaction.VERIFIED,
+    )
+    return Employer.objects.create(**{
+        "user": user, "post": "-", "phone": "-", "work_phone": "-", "authorization": "blobs/aa/a.pdf",
+        "company_name": f"Организация {i}", "company_name_alt": f"Организация {i}",
+        "company_scope": "IT", "company_logo": "blobs/aa/logo.png", "company_TIN": f"{i:010}",
+        "company_description": "-", "company_count_employees": "до 100", "company_site": "https://example.com",
+        "company_social": [], "has_pwd": False, "pwd_professions": [], "excursions": "-",
+        "excursion_employee_id": "-", "excursion_employee_full_name": "-", "excursion_employee_post": "-",
+        "professions_required": [], "professions_not_required": [], "professional_competencies": [], "adaptation_stages": "-",
+        "educational_institution": [], "educational_courses": [], "soft_skils": [],
+        **kwargs,
+    })
+
+
+class EmployerFacetsTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        create_employer(1, company_avg_wage=30000, company_region=["Москва"], company_professions=["Инженер"])
+        create_employer(2, company_avg_wage=50000, company_region=["Москва", "Казань"], company_professions=[])
+        create_employer(3, company_avg_wage=50000, company_region=["Казань"], company_professions=["Инженер", "Юрист"])
+        create_employer(4, company_avg_wage=80000, company_region=[], company_professions=["Юрист"])
+
+    def test_counts_match_filtered_lists(self):
+        facets = self.client.get("/api/auth/employers/facets/").data
+        self.assertEqual(
+            {option["value"]: option["count"] for option in facets["wage"]},
+            {"30000": 4, "50000": 3, "80000": 1},
+        )
+        for name in ("wage", "region", "professions"):
+            self.assertTrue(facets[name])
+            for option in facets[name]:
+                response = self.client.get("/api/auth/employers/", {name: option["value"]})
+                self.assertEqual(response.data["count"], option["count"], (name, option))
@@ -0,0 +1,53 @@
+import os
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db.models.fields.files import FieldFile
+from django.test import SimpleTestCase, override_settings
+from PIL import Image
+
+from account.images import ImageSetField, derivative_name, get_widths, make_derivatives
+from account.models import Employer
+
+
+class DerivativesTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        os.makedirs(os.path.join(media_root, "blobs", "ab"))
+        self.media_root = media_root
+
+    def create_image(self, name, width):
+        Image.new("RGB", (width, width // 2)).save(os.path.join(self.media_root, name))
+        return FieldFile(None, Employer._meta.get_field("company_logo"), name)
+
+    def test_widths(self):
+        self.assertEqual(get_widths(50), [50])
+        self.assertEqual(get_widths(100), [64, 100])
+        self.assertEqual(get_widths(512), [64, 128, 256, 512])
+        self.assertEqual(get_widths(2000), [64, 128, 256, 512])
+
+    def test_small_image_declares_real_widths(self):
+        file = self.create_image("blobs/ab/logo.png", 100)
+        self.assertIsNone(ImageSetField().to_representation(file))
+
+        make_derivatives(file.name)
+        cache.clear()
+
+        representation = ImageSetField().to_representation(file)
+        self.assertEqual(
+            representation["srcset"],
+            f"/media/{derivative_name(file.name, 64)} 64w, /media/{derivative_name(file.name, 100)} 100w",
+        )
+        self.assertEqual(representation["src"], f"/media/{derivative_name(file.name, 100)}")
+        for width, expected in ((64, 64), (100, 100)):
+            with Image.open(default_storage.path(derivative_name(file.name, width))) as image:
+                self.assertEqual(image.width, expected)
+        self.assertFalse(default_storage.exists(derivative_name(file.name, 128)))
+        self.assertFalse(default_storage.exists(derivative_name(file.name, 512)))
@@ -0,0 +1,34 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from account import matching
+from account.models import Recommendation
+
+KIND = Recommendation.Kind.PROFESSIONAL
+
+
+class GetMatcherTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(matching._matchers.clear)
+
+    def build(self, kind, version):
+        return matching.Matcher(kind, version, [], {})
+
+    def test_serves_outdated_matcher_while_rebuilding(self):
+        with mock.patch("account.matching.build_matcher", side_effect=self.build) as build_matcher:
+            old = matching.get_matcher(KIND)
+            self.assertIs(matching.get_matcher(KIND), old)
+
+            matching.bump_version(KIND)
+            self.assertIs(matching.get_matcher(KIND), old)
+            thread = matching._rebuilds.get(KIND)
+            if thread is not None:
+                thread.join()
+
+            new = matching.get_matcher(KIND)
+            self.assertIsNot(new, old)
+            self.assertEqual(new.version, matching.get_version(KIND))
+            self.assertEqual(build_matcher.call_count, 2)
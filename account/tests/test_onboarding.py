@@ -0,0 +1,77 @@
+from django.test import TestCase
+
+from helper.catalogue import bump_version
+from helper.models import Mission, StudentMission, StudentSkill
+from account.models import Student, StudentDashboard, Teacher, TeacherStudent, User
+from account.onboarding import copy_rows, register_students
+
+ROW = {
+    "last_name": "Иванов",
+    "first_name": "Иван",
+    "region": "Москва",
+    "locality": "Москва",
+    "phone": "+79990000000",
+    "school": "Школа №1",
+    "school_class": "9А",
+    "birth_date": "2008-01-01",
+}
+
+
+class RegisterStudentsTest(TestCase):
+    def setUp(self):
+        Mission.objects.create(coins=10, order=1)
+        Mission.objects.create(coins=20, order=2)
+        bump_version()
+
+    def test_copies_missions_and_skills(self):
+        rows = [{**ROW, "email": f"student{i}@example.com"} for i in range(3)]
+        report = register_students(rows)
+
+        self.assertEqual(report["created"], 3)
+        self.assertEqual(report["rejected"], [])
+        missions = StudentMission.objects.filter(student__user__email="student0@example.com")
+        self.assertEqual(missions.count(), 2)
+        self.assertEqual(set(missions.values_list("reaction", flat=True)), {""})
+        self.assertEqual(missions.get(mission__order=1).is_unlocked, True)
+        self.assertEqual(missions.get(mission__order=2).is_unlocked, False)
+        self.assertEqual(StudentSkill.objects.count(), 3 * len(StudentSkill.Object.names))
+        self.assertEqual(StudentDashboard.objects.count(), 3)
+
+    def test_links_teacher(self):
+        user = User.objects.create_user(email="teacher@example.com", password="x", type=User.Types.TEACHER)
+        teacher = Teacher.objects.create(
+            user=user, post="Учитель", region="Москва", locality="Москва",
+            phone="+79990000001", count_members=1, school_name="Школа №1",
+        )
+        register_students([{**ROW, "email": "student@example.com"}], teacher=teacher)
+
+        student = Student._base_manager.get(user__email="student@example.com")
+        self.assertTrue(TeacherStudent.objects.filter(teacher=teacher, student=student).exists())
+
+    def test_rejects_existing_email(self):
+        register_students([{**ROW, "email": "student@example.com"}])
+        report = register_students([{**ROW, "email": "student@example.com"}])
+
+        self.assertEqual(report["created"], 0)
+        self.assertEqual(len(report["rejected"]), 1)
+
+
+class CopyRowsTest(TestCase):
+    def test_keeps_empty_strings_and_nulls(self):
+        mission = Mission.objects.create(coins=10, order=1)
+        user = User.objects.create_user(email="student@example.com", password="x", type=User.Types.STUDENT)
+        student = Student._base_manager.create(
+            user=user, region="Москва", locality="Москва", phone="+79990000000",
+            school="Школа №1", school_class="9А", birth_date="2008-01-01",
+        )
+        StudentMission.objects.all().delete()
+
+        copy_rows(
+            StudentMission,
+            ("mission_id", "student_id", "stage", "answers", "reaction", "is_complete", "is_unlocked"),
+            [(mission.pk, student.pk, 0, {"a": ["b"]}, "", False, True)],
+        )
+
+        row = StudentMission.objects.get()
+        self.assertEqual(row.reaction, "")
+        self.assertEqual(row.answers, {"a": ["b"]})
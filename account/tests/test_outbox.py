@@ -0,0 +1,126 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from account.models import OutboxEmail
+from account.outbox import RETRY_DELAY, send_pending
+
+LOCMEM = "django.core.mail.backends.locmem.EmailBackend"
+
+
+class FailingBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError("SMTP is down")
+
+
+def queue(count=1):
+    connection = mail.get_connection("account.outbox.OutboxEmailBackend")
+    messages = [
+        mail.EmailMessage(f"Письмо {i}", "Текст", "noreply@example.com", [f"user{i}@example.com"])
+        for i in range(count)
+    ]
+    connection.send_messages(messages)
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM, OUTBOX_EMAIL_BACKEND=LOCMEM)
+class OutboxEmailBackendTest(TestCase):
+    def test_queues_instead_of_sending(self):
+        message = mail.EmailMultiAlternatives(
+            "Тема", "Текст", "noreply@example.com", ["user@example.com"],
+            cc=["cc@example.com"], headers={"X-Tag": "test"},
+        )
+        message.attach_alternative("<p>Текст</p>", "text/html")
+        mail.get_connection("account.outbox.OutboxEmailBackend").send_messages([message])
+
+        self.assertEqual(mail.outbox, [])
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.status, OutboxEmail.Status.PENDING)
+        self.assertEqual(email.to, ["user@example.com"])
+        self.assertEqual(email.cc, ["cc@example.com"])
+        self.assertEqual(email.headers, {"X-Tag": "test"})
+        self.assertEqual(email.alternatives, [["<p>Текст</p>", "text/html"]])
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM, OUTBOX_EMAIL_BACKEND=LOCMEM)
+class SendPendingTest(TestCase):
+    def test_sends_batch_over_one_connection(self):
+        queue(3)
+        with mock.patch("account.outbox.mail.get_connection", wraps=mail.get_connection) as get_connection:
+            self.assertEqual(send_pending(), (3, 0))
+
+        get_connection.assert_called_once_with(LOCMEM)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(len({id(message.connection) for message in mail.outbox}), 1)
+        self.assertFalse(OutboxEmail.objects.exclude(status=OutboxEmail.Status.SENT).exists())
+
+    def test_skips_emails_not_due(self):
+        queue()
+        OutboxEmail.objects.update(next_attempt_at=timezone.now() + timedelta(minutes=1))
+
+        self.assertEqual(send_pending(), (0, 0))
+        self.assertEqual(mail.outbox, [])
+
+    @override_settings(OUTBOX_EMAIL_BACKEND="account.tests.test_outbox.FailingBackend")
+    def test_retries_with_backoff(self):
+        queue()
+        now = timezone.now()
+
+        self.assertEqual(send_pending(), (0, 1))
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.status, OutboxEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.last_error, "SMTP is down")
+        self.assertGreaterEqual(email.next_attempt_at, now + timedelta(seconds=RETRY_DELAY))
+
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+        send_pending()
+        email.refresh_from_db()
+        self.assertEqual(email.attempts, 2)
+        self.assertGreaterEqual(email.next_attempt_at, now + timedelta(seconds=2 * RETRY_DELAY))
+
+    @override_settings(OUTBOX_EMAIL_BACKEND="account.tests.test_outbox.FailingBackend")
+    def test_fails_after_max_attempts(self):
+        queue()
+        OutboxEmail.objects.update(attempts=2)
+
+        send_pending(max_attempts=3)
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.status, OutboxEmail.Status.FAILED)
+        self.assertEqual(send_pending(max_attempts=3), (0, 0))
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM, OUTBOX_EMAIL_BACKEND=LOCMEM)
+class SkipLockedTest(TransactionTestCase):
+    def test_skips_emails_claimed_by_another_worker(self):
+        queue(2)
+        claimed = OutboxEmail.objects.order_by("pk").first()
+        locked = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            try:
+                with transaction.atomic():
+                    OutboxEmail.objects.select_for_update().get(pk=claimed.pk)
+                    locked.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        try:
+            self.assertTrue(locked.wait(10))
+            self.assertEqual(send_pending(), (1, 0))
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertEqual([message.to for message in mail.outbox], [["user1@example.com"]])
+        claimed.refresh_from_db()
+        self.assertEqual(claimed.status, OutboxEmail.Status.PENDING)
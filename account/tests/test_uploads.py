@@ -0,0 +1,79 @@
+import base64
+import io
+import os
+import shutil
+import tempfile
+
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from account.models import Upload, UploadSession, User
+from account.uploads import UploadError, get_part_path, write_chunk
+
+
+def png():
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 32)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class UploadCompleteTest(APITestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.user = User.objects.create_user(email="college@example.com", password="x", type=User.Types.COLLEGE)
+        self.client.force_authenticate(self.user)
+        self.data = png()
+
+    def create_session(self):
+        metadata = ",".join(
+            f"{key} {base64.b64encode(value.encode()).decode()}"
+            for key, value in (("filename", "photo.png"), ("type", UploadSession.Types.IMAGES))
+        )
+        response = self.client.post(
+            "/api/auth/uploads/", HTTP_UPLOAD_LENGTH=str(len(self.data)), HTTP_UPLOAD_METADATA=metadata,
+        )
+        self.assertEqual(response.status_code, 201)
+        return UploadSession.objects.get(pk=response.data["id"])
+
+    def patch(self, session, offset, data):
+        return self.client.generic(
+            "PATCH", f"/api/auth/uploads/{session.pk}/", data,
+            content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_completes_upload(self):
+        session = self.create_session()
+        response = self.patch(session, 0, self.data)
+
+        self.assertEqual(response.status_code, 204)
+        session.refresh_from_db()
+        self.assertIsNotNone(session.upload_id)
+        self.assertFalse(os.path.exists(get_part_path(session)))
+
+    def test_repeated_completion_keeps_upload(self):
+        session = self.create_session()
+        # Loaded before the first request completed the upload
+        stale = UploadSession.objects.get(pk=session.pk)
+        stale.offset = len(self.data)
+        self.patch(session, 0, self.data)
+
+        self.assertEqual(write_chunk(stale, io.BytesIO(), len(self.data), 0), len(self.data))
+        session.refresh_from_db()
+        self.assertEqual(stale.upload_id, session.upload_id)
+        self.assertEqual(Upload.objects.count(), 1)
+
+    def test_missing_part_is_not_corrupt(self):
+        session = self.create_session()
+        UploadSession.objects.filter(pk=session.pk).update(offset=len(self.data))
+        session.refresh_from_db()
+
+        with self.assertRaises(UploadError) as context:
+            write_chunk(session, io.BytesIO(), len(self.data), 0)
+        self.assertEqual(context.exception.status, 404)
+        self.assertTrue(UploadSession.objects.filter(pk=session.pk).exists())
@@ -0,0 +1,28 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from helper.catalogue import bump_version, get_catalogue
+from helper.models import Mission, StudentMission
+from account.models import Student
+from account.onboarding import register_students
+from .test_onboarding import ROW
+
+
+class StudentMissionsTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.mission = Mission.objects.create(coins=10, order=2)
+        bump_version()
+        register_students([{**ROW, "email": "student@example.com"}])
+        self.student = Student._base_manager.select_related("user").get(user__email="student@example.com")
+        self.client.force_authenticate(self.student.user)
+
+    def test_lists_missions_missing_from_catalogue(self):
+        get_catalogue()
+        # Created by another process, which bumps the version after commit
+        mission = Mission.objects.create(coins=5, order=1)
+        StudentMission.objects.create(student=self.student, mission=mission)
+
+        response = self.client.get(f"/api/auth/students/{self.student.pk}/missions/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["mission"] for row in response.data], [mission.pk, self.mission.pk])
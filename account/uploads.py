@@ -0,0 +1,193 @@
+import base64
+import binascii
+import fcntl
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image
+
+from .models import Upload, UploadSession
+
+PARTIAL_DIR = "uploads"
+READ_SIZE = 64 * 1024
+# Bytes needed to recognize every allowed type
+HEAD_SIZE = 12
+TUS_VERSION = "1.0.0"
+
+
+class UploadError(Exception):
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+def detect_type(head):
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def parse_metadata(header):
+    """
+    Parse a tus ``Upload-Metadata`` header: comma separated ``key value``
+    pairs with base64 encoded values.
+    """
+    metadata = {}
+    for pair in filter(None, (pair.strip() for pair in header.split(","))):
+        key, _, value = pair.partition(" ")
+        try:
+            metadata[key] = base64.b64decode(value, validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError):
+            raise UploadError(f"Неверное значение метаданных {key}", 400)
+    return metadata
+
+
+def get_part_path(session):
+    path = os.path.join(settings.MEDIA_ROOT, PARTIAL_DIR, f"{session.pk}.part")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+class PartFile(File):
+    """
+    Finished part file, moved into the storage instead of being copied.
+    """
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def write_chunk(session, stream, offset, length):
+    """
+    Append ``length`` bytes of ``stream`` at ``offset`` of the session part
+    file, ``READ_SIZE`` bytes at a time. The file type is checked as soon
+    as its first bytes arrived. Returns the new offset.
+    """
+    if offset != session.offset:
+        raise UploadError("Смещение не совпадает с полученными данными", 409)
+    if length > settings.UPLOAD_MAX_CHUNK:
+        raise UploadError("Слишком большая часть файла", 413)
+    if offset + length > session.size:
+        raise UploadError("Данные превышают заявленный размер файла", 413)
+    if offset == session.size:
+        # Every byte was received by a request that failed or is still
+        # completing the upload
+        complete(session)
+        return session.offset
+
+    with open(get_part_path(session), "a+b") as file:
+        try:
+            # Another request is writing this upload
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadError("Загрузка уже выполняется", 423)
+
+        session.refresh_from_db(fields=("offset",))
+        if offset != session.offset:
+            raise UploadError("Смещение не совпадает с полученными данными", 409)
+
+        # Drop bytes of an interrupted request that were not committed
+        file.truncate(offset)
+        file.seek(offset)
+        remaining = length
+        while remaining:
+            data = stream.read(min(READ_SIZE, remaining))
+            if not data:
+                break
+            file.write(data)
+            remaining -= len(data)
+        file.flush()
+        os.fsync(file.fileno())
+        written = file.tell()
+
+        if offset < HEAD_SIZE <= written or written == session.size:
+            file.seek(0)
+            if detect_type(file.read(HEAD_SIZE)) is None:
+                discard(session)
+                raise UploadError("Допустимы только изображения JPEG, PNG и WebP", 415)
+
+        UploadSession.objects.filter(pk=session.pk).update(offset=written, updated_at=timezone.now())
+        session.offset = written
+
+        if session.offset == session.size:
+            complete(session)
+    return session.offset
+
+
+def is_image(path):
+    try:
+        with Image.open(path) as image:
+            image.verify()
+    except FileNotFoundError:
+        raise
+    except Exception:
+        return False
+    return True
+
+
+def complete(session):
+    """
+    Check the finished image and attach it to the user as an ``Upload``.
+    The session row is locked first, so an upload completed by another
+    request meanwhile is returned as is.
+    """
+    path = get_part_path(session)
+    with transaction.atomic():
+        try:
+            current = UploadSession.objects.select_for_update().get(pk=session.pk)
+        except UploadSession.DoesNotExist:
+            raise UploadError("Загрузка не найдена", 404)
+        if current.upload_id is not None:
+            session.upload_id = current.upload_id
+            return current.upload
+
+        try:
+            valid = is_image(path)
+        except FileNotFoundError:
+            raise UploadError("Загруженные данные не найдены", 404)
+        if valid:
+            upload = Upload(user_id=session.user_id, type=session.type)
+            with open(path, "rb") as file:
+                upload.file.save(session.filename, PartFile(file), save=False)
+            upload.save()
+            session.upload = upload
+            session.save(update_fields=("upload", "updated_at"))
+
+    if not valid:
+        discard(session)
+        raise UploadError("Файл поврежден", 415)
+    # The part file was not moved when the same image is already stored
+    if os.path.exists(path):
+        os.remove(path)
+    return upload
+
+
+def discard(session):
+    path = get_part_path(session)
+    if os.path.exists(path):
+        os.remove(path)
+    session.delete()
+
+
+def clean_expired():
+    """
+    Delete unfinished uploads idle for ``UPLOAD_EXPIRE`` seconds.
+    Returns the number of deleted uploads.
+    """
+    expired = UploadSession.objects.filter(
+        upload__isnull=True,
+        updated_at__lt=timezone.now() - timedelta(seconds=settings.UPLOAD_EXPIRE),
+    )
+    count = 0
+    for session in expired.iterator():
+        discard(session)
+        count += 1
+    return count
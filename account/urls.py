@@ -12,6 +12,7 @@ router.register(r"colleges", CollegeViewset, basename="colleges")
 router.register(r"agencies", EmploymentAgencyViewset, basename="agencies")
 router.register(r"teachers", TeacherViewset, basename="teachers")
 router.register(r"students", StudentViewset, basename="students")
+router.register(r"uploads", UploadViewset, basename="uploads")
 
 urlpatterns = [
 ] + router.urls
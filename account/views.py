@@ -1,14 +1,21 @@
+import os
+
+from django.conf import settings
+from django.db.models import Count, Max, Q
+from django.urls import reverse
+
 from rest_framework import viewsets
 from rest_framework import status
 from rest_framework.generics import CreateAPIView, get_object_or_404
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
 
 from djoser.permissions import CurrentUserOrAdmin
 from djoser.signals import user_registered
 
+from helper.catalogue import get_catalogue, to_int
+from helper.models import StudentMission, StudentEvent
 from helper.serializers import StudentMissionSerializer, StudentMissionCreateSerializer
 from events.serializers import EventStudentSerializer
 from events.models import Event
@@ -20,7 +27,19 @@ from .permissions import (
     IsCollege,
     IsEmploymentAgency,
     IsStudent,
+    IsTeacher,
 )
+from .mixins import EagerLoadingViewMixin
+from .pagination import CataloguePagination
+from .sampling import random_sample
+from .response_cache import cache_response
+from .conditional import conditional, object_version, collection_version
+from .facets import facet_counts, VALUE, MIN, ARRAY, FLAG
+from .onboarding import register_students
+from .dashboard import refresh_dashboards
+from .matching import match_students
+from .profiles import invalidate_profiles
+from .uploads import TUS_VERSION, UploadError, discard, parse_metadata, write_chunk
 from .models import (
     User,
     Employer,
@@ -32,8 +51,11 @@ from .models import (
     Student,
     StudentEmployer,
     StudentProfessional,
+    StudentDashboard,
     Upload,
-    Callback
+    UploadSession,
+    Callback,
+    Recommendation
 )
 from .serializers import (
     UserSerializer,
@@ -53,19 +75,33 @@ from .serializers import (
     EmploymentAgencySerializer,
     TeacherSerializer,
     StudentSerializer,
+    StudentDashboardSerializer,
     StudentEmployerSerializer,
     StudentProfessionalSerializer,
+    UploadSessionSerializer,
     CallbackSerializer,
 )
 
 
-class EmployerViewset(viewsets.GenericViewSet):
+class EmployerViewset(EagerLoadingViewMixin, viewsets.GenericViewSet):
     queryset = Employer.objects.all()
     serializer_class = EmployerSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = CataloguePagination
+    # Query param, field or condition and kind of the facets counted for the filters
+    facet_fields = (
+        ("video", Q(company_video__isnull=False), FLAG),
+        ("training", Q(has_corporate_training=True), FLAG),
+        ("pwd", Q(has_pwd=True), FLAG),
+        ("adaptation", Q(has_adaptation=True), FLAG),
+        ("type", "company_count_employees", VALUE),
+        ("wage", "company_avg_wage", MIN),
+        ("scope", "company_scope", VALUE),
+        ("region", "company_region", ARRAY),
+        ("professions", "company_professions", ARRAY),
+    )
 
     def get_queryset(self):
-        queryset = Employer.objects.filter(user__verification=User.Verifiaction.VERIFIED)
+        queryset = Employer.objects.filter(user__verification=User.Verifiaction.VERIFIED).order_by("user_id")
 
         if "video" in self.request.query_params.keys():
             queryset = queryset.filter(company_video__isnull=False)
@@ -110,7 +146,7 @@ class EmployerViewset(viewsets.GenericViewSet):
             return EmployerSerializer
 
     def get_object(self):
-        queryset = self.queryset
+        queryset = self.filter_queryset(self.queryset)
         # Perform the lookup filtering.
         lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
 
@@ -166,14 +202,17 @@ class EmployerViewset(viewsets.GenericViewSet):
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @conditional(collection_version("employers"))
+    @cache_response("employers")
     def list(self, request, *args, **kwargs):
         try:
-            employers = self.get_queryset()
+            employers = self.filter_queryset(self.get_queryset())
         except Employer.DoesNotExist:
             return Response("Работодатели не найдены", status=status.HTTP_404_NOT_FOUND)
 
-        serializer = self.serializer_class(employers, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(employers)
+        serializer = self.serializer_class(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(
         detail=True,
@@ -181,6 +220,7 @@ class EmployerViewset(viewsets.GenericViewSet):
         url_name="detail",
         serializer_class=EmployerDetailSerializer,
     )
+    @conditional(object_version(Employer, "updated_at", "user__updated_at"))
     def qdetail(self, request, pk=None):
         employer = self.get_object()
         serializer = self.serializer_class(employer)
@@ -190,18 +230,43 @@ class EmployerViewset(viewsets.GenericViewSet):
         detail=False,
     )
     def random(self, request):
-        employers = self.queryset.filter(user__verification=User.Verifiaction.VERIFIED).order_by("?")[:3]
+        employers = self.filter_queryset(
+            self.queryset.filter(user__verification=User.Verifiaction.VERIFIED)
+        )
+        employers = random_sample(employers, 3, key="random:employers")
         serializer = self.serializer_class(employers, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+    )
+    @conditional(collection_version("employers"))
+    @cache_response("employers")
+    def facets(self, request):
+        counts = facet_counts(self.get_queryset(), self.facet_fields)
+        return Response(counts, status=status.HTTP_200_OK)
+
 
-class ProfessionalViewset(viewsets.GenericViewSet):
+class ProfessionalViewset(EagerLoadingViewMixin, viewsets.GenericViewSet):
     queryset = Professional.objects.all()
     serializer_class = ProfessionalSerialzier
-    pagination_class = PageNumberPagination
+    pagination_class = CataloguePagination
+    # Query param, field or condition and kind of the facets counted for the filters
+    facet_fields = (
+        ("scope", "scope", ARRAY),
+        ("region", "region", VALUE),
+        ("timetable", "timetable", VALUE),
+        ("employment", "employment_type", VALUE),
+        ("trips", "business_trips", VALUE),
+        ("pwd", Q(has_pwd=True), FLAG),
+        ("wage", "wage", VALUE),
+        ("skils", "soft_skils", ARRAY),
+        ("hobbies", "profession_hobbies", ARRAY),
+        ("school-subjects", "favorite_school_subjects", ARRAY),
+    )
 
     def get_queryset(self):
-        queryset = Professional.objects.filter(user__verification=User.Verifiaction.VERIFIED)
+        queryset = Professional.objects.filter(user__verification=User.Verifiaction.VERIFIED).order_by("user_id")
 
         scope = self.request.query_params.get("scope")
         if scope:
@@ -255,7 +320,7 @@ class ProfessionalViewset(viewsets.GenericViewSet):
             return ProfessionalSerialzier
 
     def get_object(self):
-        queryset = self.queryset
+        queryset = self.filter_queryset(self.queryset)
         # Perform the lookup filtering.
         lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
 
@@ -304,6 +369,7 @@ class ProfessionalViewset(viewsets.GenericViewSet):
         user_serializer.update(request.user, user_serializer.validated_data)
         serializer.save(user_id=request.user.id)
         Upload.objects.bulk_create(bulk_inserts)
+        invalidate_profiles(request.user.id)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def update(self, request, pk=None):
@@ -316,14 +382,17 @@ class ProfessionalViewset(viewsets.GenericViewSet):
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @conditional(collection_version("professionals"))
+    @cache_response("professionals")
     def list(self, request, *args, **kwargs):
         try:
-            professionals = self.get_queryset()
+            professionals = self.filter_queryset(self.get_queryset())
         except Professional.DoesNotExist:
             return Response("Профессионалы не найдены", status=status.HTTP_404_NOT_FOUND)
 
-        serializer = self.serializer_class(professionals, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(professionals)
+        serializer = self.serializer_class(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(
         detail=True,
@@ -331,16 +400,40 @@ class ProfessionalViewset(viewsets.GenericViewSet):
         url_name="detail",
         serializer_class=ProfessionalDetailSerializer,
     )
+    @conditional(object_version(
+        Professional, "updated_at", "user__updated_at",
+        uploads_count=Count("user__uploads"), uploads_last=Max("user__uploads__id"),
+    ))
     def qdetail(self, request, pk=None):
         professional = self.get_object()
         serializer = self.serializer_class(professional)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+    )
+    def random(self, request):
+        professionals = self.filter_queryset(
+            self.queryset.filter(user__verification=User.Verifiaction.VERIFIED)
+        )
+        professionals = random_sample(professionals, 3, key="random:professionals")
+        serializer = self.serializer_class(professionals, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
-class NPOViewset(viewsets.GenericViewSet):
+    @action(
+        detail=False,
+    )
+    @conditional(collection_version("professionals"))
+    @cache_response("professionals")
+    def facets(self, request):
+        counts = facet_counts(self.get_queryset(), self.facet_fields)
+        return Response(counts, status=status.HTTP_200_OK)
+
+
+class NPOViewset(EagerLoadingViewMixin, viewsets.GenericViewSet):
     queryset = NPO.objects.all()
     serializer_class = NPOSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = CataloguePagination
 
     def get_serializer_class(self):
         if self.action in ["create", "update"]:
@@ -387,14 +480,17 @@ class NPOViewset(viewsets.GenericViewSet):
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @conditional(collection_version("npo"))
+    @cache_response("npo")
     def list(self, request, *args, **kwargs):
         try:
-            npo = self.queryset.all()
+            npo = self.filter_queryset(self.get_queryset()).order_by("user_id")
         except NPO.DoesNotExist:
             return Response("Работодатели не найдены", status=status.HTTP_404_NOT_FOUND)
 
-        serializer = self.serializer_class(npo, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(npo)
+        serializer = self.serializer_class(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(
         detail=True,
@@ -402,16 +498,17 @@ class NPOViewset(viewsets.GenericViewSet):
         url_name="detail",
         serializer_class=NPODetailSerializer,
     )
+    @conditional(object_version(NPO, "updated_at", "user__updated_at"))
     def qdetail(self, request, pk=None):
         npo = self.get_object()
         serializer = self.serializer_class(npo)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class CollegeViewset(viewsets.GenericViewSet):
+class CollegeViewset(EagerLoadingViewMixin, viewsets.GenericViewSet):
     queryset = College.objects.all()
     serializer_class = CollegeSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = CataloguePagination
 
     def get_serializer_class(self):
         if self.action in ["create", "update"]:
@@ -446,6 +543,7 @@ class CollegeViewset(viewsets.GenericViewSet):
         user_serializer.update(request.user, user_serializer.validated_data)
         serializer.save(user_id=request.user.id)
         Upload.objects.bulk_create(bulk_inserts)
+        invalidate_profiles(request.user.id)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def update(self, request, pk=None):
@@ -524,7 +622,7 @@ class TeacherViewset(viewsets.GenericViewSet):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class StudentViewset(viewsets.GenericViewSet):
+class StudentViewset(EagerLoadingViewMixin, viewsets.GenericViewSet):
     queryset = Student.objects.all()
     serializer_class = StudentSerializer
 
@@ -533,6 +631,8 @@ class StudentViewset(viewsets.GenericViewSet):
             self.permission_classes = [AllowAny]
         elif self.action == "update":
             self.permission_classes = [CurrentUserOrAdmin]
+        elif self.action in ("bulk", "class_matches"):
+            self.permission_classes = [IsAuthenticated, IsTeacher | IsAdminUser]
         else:
             self.permission_classes = [IsAuthenticated]
         return super().get_permissions()
@@ -594,6 +694,44 @@ class StudentViewset(viewsets.GenericViewSet):
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(
+        methods=["post"],
+        detail=False,
+        url_path="bulk",
+        url_name="bulk",
+    )
+    def bulk(self, request):
+        rows = request.data
+        if not isinstance(rows, list):
+            rows = request.data.get("students", [])
+
+        teacher = None
+        if request.user.type == User.Types.TEACHER:
+            try:
+                teacher = Teacher.objects.get(pk=request.user.pk)
+            except Teacher.DoesNotExist:
+                return Response("Учитель не найден", status=status.HTTP_404_NOT_FOUND)
+
+        report = register_students(rows, teacher=teacher)
+        return Response(report, status=status.HTTP_201_CREATED)
+
+    @action(
+        detail=True,
+        url_path="dashboard",
+        url_name="dashboard",
+        serializer_class=StudentDashboardSerializer
+    )
+    def dashboard(self, request, pk=None):
+        try:
+            dashboard = StudentDashboard.objects.get(pk=to_int(pk))
+        except StudentDashboard.DoesNotExist:
+            # Students registered before the dashboards existed
+            student = self.get_object()
+            refresh_dashboards(student.pk)
+            dashboard = StudentDashboard.objects.get(pk=student.pk)
+        serializer = self.serializer_class(dashboard)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @action(
         detail=True,
         url_path="missions",
@@ -602,7 +740,13 @@ class StudentViewset(viewsets.GenericViewSet):
     )
     def missions(self, request, pk=None):
         student = self.get_object()
-        serializer = self.serializer_class(student.missions.order_by("mission__order"), many=True)
+        catalogue = get_catalogue()
+        # Missions created by another process may not be in the catalogue yet
+        missions = sorted(
+            student.missions.all(),
+            key=lambda obj: (catalogue.get(obj.mission_id) or obj.mission).order,
+        )
+        serializer = self.serializer_class(missions, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(
@@ -614,8 +758,12 @@ class StudentViewset(viewsets.GenericViewSet):
     )
     def mission(self, request, pk=None, mission_id=None):
         student = self.get_object()
+        catalogue_mission = get_catalogue().get_by_order(mission_id)
+        if catalogue_mission is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
         try:
-            mission = student.missions.get(mission__order=mission_id)
+            mission = student.missions.get(mission_id=catalogue_mission.pk)
         except StudentMission.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
@@ -639,12 +787,13 @@ class StudentViewset(viewsets.GenericViewSet):
     def professionals(self, request, pk=None):
         student = self.get_object()
         skill = student.skills.order_by("-points").first()
-        scope = SkillScope.objects.get(object=skill.object).scope
 
         professionals = Professional.objects.filter(
-            scope__contained_by=scope,
-            whitelist=True
-        )[:6]
+            user__recommendations__kind=Recommendation.Kind.PROFESSIONAL,
+            user__recommendations__object=skill.object,
+            user__recommendations__region="",
+        ).order_by("user__recommendations__rank")
+        professionals = self.serializer_class.setup_eager_loading(professionals)[:6]
         serializer = self.serializer_class(professionals, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -657,16 +806,75 @@ class StudentViewset(viewsets.GenericViewSet):
     def employers(self, request, pk=None):
         student = self.get_object()
         skill = student.skills.order_by("-points").first()
-        scope = SkillScope.objects.get(object=skill.object).scope
 
         employers = Employer.objects.filter(
-            company_region__contained_by=[student.region],
-            company_scope__in=scope,
-            whitelist=True
-        )[:6]
+            user__recommendations__kind=Recommendation.Kind.EMPLOYER,
+            user__recommendations__object=skill.object,
+            user__recommendations__region=student.region,
+        ).order_by("user__recommendations__rank")
+        employers = self.serializer_class.setup_eager_loading(employers)[:6]
         serializer = self.serializer_class(employers, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    match_types = {
+        "professionals": (Recommendation.Kind.PROFESSIONAL, Professional, StudentProfessionalSerializer),
+        "employers": (Recommendation.Kind.EMPLOYER, Employer, StudentEmployerSerializer),
+    }
+
+    def get_match_params(self, request):
+        type = request.query_params.get("type", "professionals")
+        if type not in self.match_types:
+            return None, None
+        count = min(max(to_int(request.query_params.get("count")) or 6, 1), 50)
+        return self.match_types[type], count
+
+    @action(
+        detail=True,
+        url_path="matches",
+        url_name="matches",
+    )
+    def matches(self, request, pk=None):
+        student = self.get_object()
+        match_type, count = self.get_match_params(request)
+        if match_type is None:
+            return Response("Неизвестный тип", status=status.HTTP_400_BAD_REQUEST)
+        kind, model, serializer_class = match_type
+
+        student = Student.objects.prefetch_related("skills").get(pk=student.pk)
+        scores = dict(match_students([student], kind, count)[student.pk])
+        profiles = serializer_class.setup_eager_loading(model.objects.filter(pk__in=scores))
+        profiles = sorted(profiles, key=lambda profile: -scores[profile.pk])
+
+        data = serializer_class(profiles, many=True).data
+        for item, profile in zip(data, profiles):
+            item["score"] = scores[profile.pk]
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        url_path="class-matches",
+        url_name="class-matches",
+    )
+    def class_matches(self, request):
+        match_type, count = self.get_match_params(request)
+        if match_type is None:
+            return Response("Неизвестный тип", status=status.HTTP_400_BAD_REQUEST)
+        kind = match_type[0]
+
+        students = Student.objects.prefetch_related("skills")
+        if request.user.type == User.Types.TEACHER:
+            students = students.filter(teacherstudent__teacher_id=request.user.pk)
+        else:
+            teacher_id = to_int(request.query_params.get("teacher"))
+            students = students.filter(teacherstudent__teacher_id=teacher_id)
+
+        matches = match_students(list(students), kind, count)
+        data = {
+            pk: [{"id": id, "score": score} for id, score in student_matches]
+            for pk, student_matches in matches.items()
+        }
+        return Response(data, status=status.HTTP_200_OK)
+
     @action(
         methods=["get", "post"],
         detail=True,
@@ -687,6 +895,87 @@ class StudentViewset(viewsets.GenericViewSet):
             return Response(status=status.HTTP_201_CREATED)
 
 
+class UploadViewset(viewsets.GenericViewSet):
+    """
+    Resumable uploads of workplace and college photos following the tus
+    1.0 core protocol: ``POST`` with ``Upload-Length`` and ``Upload-Metadata``
+    (``filename``, ``type``) creates an upload, ``HEAD`` returns its
+    ``Upload-Offset``, ``PATCH`` with ``Upload-Offset`` appends a chunk.
+    Chunks are streamed to disk, the finished file becomes an ``Upload``
+    of the user.
+    """
+    serializer_class = UploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return UploadSession.objects.filter(user=self.request.user)
+
+    def tus_response(self, session, data=None, status=status.HTTP_204_NO_CONTENT, headers=None):
+        headers = {
+            "Tus-Resumable": TUS_VERSION,
+            "Upload-Offset": str(session.offset),
+            "Upload-Length": str(session.size),
+            "Cache-Control": "no-store",
+            **(headers or {}),
+        }
+        return Response(data, status=status, headers=headers)
+
+    def error_response(self, message, status):
+        return Response({"detail": message}, status=status, headers={"Tus-Resumable": TUS_VERSION})
+
+    def create(self, request, *args, **kwargs):
+        length = to_int(request.headers.get("Upload-Length"))
+        if length is None or length <= 0:
+            return self.error_response("Не указан размер файла", status.HTTP_400_BAD_REQUEST)
+        if length > settings.UPLOAD_MAX_SIZE:
+            return self.error_response("Слишком большой файл", status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        try:
+            metadata = parse_metadata(request.headers.get("Upload-Metadata", ""))
+        except UploadError as e:
+            return self.error_response(str(e), e.status)
+        filename = os.path.basename(metadata.get("filename", ""))
+        if not filename or metadata.get("type") not in UploadSession.Types.values:
+            return self.error_response("Не указано имя или тип файла", status.HTTP_400_BAD_REQUEST)
+
+        session = UploadSession.objects.create(
+            user=request.user, type=metadata["type"], filename=filename, size=length
+        )
+        location = request.build_absolute_uri(reverse("uploads-detail", args=(session.pk,)))
+        serializer = self.serializer_class(session)
+        return self.tus_response(session, serializer.data, status.HTTP_201_CREATED, {"Location": location})
+
+    def retrieve(self, request, pk=None):
+        session = self.get_object()
+        data = None if request.method == "HEAD" else self.serializer_class(session).data
+        return self.tus_response(session, data, status.HTTP_200_OK)
+
+    def partial_update(self, request, pk=None):
+        # The body is read from the stream, never through request.data
+        if request.content_type != "application/offset+octet-stream":
+            return self.error_response("Ожидается application/offset+octet-stream", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        offset = to_int(request.headers.get("Upload-Offset"))
+        if offset is None:
+            return self.error_response("Не указано смещение", status.HTTP_400_BAD_REQUEST)
+
+        session = self.get_object()
+        if session.upload_id is not None:
+            return self.tus_response(session)
+        try:
+            write_chunk(session, request.stream, offset, to_int(request.META.get("CONTENT_LENGTH")) or 0)
+        except UploadError as e:
+            return self.error_response(str(e), e.status)
+        return self.tus_response(session)
+
+    def destroy(self, request, pk=None):
+        session = self.get_object()
+        if session.upload_id is None:
+            discard(session)
+        else:
+            session.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT, headers={"Tus-Resumable": TUS_VERSION})
+
+
 class CallbackCreateView(CreateAPIView):
     queryset = Callback
     serializer_class = CallbackSerializer
@@ -62,6 +62,18 @@ DATABASES = {
     }
 }
 
+# Cache
+# Must be shared by the web, worker and management command processes: cached
+# responses, tokens, profiles and the mission catalogue are invalidated
+# through it. LocMemCache only fits a single process, e.g. tests
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.redis.RedisCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "redis://redis:6379/0"),
+    }
+}
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", 60 * 15))
+
 # General
 AUTH_USER_MODEL = "account.User"
 SITE_ID = 1
@@ -77,7 +89,9 @@ LOGIN_REDIRECT_URL = "/"
 
 # SMTP
 DEFAULT_FROM_EMAIL = os.getenv("EMAIL_USER")
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# Emails are queued in the outbox table and delivered by `manage.py send_emails`
+EMAIL_BACKEND = "account.outbox.OutboxEmailBackend"
+OUTBOX_EMAIL_BACKEND = os.getenv("OUTBOX_EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
 EMAIL_HOST = os.getenv("EMAIL_HOST")
 EMAIL_USE_TLS = False
 EMAIL_USE_SSL = True
@@ -102,10 +116,30 @@ DJOSER = {
     }
 }
 
+# Seconds a token -> user resolution is cached by CachedTokenAuthentication
+TOKEN_CACHE_TIMEOUT = int(os.getenv("TOKEN_CACHE_TIMEOUT", 60))
+
+# Seconds the /users/me/ payload is cached, it is also dropped on profile saves
+PROFILE_CACHE_TIMEOUT = int(os.getenv("PROFILE_CACHE_TIMEOUT", 60 * 60))
+
+# Resumable uploads: bytes of a whole file and of one PATCH body, seconds
+# an unfinished upload is kept
+UPLOAD_MAX_SIZE = int(os.getenv("UPLOAD_MAX_SIZE", 20 * 1024 * 1024))
+UPLOAD_MAX_CHUNK = int(os.getenv("UPLOAD_MAX_CHUNK", 5 * 1024 * 1024))
+UPLOAD_EXPIRE = int(os.getenv("UPLOAD_EXPIRE", 60 * 60 * 24))
+
+# Admin exports larger than EXPORT_BACKGROUND_ROWS rows are written by the
+# run_exports worker, at most EXPORT_CONCURRENCY at once
+EXPORT_BACKGROUND_ROWS = int(os.getenv("EXPORT_BACKGROUND_ROWS", 20000))
+EXPORT_CONCURRENCY = int(os.getenv("EXPORT_CONCURRENCY", 2))
+EXPORT_STALE_AFTER = int(os.getenv("EXPORT_STALE_AFTER", 300))
+# Let nginx send finished export files (see nginx/nginx.conf)
+EXPORT_ACCEL_REDIRECT = int(os.getenv("EXPORT_ACCEL_REDIRECT", 0))
+
 # RestFramework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.TokenAuthentication",
+        "account.authentication.CachedTokenAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10
@@ -119,6 +153,8 @@ STATICFILES_FINDERS = (
     "django.contrib.staticfiles.finders.FileSystemFinder",
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
 )
+# Hashed file names, cached by browsers for a year
+STATICFILES_STORAGE = "helper.storage.CompressedManifestStaticFilesStorage"
 
 # Media files
 MEDIA_ROOT = BASE_DIR / "mediafiles"
@@ -0,0 +1,57 @@
+# Generated by Django 4.0.2 on 2026-10-18 10:15
+
+from django.conf import settings
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Event',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255, verbose_name='Название мероприятия')),
+                ('title_other', models.CharField(blank=True, max_length=255, verbose_name='Другое название мероприятия')),
+                ('photo', models.ImageField(upload_to='events', verbose_name='Фото мероприятия')),
+                ('description', models.TextField(verbose_name='Краткое описание мероприятия')),
+                ('description_other', models.TextField(blank=True, verbose_name='Другое краткое описание мероприятия')),
+                ('format', models.CharField(max_length=255, verbose_name='Формат мероприятия')),
+                ('format_other', models.CharField(blank=True, max_length=255, verbose_name='Другой формат мероприятия')),
+                ('date', models.DateTimeField(verbose_name='Дата проведения')),
+                ('profile', models.CharField(max_length=255, verbose_name='Профиль мероприятия')),
+                ('mode', models.CharField(choices=[('ONLINE', 'Онлайн'), ('OFFLINE', 'Оффлайн'), ('MIXED', 'Смешанный')], max_length=255, verbose_name='Режим мероприятия')),
+                ('address', models.TextField(verbose_name='Адрес проведения')),
+                ('address_other', models.TextField(blank=True, verbose_name='Другой адрес проведения')),
+                ('geography', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='География проведения')),
+                ('territorial_limits', models.TextField(verbose_name='Территориальные ограничения')),
+                ('url', models.URLField(verbose_name='Ссылка на сайт')),
+                ('audience', models.CharField(max_length=255, verbose_name='Целевая аудитория')),
+                ('audience_level', models.CharField(max_length=255, verbose_name='Класс/возраст школьников')),
+                ('audience_level_other', models.CharField(blank=True, max_length=255, verbose_name='Другой класс/возраст школьников')),
+                ('periodic', models.CharField(choices=[('FIRST', 'Впервые'), ('MONTH', 'Ежемесячный'), ('QUART', 'Ежеквартальный'), ('YEAR', 'Ежегодный')], max_length=255, verbose_name='Периодичность проведения')),
+                ('regularity', models.CharField(max_length=255, verbose_name='Регулярность проведения')),
+                ('is_free', models.BooleanField(verbose_name='Бесплатно?')),
+                ('has_retreat', models.BooleanField(verbose_name='Возможность проведения выездного мероприятия?')),
+                ('certificates', models.TextField(verbose_name='Сертификаты')),
+                ('speakers', models.TextField(verbose_name='Спикеры')),
+                ('additional_info', models.TextField(verbose_name='Дополнительная информация')),
+                ('video', models.URLField(blank=True, verbose_name='Видео о мероприятии')),
+                ('verification', models.CharField(choices=[('MODERATION', 'На модерации'), ('VERIFIED', 'Верифицировано')], default='MODERATION', max_length=50, verbose_name='Уровень верификации')),
+                ('whitelist', models.BooleanField(default=False, verbose_name='Белый список')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to=settings.AUTH_USER_MODEL, verbose_name='Организатор')),
+            ],
+            options={
+                'verbose_name': 'Мероприятие',
+                'verbose_name_plural': 'Мероприятия',
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.0.2 on 2026-10-18 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('verification', 'VERIFIED')), fields=['date'], name='event_verified_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('verification', 'VERIFIED'), ('whitelist', True)), fields=['date'], name='event_whitelist_date_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0006_search'),
+        ('events', '0003_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='event_title_trgm', opclasses=('gin_trgm_ops',)),
+        ),
+        migrations.RunSQL(
+            sql=[
+                "ALTER TABLE events_event ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+                "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('russian', coalesce(description, '')), 'C')"
+                ") STORED",
+                "CREATE INDEX events_event_search_gin ON events_event USING gin (search_vector)",
+            ],
+            reverse_sql="ALTER TABLE events_event DROP COLUMN search_vector",
+        ),
+    ]
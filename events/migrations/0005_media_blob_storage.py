@@ -0,0 +1,19 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:21
+
+import account.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_search'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='photo',
+            field=models.ImageField(storage=account.storage.ContentAddressedStorage(), upload_to='', verbose_name='Фото мероприятия'),
+        ),
+    ]
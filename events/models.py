@@ -1,6 +1,25 @@
 from django.db import models
 from django.conf import settings
+from django.db.models.functions import Coalesce
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+
+from account.storage import blob_storage
+
+
+class EventQuerySet(models.QuerySet):
+    def with_organizer(self):
+        """
+        Annotate ``organizer_name`` from whichever organizer profile exists,
+        so serializers don't follow ``user`` to the profile tables per row.
+        """
+        return self.annotate(
+            organizer_name=Coalesce(
+                "user__employer__company_name",
+                "user__college__college_name",
+                "user__npo__company_name",
+            )
+        )
 
 
 class Event(models.Model):
@@ -22,7 +41,7 @@ class Event(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, verbose_name="Организатор", on_delete=models.CASCADE, related_name="events")
     title = models.CharField(verbose_name="Название мероприятия", max_length=255)
     title_other = models.CharField(verbose_name="Другое название мероприятия", max_length=255, blank=True)
-    photo = models.ImageField(verbose_name="Фото мероприятия", upload_to="events")
+    photo = models.ImageField(verbose_name="Фото мероприятия", storage=blob_storage)
     description = models.TextField(verbose_name="Краткое описание мероприятия")
     description_other = models.TextField(verbose_name="Другое краткое описание мероприятия", blank=True)
     format = models.CharField(verbose_name="Формат мероприятия", max_length=255)
@@ -54,7 +73,23 @@ class Event(models.Model):
     )
 
     whitelist = models.BooleanField(verbose_name="Белый список", default=False)
+    updated_at = models.DateTimeField(verbose_name="Дата изменения", auto_now=True)
+
+    objects = EventQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Мероприятие"
         verbose_name_plural = "Мероприятия"
+        indexes = (
+            models.Index(
+                fields=("date",),
+                name="event_verified_date_idx",
+                condition=models.Q(verification="VERIFIED"),
+            ),
+            models.Index(
+                fields=("date",),
+                name="event_whitelist_date_idx",
+                condition=models.Q(verification="VERIFIED", whitelist=True),
+            ),
+            GinIndex(fields=("title",), name="event_title_trgm", opclasses=("gin_trgm_ops",)),
+        )
@@ -0,0 +1,23 @@
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+
+from account.response_cache import invalidate_tags
+from account.signals import images_processed
+
+from .models import Event
+
+
+# Senders are not filtered because export uses a proxy model
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_events(sender, instance, **kwargs):
+    if isinstance(instance, Event):
+        invalidate_tags("events")
+
+
+@receiver(images_processed)
+def touch_event_photos(sender, names, **kwargs):
+    # Events showing the processed photos got their ``photo_srcset``
+    if Event._base_manager.filter(photo__in=names).update(updated_at=timezone.now()):
+        invalidate_tags("events")
@@ -1,23 +1,34 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from account.images import ImageSetField
 from .models import Event
 
 User = get_user_model()
 
 
+def get_organizer_name(event):
+    # Querysets built with ``Event.objects.with_organizer()`` carry the name
+    if hasattr(event, "organizer_name"):
+        return event.organizer_name
+
+    organizer = None
+    if event.user.type == User.Types.EMPLOYER:
+        organizer = event.user.employer.company_name
+    elif event.user.type == User.Types.COLLEGE:
+        organizer = event.user.college.college_name
+    elif event.user.type == User.Types.NPO:
+        organizer = event.user.npo.company_name
+
+    return organizer
+
+
 class EventSerialzier(serializers.ModelSerializer):
     organizer = serializers.SerializerMethodField()
+    photo_srcset = ImageSetField(source="photo")
 
     def get_organizer(self, obj):
-        if obj.user.type == User.Types.EMPLOYER:
-            organizer = obj.user.employer.company_name
-        elif obj.user.type == User.Types.COLLEGE:
-            organizer = obj.user.college.college_name
-        elif obj.user.type == User.Types.NPO:
-            organizer = obj.user.npo.company_name
-
-        return organizer
+        return get_organizer_name(obj)
 
     class Meta:
         model = Event
@@ -43,16 +54,10 @@ class EventCreateSerializer(serializers.ModelSerializer):
 
 class EventDetailSerializer(serializers.ModelSerializer):
     organizer = serializers.SerializerMethodField()
+    photo_srcset = ImageSetField(source="photo")
 
     def get_organizer(self, obj):
-        if obj.user.type == User.Types.EMPLOYER:
-            organizer = obj.user.employer.company_name
-        elif obj.user.type == User.Types.COLLEGE:
-            organizer = obj.user.college.college_name
-        elif obj.user.type == User.Types.NPO:
-            organizer = obj.user.npo.company_name
-
-        return organizer
+        return get_organizer_name(obj)
 
     class Meta:
         model = Event
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from account.images import process_pending
+from account.models import ImageTask, User
+from events.models import Event
+
+
+def create_event(**kwargs):
+    user = User.objects.create_user(email="organizer@example.com", password="x", type=User.Types.EMPLOYER)
+    return Event.objects.create(**{
+        "user": user, "title": "День открытых дверей", "photo": "events/photo.png", "description": "-",
+        "format": "-", "date": timezone.now() + timedelta(hours=1), "profile": "-",
+        "mode": Event.Modes.OFFLINE, "address": "-", "geography": ["Москва"], "territorial_limits": "-",
+        "url": "https://example.com", "audience": "-", "audience_level": "-",
+        "periodic": Event.Periodic.FIRST, "regularity": "-", "is_free": True, "has_retreat": False,
+        "certificates": "-", "speakers": "-", "additional_info": "-",
+        "verification": Event.Verifiaction.VERIFIED,
+        **kwargs,
+    })
+
+
+class EventListStatusTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.start = timezone.now() + timedelta(hours=1)
+        create_event(date=self.start)
+
+    def test_upcoming_list_changes_when_event_starts(self):
+        response = self.client.get("/api/events/", {"status": "true"})
+        self.assertEqual(len(response.data), 1)
+        etag = response["ETag"]
+
+        response = self.client.get("/api/events/", {"status": "true"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with mock.patch("django.utils.timezone.now", return_value=self.start + timedelta(minutes=1)):
+            response = self.client.get("/api/events/", {"status": "true"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class EventPhotoSrcsetTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        name = "blobs/ab/photo.png"
+        os.makedirs(os.path.join(media_root, "blobs", "ab"))
+        Image.new("RGB", (600, 400)).save(os.path.join(media_root, name))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event = create_event(photo=name)
+        self.assertTrue(ImageTask.objects.filter(name=name).exists())
+
+    def test_responses_change_when_derivatives_are_written(self):
+        response = self.client.get("/api/events/")
+        self.assertIsNone(response.data[0]["photo_srcset"])
+        list_etag = response["ETag"]
+        response = self.client.get(f"/api/events/{self.event.pk}/detail/")
+        self.assertIsNone(response.data["photo_srcset"])
+        detail_etag = response["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_pending(), (1, 0))
+
+        response = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.data[0]["photo_srcset"])
+        response = self.client.get(f"/api/events/{self.event.pk}/detail/", HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.data["photo_srcset"])
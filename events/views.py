@@ -1,5 +1,8 @@
 from distutils.util import strtobool
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Min
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from rest_framework import viewsets
@@ -7,6 +10,10 @@ from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from account.sampling import random_sample
+from account.response_cache import cache_response, get_tag_versions
+from account.conditional import conditional, object_version, collection_version
+
 from .models import Event
 from .serializers import (
     EventSerialzier,
@@ -17,13 +24,39 @@ from .serializers import (
 
 User = get_user_model()
 
+BOUNDARY_PREFIX = "events:boundary"
+# Cached when no upcoming event is left to pass
+NO_BOUNDARY = "none"
+
+
+def status_boundary(view, request):
+    """
+    ``?status`` splits events at the current time, so such lists change
+    when the next event starts even if no event is saved. Returns the
+    start of that event, looked up once per version of the events tag.
+    """
+    if not request.query_params.get("status"):
+        return None
+
+    key = f"{BOUNDARY_PREFIX}:{get_tag_versions(('events',))[0]}"
+    now = timezone.now()
+    boundary = cache.get(key)
+    if boundary is None or (boundary != NO_BOUNDARY and boundary < now.timestamp()):
+        start = (
+            Event.objects.filter(verification=Event.Verifiaction.VERIFIED, date__gte=now)
+            .aggregate(start=Min("date"))["start"]
+        )
+        boundary = NO_BOUNDARY if start is None else start.timestamp()
+        cache.set(key, boundary, settings.RESPONSE_CACHE_TIMEOUT)
+    return boundary
+
 
 class EventViewset(viewsets.GenericViewSet):
     queryset = Event
     serializer_class = EventSerialzier
 
     def get_queryset(self):
-        queryset = Event.objects.filter(verification=Event.Verifiaction.VERIFIED)
+        queryset = Event.objects.with_organizer().filter(verification=Event.Verifiaction.VERIFIED)
 
         if not self.request.user.is_anonymous:
             if self.request.user.type == User.Types.STUDENT:
@@ -61,7 +94,7 @@ class EventViewset(viewsets.GenericViewSet):
 
     def retrieve(self, request, pk):
         try:
-            event = self.queryset.objects.get(id=pk)
+            event = self.queryset.objects.with_organizer().get(id=pk)
         except Event.DoesNotExist:
             return Response(f"Мероприятие {pk} не найдено", status=status.HTTP_404_NOT_FOUND)
 
@@ -92,25 +125,40 @@ class EventViewset(viewsets.GenericViewSet):
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @conditional(collection_version("events", vary=status_boundary))
+    @cache_response("events", vary=status_boundary)
     def list(self, request, *args, **kwargs):
         try:
             events = self.get_queryset()
         except Event.DoesNotExist:
             return Response("Мероприятия не найдены", status=status.HTTP_404_NOT_FOUND)
 
+        serializer = self.serializer_class(events, many=True)
         if not self.request.user.is_anonymous:
             if self.request.user.type == User.Types.STUDENT:
                 serializer = EventStudentSerializer(events, many=True)
-        else:
-            serializer = self.serializer_class(events, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=True, url_path='detail', url_name='detail', serializer_class=EventDetailSerializer)
+    @conditional(object_version(
+        Event, "updated_at", "user__employer__updated_at",
+        "user__college__updated_at", "user__npo__updated_at",
+    ))
     def qdetail(self, request, pk=None):
         try:
-            event = self.queryset.objects.get(id=pk)
+            event = self.queryset.objects.with_organizer().get(id=pk)
         except Event.DoesNotExist:
             return Response(f"Мероприятие {pk} не найдено", status=status.HTTP_404_NOT_FOUND)
 
         serializer = self.serializer_class(event)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False)
+    def random(self, request):
+        events = Event.objects.with_organizer().filter(
+            verification=Event.Verifiaction.VERIFIED,
+            date__gte=timezone.now()
+        )
+        events = random_sample(events, 3, key="random:events")
+        serializer = self.serializer_class(events, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,8 +1,17 @@
+import os
+
+from django.conf import settings
 from django.contrib import admin
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
+from django.urls import path, reverse
+from django.utils.html import format_html
 
 from import_export import resources
 from import_export.admin import ImportExportActionModelAdmin
 
+from account.models import User
+from .bulk import BulkImportAdminMixin, BulkProfileResource
+from .streaming import StreamingExportMixin
 from .models import (
     EmployerExport,
     ProfessionalExport,
@@ -11,18 +20,23 @@ from .models import (
     NPOExport,
     TeacherExport,
     UserExport,
-    EventExport
+    EventExport,
+    ExportJob
 )
 
 # Resources
 
-class EmployerResource(resources.ModelResource):
+class EmployerResource(BulkProfileResource):
+    user_type = User.Types.EMPLOYER
+
     class Meta:
         model = EmployerExport
         import_id_fields = ("user",)
 
 
-class ProfessionalResource(resources.ModelResource):
+class ProfessionalResource(BulkProfileResource):
+    user_type = User.Types.PROFESSIONAL
+
     class Meta:
         model = ProfessionalExport
         import_id_fields = ("user",)
@@ -65,7 +79,7 @@ class EventResource(resources.ModelResource):
 # Admin models
 
 @admin.register(EmployerExport)
-class AdminEmployer(ImportExportActionModelAdmin):
+class AdminEmployer(BulkImportAdminMixin, StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = EmployerResource
     actions = None
     list_display = ("user", "fullname", "verification")
@@ -80,7 +94,7 @@ class AdminEmployer(ImportExportActionModelAdmin):
 
 
 @admin.register(ProfessionalExport)
-class AdminProfessional(ImportExportActionModelAdmin):
+class AdminProfessional(BulkImportAdminMixin, StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = ProfessionalResource
     actions = None
     list_display = ("user", "fullname", "verification")
@@ -95,7 +109,7 @@ class AdminProfessional(ImportExportActionModelAdmin):
 
 
 @admin.register(EmploymentAgencyExport)
-class AdminEmploymentAgency(ImportExportActionModelAdmin):
+class AdminEmploymentAgency(StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = EmploymentAgencyResource
     actions = None
     list_display = ("user", "fullname", "verification")
@@ -110,7 +124,7 @@ class AdminEmploymentAgency(ImportExportActionModelAdmin):
 
 
 @admin.register(CollegeExport)
-class AdminCollege(ImportExportActionModelAdmin):
+class AdminCollege(StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = CollegeResource
     actions = None
     list_display = ("user", "fullname", "verification")
@@ -125,7 +139,7 @@ class AdminCollege(ImportExportActionModelAdmin):
 
 
 @admin.register(NPOExport)
-class AdminProfessional(ImportExportActionModelAdmin):
+class AdminProfessional(StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = NPOResource
     actions = None
     list_display = ("user", "fullname", "verification")
@@ -140,7 +154,7 @@ class AdminProfessional(ImportExportActionModelAdmin):
 
 
 @admin.register(TeacherExport)
-class AdminTeacher(ImportExportActionModelAdmin):
+class AdminTeacher(StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = TeacherResource
     actions = None
     list_display = ("user", "fullname", "verification")
@@ -155,7 +169,7 @@ class AdminTeacher(ImportExportActionModelAdmin):
 
 
 @admin.register(UserExport)
-class AdminUser(ImportExportActionModelAdmin):
+class AdminUser(StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = UserResource
     actions = None
     list_display = ("id", "email", "last_name", "first_name", "middle_name", "verification")
@@ -166,6 +180,80 @@ class AdminUser(ImportExportActionModelAdmin):
 
 
 @admin.register(EventExport)
-class AdminEvent(ImportExportActionModelAdmin):
+class AdminEvent(StreamingExportMixin, ImportExportActionModelAdmin):
     resource_class = EventResource
-    actions = None
\ No newline at end of file
+    actions = None
+
+
+@admin.register(ExportJob)
+class AdminExportJob(admin.ModelAdmin):
+    actions = None
+    list_display = ("id", "title", "format", "status", "progress_display", "created_by", "created_at", "download")
+    list_filter = ("status", "format")
+    fields = ("title", "format", "status", "progress_display", "written", "total", "download",
+              "error", "created_by", "created_at", "started_at", "finished_at")
+    readonly_fields = fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer("query").select_related("created_by")
+
+    @admin.display(description="Прогресс")
+    def progress_display(self, obj):
+        return f"{obj.progress}%"
+
+    @admin.display(description="Файл")
+    def download(self, obj):
+        if obj.status != ExportJob.Status.DONE:
+            return "-"
+        url = reverse("admin:export_exportjob_download", args=(obj.pk,))
+        return format_html('<a href="{}">{}</a>', url, os.path.basename(obj.file.name))
+
+    def get_urls(self):
+        return [
+            path(
+                "<int:pk>/download/",
+                self.admin_site.admin_view(self.download_view),
+                name="export_exportjob_download",
+            ),
+            path(
+                "<int:pk>/progress/",
+                self.admin_site.admin_view(self.progress_view),
+                name="export_exportjob_progress",
+            ),
+        ] + super().get_urls()
+
+    def get_job(self, request, pk):
+        job = self.get_queryset(request).filter(pk=pk).first()
+        if job is None or not self.has_view_permission(request, job):
+            raise Http404
+        return job
+
+    def progress_view(self, request, pk):
+        job = self.get_job(request, pk)
+        return JsonResponse({
+            "status": job.status,
+            "progress": job.progress,
+            "written": job.written,
+            "total": job.total,
+            "url": reverse("admin:export_exportjob_download", args=(job.pk,))
+            if job.status == ExportJob.Status.DONE else None,
+        })
+
+    def download_view(self, request, pk):
+        job = self.get_job(request, pk)
+        if job.status != ExportJob.Status.DONE:
+            raise Http404
+
+        filename = os.path.basename(job.file.name)
+        if settings.EXPORT_ACCEL_REDIRECT:
+            response = HttpResponse()
+            response["X-Accel-Redirect"] = job.file.url
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+        return FileResponse(job.file.open("rb"), as_attachment=True, filename=filename)
@@ -0,0 +1,212 @@
+import logging
+import time
+import traceback
+from collections import defaultdict
+
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connections
+from psycopg2.extras import execute_values
+
+from import_export import fields, resources, widgets
+from import_export.instance_loaders import BaseInstanceLoader
+from import_export.results import Result
+
+from account.signals import profiles_bulk_saved
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+BATCH_SIZE = 500
+
+
+def upsert(model, objs, using="default"):
+    """
+    Write ``objs`` with a single ``INSERT ... ON CONFLICT (pk) DO UPDATE``,
+    running ``pre_save`` of every field like ``save()`` does.
+    """
+    connection = connections[using]
+    opts = model._meta.concrete_model._meta
+    quote = connection.ops.quote_name
+
+    columns = ", ".join(quote(field.column) for field in opts.concrete_fields)
+    updates = ", ".join(
+        f"{quote(field.column)} = EXCLUDED.{quote(field.column)}"
+        for field in opts.concrete_fields if not field.primary_key
+    )
+    sql = (
+        f"INSERT INTO {quote(opts.db_table)} ({columns}) VALUES %s "
+        f"ON CONFLICT ({quote(opts.pk.column)}) DO UPDATE SET {updates}"
+    )
+    rows = [
+        [
+            field.get_db_prep_save(field.pre_save(obj, obj._state.adding), connection)
+            for field in opts.concrete_fields
+        ]
+        for obj in objs
+    ]
+    with connection.cursor() as cursor:
+        execute_values(cursor.cursor, sql, rows, page_size=len(rows))
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = using
+
+
+class BulkResult(Result):
+    elapsed = 0
+
+    @property
+    def rows_per_second(self):
+        return self.total_rows / self.elapsed if self.elapsed else 0
+
+
+class BulkInstanceLoader(BaseInstanceLoader):
+    """
+    Return instances loaded by ``BulkProfileResource.before_import``.
+    """
+
+    def get_instance(self, row):
+        return self.resource.instances.get(self.resource.fields["user"].clean(row))
+
+
+class BulkProfileResource(resources.ModelResource):
+    """
+    Import of profiles keyed by their ``user`` in batches of ``batch_size``
+    rows. Before the first row every batch is validated with one ``IN``
+    query per unique field, existing profiles are loaded with one ``IN``
+    query, and rows are written with one upsert per batch. What the
+    profile ``save()`` and its receivers do per row is done per batch.
+    """
+    user_type = None
+
+    user = fields.Field(attribute="user_id", column_name="user", widget=widgets.IntegerWidget())
+
+    class Meta:
+        import_id_fields = ("user",)
+        instance_loader_class = BulkInstanceLoader
+        use_bulk = True
+        batch_size = BATCH_SIZE
+        skip_diff = True
+
+    @classmethod
+    def get_result_class(cls):
+        return BulkResult
+
+    def before_import(self, dataset, using_transactions, dry_run, **kwargs):
+        self.started_at = time.perf_counter()
+        self.instances = {}
+        self.rejected = defaultdict(lambda: defaultdict(list))
+        self.batch_errors = []
+        # (field, value) -> user of the first row using a unique value
+        self.seen = {}
+
+        rows = dataset.dict
+        for offset in range(0, len(rows), self._meta.batch_size):
+            self.validate_batch(rows[offset:offset + self._meta.batch_size], offset + 1)
+
+    def reject(self, number, field, message):
+        self.rejected[number][field].append(message)
+
+    def get_unique_fields(self):
+        opts = self._meta.model._meta
+        unique = {field.name for field in opts.concrete_fields if field.unique and not field.primary_key}
+        return [field for field in self.get_import_fields() if field.attribute in unique]
+
+    def validate_batch(self, rows, start):
+        users = {}
+        for number, row in enumerate(rows, start):
+            try:
+                pk = self.fields["user"].clean(row)
+            except (KeyError, ValueError):
+                pk = None
+            if pk is None:
+                self.reject(number, "user", "Не указан пользователь.")
+            elif ("user", pk) in self.seen:
+                self.reject(number, "user", "Пользователь повторяется в файле.")
+            else:
+                self.seen["user", pk] = pk
+                users[number] = pk
+
+        self.instances.update(self.get_queryset().in_bulk(users.values()))
+        existing = set(
+            User.objects
+            .filter(pk__in=users.values(), type=self.user_type)
+            .values_list("pk", flat=True)
+        )
+        for number, pk in list(users.items()):
+            if pk not in existing:
+                self.reject(number, "user", "Пользователь с таким типом не найден.")
+                del users[number]
+
+        for field in self.get_unique_fields():
+            values = {}
+            for number, pk in users.items():
+                try:
+                    value = field.clean(rows[number - start])
+                except (KeyError, ValueError):
+                    continue
+                if value not in (None, ""):
+                    values[number] = value
+
+            taken = dict(
+                self.get_queryset()
+                .filter(**{f"{field.attribute}__in": values.values()})
+                .values_list(field.attribute, "pk")
+            )
+            for number, value in values.items():
+                owner = taken.get(value)
+                if owner is None:
+                    owner = self.seen.setdefault((field.attribute, value), users[number])
+                if owner != users[number]:
+                    self.reject(number, field.column_name, "Значение уже используется другим профилем.")
+
+    def before_import_row(self, row, row_number=None, **kwargs):
+        if row_number in self.rejected:
+            raise ValidationError({field: errors for field, errors in self.rejected[row_number].items()})
+
+    def bulk_create(self, using_transactions, dry_run, raise_errors, batch_size=None):
+        self.bulk_save(self.create_instances, using_transactions, dry_run, raise_errors)
+
+    def bulk_update(self, using_transactions, dry_run, raise_errors, batch_size=None):
+        self.bulk_save(self.update_instances, using_transactions, dry_run, raise_errors)
+
+    def bulk_save(self, instances, using_transactions, dry_run, raise_errors):
+        """
+        Upsert ``instances`` and reproduce the profile ``save()`` set-wise.
+        A failed batch is reported as an import error, rolling the import back.
+        """
+        try:
+            if instances and (using_transactions or not dry_run):
+                upsert(self._meta.model, instances, using=self.get_db_connection_name())
+                self.after_bulk_save([obj.pk for obj in instances])
+        except Exception as e:
+            logger.exception(e)
+            self.batch_errors.append(self.get_error_result_class()(e, traceback.format_exc()))
+            if raise_errors:
+                raise e
+        finally:
+            instances.clear()
+
+    def after_bulk_save(self, pks):
+        User.objects.filter(
+            pk__in=pks, verification=User.Verifiaction.CREATED
+        ).update(verification=User.Verifiaction.MODERATION)
+        profiles_bulk_saved.send(sender=self._meta.model, pks=pks)
+
+    def after_import(self, dataset, result, using_transactions, dry_run, **kwargs):
+        for error in self.batch_errors:
+            result.append_base_error(error)
+        result.elapsed = time.perf_counter() - self.started_at
+
+
+class BulkImportAdminMixin:
+    """
+    Admin mixin adding the speed of a ``BulkProfileResource`` import to its
+    success message.
+    """
+
+    def add_success_message(self, result, request):
+        super().add_success_message(result, request)
+        if isinstance(result, BulkResult):
+            messages.info(request, f"Импортировано за {result.elapsed:.1f} с, {result.rows_per_second:.0f} строк/с.")
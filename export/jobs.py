@@ -0,0 +1,207 @@
+import os
+import pickle
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import ExportJob
+from .streaming import CHUNK_SIZE, csv_chunks, export_chunk, get_exporters, get_related, write_xlsx
+
+EXPORT_DIR = "exports"
+# Advisory lock class of export worker slots
+LOCK_CLASS = 7301
+
+
+def create_job(resource_class, queryset, format, user=None):
+    """
+    Queue the export of ``queryset`` with ``resource_class`` into ``format``.
+    The query is pickled so the worker exports exactly the filtered rows.
+    """
+    return ExportJob.objects.create(
+        resource=f"{resource_class.__module__}.{resource_class.__qualname__}",
+        title=str(queryset.model._meta.verbose_name_plural),
+        format=format,
+        query=pickle.dumps(queryset.query),
+        total=queryset.count(),
+        created_by=user,
+    )
+
+
+@contextmanager
+def worker_slot():
+    """
+    Hold one of ``EXPORT_CONCURRENCY`` PostgreSQL advisory locks, yielding
+    ``None`` when all of them are taken by other workers.
+    """
+    if connection.vendor != "postgresql":
+        yield 0
+        return
+
+    slot = None
+    with connection.cursor() as cursor:
+        for i in range(settings.EXPORT_CONCURRENCY):
+            cursor.execute("SELECT pg_try_advisory_lock(%s, %s)", [LOCK_CLASS, i])
+            if cursor.fetchone()[0]:
+                slot = i
+                break
+    try:
+        yield slot
+    finally:
+        if slot is not None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s, %s)", [LOCK_CLASS, slot])
+
+
+def claim_job():
+    """
+    Take the oldest pending job, or a running one whose worker stopped
+    sending heartbeats, and mark it as ours.
+    """
+    stale = timezone.now() - timedelta(seconds=settings.EXPORT_STALE_AFTER)
+    with transaction.atomic():
+        job = (
+            ExportJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(
+                Q(status=ExportJob.Status.PENDING)
+                | Q(status=ExportJob.Status.RUNNING, heartbeat_at__lt=stale)
+            )
+            .order_by("created_at")
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.status = ExportJob.Status.RUNNING
+        job.worker = uuid.uuid4().hex
+        job.heartbeat_at = timezone.now()
+        job.started_at = job.started_at or job.heartbeat_at
+        job.save(update_fields=("status", "worker", "heartbeat_at", "started_at"))
+    return job
+
+
+def checkpoint(job, **fields):
+    """
+    Save job progress, returning ``False`` when another worker took the job over.
+    """
+    fields["heartbeat_at"] = timezone.now()
+    updated = ExportJob.objects.filter(pk=job.pk, worker=job.worker).update(**fields)
+    for name, value in fields.items():
+        setattr(job, name, value)
+    return bool(updated)
+
+
+def get_path(name):
+    path = os.path.join(settings.MEDIA_ROOT, EXPORT_DIR, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def lock_job(job):
+    """
+    Lock the job row until the end of the transaction, returning ``False``
+    when another worker took the job over.
+    """
+    return ExportJob.objects.select_for_update().filter(pk=job.pk, worker=job.worker).exists()
+
+
+def write_part(file, job, headers, rows):
+    """
+    Append ``rows`` to the part file: CSV text for CSV exports, and for
+    XLSX exports one pickle per chunk, which keeps numbers and dates typed
+    until the workbook is written.
+    """
+    if job.format == ExportJob.Format.XLSX:
+        pickle.dump(rows, file)
+        return
+    for text in csv_chunks(headers, rows, len(rows) + 1):
+        file.write(text.encode())
+
+
+def read_part(file):
+    while True:
+        try:
+            yield from pickle.load(file)
+        except EOFError:
+            return
+
+
+def finish_part(job, part, headers, name):
+    target = get_path(os.path.basename(name))
+    if job.format == ExportJob.Format.XLSX:
+        with open(part, "rb") as source, open(target, "wb") as file:
+            write_xlsx(headers, read_part(source), file, title=job.title[:31])
+        os.remove(part)
+    else:
+        os.replace(part, target)
+
+
+def run_job(job, chunk_size=CHUNK_SIZE):
+    """
+    Export the job rows in primary key order into a part file, one chunk
+    at a time. After every chunk the part file size and the last primary key
+    are checkpointed, so a job resumed after a crash truncates the part file
+    to the checkpoint and continues from that key.
+
+    Every chunk is written and checkpointed with the job row locked and
+    still assigned to this worker. A worker whose job was taken over after
+    ``EXPORT_STALE_AFTER`` therefore stops before touching the part file
+    again, and the new worker only ever appends after the last checkpoint.
+    """
+    resource = import_string(job.resource)()
+    model = resource._meta.model
+    queryset = model._default_manager.all()
+    queryset.query = pickle.loads(job.query)
+    select, prefetch = get_related(resource, model)
+    queryset = queryset.select_related(*select).order_by("pk")
+    exporters = get_exporters(resource)
+    headers = resource.get_export_headers()
+    name = f"{EXPORT_DIR}/{model.__name__}-{timezone.now():%Y-%m-%d}-{job.pk}.{job.format}"
+
+    part = get_path(f"{job.pk}.{job.format}.part")
+    with open(part, "a+b") as file:
+        with transaction.atomic():
+            if not lock_job(job):
+                return False
+            if os.fstat(file.fileno()).st_size < job.offset:
+                # The part file was lost, start over
+                checkpoint(job, cursor=None, offset=0, written=0, progress=0)
+
+        while True:
+            chunk = queryset
+            if job.cursor is not None:
+                chunk = chunk.filter(pk__gt=job.cursor)
+            objs = list(chunk[:chunk_size])
+            rows = list(export_chunk(resource, objs, prefetch, exporters))
+
+            with transaction.atomic():
+                if not lock_job(job):
+                    return False
+
+                # Drop what a stopped worker wrote after its last checkpoint
+                file.truncate(job.offset)
+                write_part(file, job, None if job.offset else headers, rows)
+                file.flush()
+                os.fsync(file.fileno())
+                offset = os.fstat(file.fileno()).st_size
+
+                if not objs:
+                    finish_part(job, part, headers, name)
+                    return checkpoint(
+                        job, status=ExportJob.Status.DONE, file=name, offset=offset,
+                        progress=100, finished_at=timezone.now(),
+                    )
+
+                written = job.written + len(objs)
+                progress = min(99, written * 100 // job.total) if job.total else 99
+                checkpoint(job, cursor=objs[-1].pk, offset=offset, written=written, progress=progress)
+
+
+def fail_job(job, error):
+    checkpoint(job, status=ExportJob.Status.FAILED, error=str(error), finished_at=timezone.now())
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import Group, Permission
+from django.core.management.base import BaseCommand
+
+from export.admin import UserResource
+from export.models import UserExport
+from export.streaming import csv_chunks, export_chunk, iter_rows, write_xlsx
+
+
+class Command(BaseCommand):
+    help = "Benchmark streaming user export against the in-memory tablib export"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic users to export")
+        parser.add_argument("--database", action="store_true", help="Export the users table instead of synthetic users")
+        parser.add_argument("--formats", default="csv,xlsx")
+        parser.add_argument("--tablib", action="store_true", help="Also run the in-memory django-import-export path")
+        parser.add_argument("--memory", action="store_true", help="Trace peak allocations in a second, slower run")
+
+    def handle(self, *args, **options):
+        self.trace_memory = options["memory"]
+        resource = UserResource()
+        headers = resource.get_export_headers()
+
+        if options["database"]:
+            queryset = UserExport.objects.order_by("pk")
+            make_rows = lambda: iter_rows(resource, queryset)
+            count = queryset.count()
+        else:
+            count = options["rows"]
+            make_rows = lambda: export_chunk(resource, self.synthetic_users(count), ())
+        self.stdout.write(f"{count} users")
+
+        for format in options["formats"].split(","):
+            with tempfile.TemporaryFile() as file:
+                def write_csv():
+                    for chunk in csv_chunks(headers, make_rows()):
+                        file.write(chunk.encode())
+
+                if format == "csv":
+                    self.measure("stream csv", count, write_csv, file)
+                else:
+                    self.measure("stream xlsx", count, lambda: write_xlsx(headers, make_rows(), file), file)
+
+            if options["tablib"]:
+                users = queryset if options["database"] else list(self.synthetic_users(count))
+                self.measure(f"tablib {format}", count, lambda: getattr(resource.export(users), format))
+
+    def synthetic_users(self, count):
+        joined = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        for pk in range(1, count + 1):
+            user = UserExport(
+                id=pk,
+                email=f"user{pk}@example.com",
+                password="pbkdf2_sha256$320000$salt$hash",
+                type=UserExport.Types.STUDENT,
+                first_name="Иван",
+                last_name="Иванов",
+                middle_name="Иванович",
+                date_joined=joined,
+                updated_at=joined,
+            )
+            # As left by prefetch_related_objects for users without groups
+            user._prefetched_objects_cache = {
+                "groups": self.prefetched(Group),
+                "user_permissions": self.prefetched(Permission),
+            }
+            yield user
+
+    def prefetched(self, model):
+        queryset = model.objects.none()
+        queryset._result_cache = []
+        queryset._prefetch_done = True
+        return queryset
+
+    def measure(self, name, count, func, file=None):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        result = f"{name}: {elapsed:.1f}s, {count / elapsed:.0f} rows/s"
+
+        if file is not None:
+            file.flush()
+            result += f", {os.fstat(file.fileno()).st_size / 2 ** 20:.1f} MiB written"
+
+        if self.trace_memory:
+            if file is not None:
+                file.seek(0)
+                file.truncate()
+            tracemalloc.start()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result += f", peak {peak / 2 ** 20:.1f} MiB allocated"
+
+        self.stdout.write(result)
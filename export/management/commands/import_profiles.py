@@ -0,0 +1,51 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from import_export.formats import base_formats
+from import_export.results import RowResult
+
+from export.admin import EmployerResource, ProfessionalResource
+
+RESOURCES = {
+    "employers": EmployerResource,
+    "professionals": ProfessionalResource,
+}
+FORMATS = {
+    ".csv": base_formats.CSV,
+    ".xlsx": base_formats.XLSX,
+}
+
+
+class Command(BaseCommand):
+    help = "Bulk import employer or professional profiles from a CSV or XLSX file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("resource", choices=RESOURCES)
+        parser.add_argument("path")
+        parser.add_argument("--dry-run", action="store_true", help="Validate and roll the import back")
+
+    def handle(self, *args, **options):
+        extension = os.path.splitext(options["path"])[1].lower()
+        if extension not in FORMATS:
+            raise CommandError(f"Unsupported file type {extension}, expected one of {', '.join(FORMATS)}")
+        format = FORMATS[extension]()
+        with open(options["path"], format.get_read_mode()) as file:
+            dataset = format.create_dataset(file.read())
+
+        resource = RESOURCES[options["resource"]]()
+        result = resource.import_data(dataset, dry_run=options["dry_run"], use_transactions=True)
+
+        for error in result.base_errors:
+            self.stderr.write(error.traceback)
+        for row in result.invalid_rows:
+            for field, errors in row.error_dict.items():
+                self.stderr.write(f"Row {row.number}: {field}: {' '.join(errors)}")
+
+        totals = result.totals
+        self.stdout.write(
+            f"{result.total_rows} rows in {result.elapsed:.1f}s, {result.rows_per_second:.0f} rows/s: "
+            f"{totals[RowResult.IMPORT_TYPE_NEW]} new, {totals[RowResult.IMPORT_TYPE_UPDATE]} updated, "
+            f"{totals[RowResult.IMPORT_TYPE_INVALID]} rejected, {totals[RowResult.IMPORT_TYPE_ERROR]} errors"
+        )
+        if result.has_errors():
+            raise CommandError("Import failed and was rolled back")
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from export.jobs import claim_job, fail_job, run_job, worker_slot
+from export.streaming import CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = "Run queued admin export jobs, at most EXPORT_CONCURRENCY at once across workers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Run queued jobs and exit")
+        parser.add_argument("--interval", type=float, default=5, help="Seconds to wait when there is nothing to run")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        while True:
+            job = None
+            with worker_slot() as slot:
+                if slot is not None:
+                    job = claim_job()
+                if job is not None:
+                    self.run(job, options["chunk_size"])
+
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+
+    def run(self, job, chunk_size):
+        self.stdout.write(f"Export #{job.pk} {job}: started")
+        try:
+            finished = run_job(job, chunk_size)
+        except Exception as e:
+            fail_job(job, e)
+            self.stderr.write(f"Export #{job.pk}: {e}")
+        else:
+            if finished:
+                self.stdout.write(f"Export #{job.pk}: {job.written} rows written")
+            else:
+                self.stdout.write(f"Export #{job.pk}: taken over by another worker")
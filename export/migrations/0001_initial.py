@@ -0,0 +1,124 @@
+# Generated by Django 4.0.2 on 2026-10-18 10:15
+
+import account.managers
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('account', '0001_initial'),
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollegeExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'ССУЗ',
+                'verbose_name_plural': 'ССУЗы',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.college',),
+        ),
+        migrations.CreateModel(
+            name='EmployerExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Организация',
+                'verbose_name_plural': 'Организации',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.employer',),
+        ),
+        migrations.CreateModel(
+            name='EmploymentAgencyExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Орган занятости',
+                'verbose_name_plural': 'Органы занятости',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.employmentagency',),
+        ),
+        migrations.CreateModel(
+            name='EventExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Мероприятие',
+                'verbose_name_plural': 'Мероприятия',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('events.event',),
+        ),
+        migrations.CreateModel(
+            name='NPOExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'НКО',
+                'verbose_name_plural': 'НКО',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.npo',),
+        ),
+        migrations.CreateModel(
+            name='ProfessionalExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Профессионал',
+                'verbose_name_plural': 'Профессионалы',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.professional',),
+        ),
+        migrations.CreateModel(
+            name='TeacherExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Учитель',
+                'verbose_name_plural': 'Учителя',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.teacher',),
+        ),
+        migrations.CreateModel(
+            name='UserExport',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Пользователь',
+                'verbose_name_plural': 'Пользователи',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('account.user',),
+            managers=[
+                ('objects', account.managers.UserManager()),
+            ],
+        ),
+    ]
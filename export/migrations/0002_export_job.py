@@ -0,0 +1,48 @@
+# Generated by Django 4.0.2 on 2026-10-18 11:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('export', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(max_length=255, verbose_name='Ресурс')),
+                ('title', models.CharField(max_length=255, verbose_name='Данные')),
+                ('format', models.CharField(choices=[('csv', 'CSV'), ('xlsx', 'XLSX')], max_length=10, verbose_name='Формат')),
+                ('query', models.BinaryField(verbose_name='Запрос')),
+                ('status', models.CharField(choices=[('PENDING', 'В очереди'), ('RUNNING', 'Выполняется'), ('DONE', 'Готово'), ('FAILED', 'Ошибка')], default='PENDING', max_length=20, verbose_name='Статус')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Всего строк')),
+                ('written', models.PositiveIntegerField(default=0, verbose_name='Записано строк')),
+                ('progress', models.PositiveSmallIntegerField(default=0, verbose_name='Прогресс, %')),
+                ('cursor', models.BigIntegerField(blank=True, null=True, verbose_name='Последний id')),
+                ('offset', models.BigIntegerField(default=0, verbose_name='Размер записанной части')),
+                ('file', models.FileField(blank=True, upload_to='exports', verbose_name='Файл')),
+                ('error', models.TextField(blank=True, verbose_name='Ошибка')),
+                ('worker', models.CharField(blank=True, max_length=32, verbose_name='Обработчик')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='Последняя активность')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Начато')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Завершено')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Автор')),
+            ],
+            options={
+                'verbose_name': 'Выгрузка',
+                'verbose_name_plural': 'Выгрузки',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='exportjob',
+            index=models.Index(condition=models.Q(('status__in', ('PENDING', 'RUNNING'))), fields=['created_at'], name='export_job_active_idx'),
+        ),
+    ]
@@ -1,3 +1,6 @@
+from django.conf import settings
+from django.db import models
+
 from account.models import (
     Employer,
     Professional,
@@ -72,3 +75,52 @@ class EventExport(Event):
         app_label = "export"
         verbose_name = Event._meta.verbose_name
         verbose_name_plural = Event._meta.verbose_name_plural
+
+
+class ExportJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "В очереди"
+        RUNNING = "RUNNING", "Выполняется"
+        DONE = "DONE", "Готово"
+        FAILED = "FAILED", "Ошибка"
+
+    class Format(models.TextChoices):
+        CSV = "csv", "CSV"
+        XLSX = "xlsx", "XLSX"
+
+    resource = models.CharField(verbose_name="Ресурс", max_length=255)
+    title = models.CharField(verbose_name="Данные", max_length=255)
+    format = models.CharField(verbose_name="Формат", max_length=10, choices=Format.choices)
+    query = models.BinaryField(verbose_name="Запрос")
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, verbose_name="Автор", null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+
+    status = models.CharField(verbose_name="Статус", max_length=20, choices=Status.choices, default=Status.PENDING)
+    total = models.PositiveIntegerField(verbose_name="Всего строк", default=0)
+    written = models.PositiveIntegerField(verbose_name="Записано строк", default=0)
+    progress = models.PositiveSmallIntegerField(verbose_name="Прогресс, %", default=0)
+    cursor = models.BigIntegerField(verbose_name="Последний id", null=True, blank=True)
+    offset = models.BigIntegerField(verbose_name="Размер записанной части", default=0)
+    file = models.FileField(verbose_name="Файл", upload_to="exports", blank=True)
+    error = models.TextField(verbose_name="Ошибка", blank=True)
+
+    worker = models.CharField(verbose_name="Обработчик", max_length=32, blank=True)
+    heartbeat_at = models.DateTimeField(verbose_name="Последняя активность", null=True, blank=True)
+    created_at = models.DateTimeField(verbose_name="Создано", auto_now_add=True)
+    started_at = models.DateTimeField(verbose_name="Начато", null=True, blank=True)
+    finished_at = models.DateTimeField(verbose_name="Завершено", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Выгрузка"
+        verbose_name_plural = "Выгрузки"
+        indexes = (
+            models.Index(
+                fields=("created_at",),
+                name="export_job_active_idx",
+                condition=models.Q(status__in=("PENDING", "RUNNING")),
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.title} ({self.get_format_display()})"
@@ -0,0 +1,81 @@
+import csv
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from openpyxl import load_workbook
+
+from account.models import User
+from export.admin import UserResource
+from export.jobs import claim_job, create_job, run_job
+from export.models import ExportJob, UserExport
+from export.streaming import export_chunk
+
+
+class RunJobTest(TestCase):
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        override = override_settings(MEDIA_ROOT=self.media)
+        override.enable()
+        self.addCleanup(override.disable)
+        for i in range(5):
+            User.objects.create_user(email=f"user{i}@example.com", password="x", type=User.Types.STUDENT)
+
+    def run_to_end(self, format):
+        create_job(UserResource, UserExport.objects.all(), format)
+        job = claim_job()
+        self.assertTrue(run_job(job, chunk_size=2))
+        job.refresh_from_db()
+        self.assertEqual(job.status, ExportJob.Status.DONE)
+        self.assertEqual(job.written, 5)
+        return job, os.path.join(self.media, job.file.name)
+
+    def test_csv(self):
+        job, path = self.run_to_end(ExportJob.Format.CSV)
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], UserResource().get_export_headers())
+        self.assertEqual(len(rows), 6)
+
+    def test_xlsx_keeps_types(self):
+        job, path = self.run_to_end(ExportJob.Format.XLSX)
+        rows = list(load_workbook(path, read_only=True).active.values)
+        self.assertEqual(len(rows), 6)
+        id_column = rows[0].index("id")
+        self.assertEqual(
+            [row[id_column] for row in rows[1:]],
+            list(User.objects.order_by("pk").values_list("pk", flat=True)),
+        )
+
+    def test_stale_worker_stops_after_takeover(self):
+        create_job(UserResource, UserExport.objects.all(), ExportJob.Format.CSV)
+        stale = claim_job()
+        calls = []
+
+        def take_over(*args, **kwargs):
+            # Another worker takes the job over while this one reads a chunk
+            calls.append(1)
+            if len(calls) == 2:
+                ExportJob.objects.filter(pk=stale.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+                self.assertIsNotNone(claim_job())
+            return export_chunk(*args, **kwargs)
+
+        with mock.patch("export.jobs.export_chunk", side_effect=take_over):
+            self.assertFalse(run_job(stale, chunk_size=2))
+
+        job = ExportJob.objects.get()
+        self.assertNotEqual(job.worker, stale.worker)
+        self.assertEqual(job.written, 2)
+        self.assertTrue(run_job(job, chunk_size=2))
+
+        job.refresh_from_db()
+        with open(os.path.join(self.media, job.file.name), newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        ids = [row[0] for row in rows[1:]]
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
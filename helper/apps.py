@@ -5,3 +5,6 @@ class HelperConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'helper'
     verbose_name = "Цифровой помощник"
+
+    def ready(self) -> None:
+        from helper import receivers
@@ -0,0 +1,81 @@
+import uuid
+
+from django.core.cache import cache
+
+VERSION_KEY = "missions:version"
+
+
+def to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class MissionCatalogue:
+    """
+    Read-only snapshot of every ``Mission`` with its ``MissionQuestion`` rows.
+    Instances are shared between requests and must not be modified.
+    """
+
+    def __init__(self, version, missions, questions):
+        self.version = version
+        self.missions = sorted(missions, key=lambda mission: mission.order)
+        self._by_id = {mission.pk: mission for mission in missions}
+        self._by_order = {mission.order: mission for mission in missions}
+        self._questions = {mission.pk: [] for mission in missions}
+        for question in sorted(questions, key=lambda question: question.order):
+            # Missions and questions are read in two queries, so a question
+            # may belong to a mission committed in between
+            if question.mission_id in self._questions:
+                self._questions[question.mission_id].append(question)
+
+    def get(self, pk):
+        return self._by_id.get(to_int(pk))
+
+    def get_by_order(self, order):
+        return self._by_order.get(to_int(order))
+
+    def questions(self, mission_id):
+        return self._questions.get(mission_id, [])
+
+    def questions_count(self, mission_id):
+        return len(self.questions(mission_id))
+
+    def question_answers(self, mission_id):
+        return {question.question: question.answers for question in self.questions(mission_id)}
+
+
+_catalogue = None
+
+
+def get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_version():
+    cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_catalogue():
+    """
+    Return the process-local mission catalogue, reloading it from the
+    database only when the shared version has been bumped.
+    """
+    global _catalogue
+    from .models import Mission, MissionQuestion
+
+    version = get_version()
+    catalogue = _catalogue
+    if catalogue is None or catalogue.version != version:
+        catalogue = MissionCatalogue(
+            version,
+            list(Mission.objects.all()),
+            list(MissionQuestion.objects.all()),
+        )
+        _catalogue = catalogue
+    return catalogue
@@ -0,0 +1,112 @@
+import time
+from collections import Counter
+
+from django.db import connection, models, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.core.management.base import BaseCommand, CommandError
+
+from helper.models import StudentMission, StudentSkill
+from helper.scoring import POINTS, ROLES, MOTIVATION, apply_student_mission
+
+
+def legacy_apply_student_mission(student_mission):
+    """
+    Query pattern of the former ``StudentMission.save``: one lookup per
+    question and skill and a student save after every change.
+    """
+    student = student_mission.student
+    mission = student_mission.mission
+
+    if student_mission.is_complete:
+        student.coins += mission.coins
+        student.save()
+
+        try:
+            next_mission = StudentMission.objects.get(student=student, mission__order=(mission.order + 1))
+        except StudentMission.DoesNotExist:
+            pass
+        else:
+            next_mission.is_unlocked = True
+            models.Model.save(next_mission)
+
+    if not student.missions.exclude(is_complete=True).exists():
+        student.completed_at = timezone.now()
+        student.save()
+
+    answer_data = []
+    for question, answers in student_mission.answers.items():
+        question = mission.questions.get(question=question)
+        data = []
+        for answer in answers:
+            data.extend(question.answers.get(answer) or [])
+
+        for labels, attr in ((ROLES, "role"), (MOTIVATION, "motivation")):
+            if any(x in data for x in labels.keys()):
+                data.extend([key for key in labels.keys() if key not in data])
+                for i, key in enumerate(data, start=1):
+                    getattr(student, attr)[labels[key]] = POINTS[i]
+                student.save()
+                break
+        else:
+            answer_data.extend(data)
+
+    skills_bulk = []
+    for value, count in Counter(answer_data).items():
+        if value.startswith("entrepreneurship"):
+            student.save()
+            continue
+        skill = student.skills.get(object=value.upper())
+        skill.points = count
+        skills_bulk.append(skill)
+    StudentSkill.objects.bulk_update(skills_bulk, ["points"])
+
+
+class Command(BaseCommand):
+    help = "Benchmark query count and latency of student mission scoring, legacy vs batched"
+
+    def add_arguments(self, parser):
+        parser.add_argument("student", type=int, help="Student id")
+        parser.add_argument("--mission", type=int, default=1, help="Mission order")
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        lookup = {"student_id": options["student"], "mission__order": options["mission"]}
+        if not StudentMission.objects.filter(**lookup).exists():
+            raise CommandError("Student mission not found")
+
+        for name, apply in (
+            ("legacy", legacy_apply_student_mission),
+            ("batched", apply_student_mission),
+        ):
+            queries, elapsed = [], []
+            for _ in range(options["repeat"]):
+                count, seconds = self.run(apply, lookup)
+                queries.append(count)
+                elapsed.append(seconds)
+
+            self.stdout.write(
+                f"{name:>8}: {max(queries)} queries, "
+                f"{1000 * sum(elapsed) / len(elapsed):.2f} ms avg, "
+                f"{1000 * min(elapsed):.2f} ms min"
+            )
+
+    def run(self, apply, lookup):
+        # Every run works on the same data and is rolled back
+        with transaction.atomic():
+            student_mission = StudentMission.objects.select_related("mission", "student").get(**lookup)
+            if not student_mission.answers:
+                student_mission.answers = {
+                    question.question: list(question.answers.keys())[:1]
+                    for question in student_mission.mission.questions.all()
+                }
+            student_mission.is_complete = True
+
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                apply(student_mission)
+                elapsed = time.perf_counter() - start
+
+            transaction.set_rollback(True)
+
+        return len(context.captured_queries), elapsed
@@ -0,0 +1,96 @@
+# Generated by Django 4.0.2 on 2026-10-18 10:15
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('account', '0001_initial'),
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Mission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('coins', models.PositiveIntegerField(verbose_name='Монеты')),
+                ('order', models.PositiveIntegerField(unique=True, verbose_name='Номер миссии')),
+            ],
+            options={
+                'verbose_name': 'Миссия',
+                'verbose_name_plural': 'Миссии',
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillScope',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object', models.CharField(choices=[('SOCIAL', 'Работа с людьми'), ('RESEARCH', 'Исследовательская деятельность'), ('PRACTIC', 'Практическая деятельность'), ('CREATIVE', 'Творческая деятельность'), ('EXTREMAL', 'Экстремальная деятельность'), ('INFORMATION', 'Работа с информацией')], max_length=255, unique=True, verbose_name='Объект')),
+                ('scope', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), size=None, verbose_name='Сферы деятельности')),
+            ],
+            options={
+                'verbose_name': 'Суперспособность',
+                'verbose_name_plural': 'Суперспособности',
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object', models.CharField(choices=[('SOCIAL', 'Работа с людьми'), ('RESEARCH', 'Исследовательская деятельность'), ('PRACTIC', 'Практическая деятельность'), ('CREATIVE', 'Творческая деятельность'), ('EXTREMAL', 'Экстремальная деятельность'), ('INFORMATION', 'Работа с информацией')], max_length=255, verbose_name='Объект')),
+                ('points', models.PositiveIntegerField(default=0, verbose_name='Баллы')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skills', to='account.student')),
+            ],
+            options={
+                'verbose_name': 'Суперспособность',
+                'verbose_name_plural': 'Суперспособности',
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentMission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.PositiveIntegerField(default=0, verbose_name='Стадия')),
+                ('answers', models.JSONField(blank=True, default=dict, verbose_name='Ответы')),
+                ('reaction', models.CharField(blank=True, choices=[('FIRE', '🔥'), ('HEART', '❤️'), ('FIVE', '🖐'), ('SAD', '🙁')], max_length=255, verbose_name='Реакция')),
+                ('is_complete', models.BooleanField(default=False, verbose_name='Пройдена?')),
+                ('is_unlocked', models.BooleanField(default=False, verbose_name='Разблокировано?')),
+                ('mission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='helper.mission')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='missions', to='account.student')),
+            ],
+            options={
+                'verbose_name': 'Миссия',
+                'verbose_name_plural': 'Миссии',
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='events.event')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='account.student')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MissionQuestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question', models.TextField(verbose_name='Вопрос')),
+                ('order', models.PositiveIntegerField(verbose_name='Номер вопроса')),
+                ('answers', models.JSONField(blank=True, default=dict, verbose_name='Ответы')),
+                ('mission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='questions', to='helper.mission')),
+            ],
+            options={
+                'verbose_name': 'Вопрос',
+                'verbose_name_plural': 'Вопросы',
+                'ordering': ('order',),
+                'unique_together': {('mission', 'order')},
+            },
+        ),
+    ]
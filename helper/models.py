@@ -1,10 +1,9 @@
-from collections import Counter
-
-from django.db import models
-from django.utils import timezone
+from django.db import models, transaction
 from django.contrib.postgres.fields import ArrayField
 
 from events.models import Event
+from .catalogue import get_catalogue
+from .scoring import apply_student_mission
 
 
 class Mission(models.Model):
@@ -56,106 +55,16 @@ class StudentMission(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.pk:
-            if self.mission.order == 1:
+            mission = get_catalogue().get(self.mission_id) or self.mission
+            if mission.order == 1:
                 self.is_unlocked = True
             return super().save(*args, **kwargs)
 
         self.stage = len(self.answers)
 
-        super().save(*args, **kwargs)
-
-        if self.is_complete:
-            self.student.coins += self.mission.coins
-            self.student.save()
-
-            try:
-                next_mission = StudentMission.objects.get(
-                    student=self.student,
-                    mission__order=(self.mission.order + 1)
-                )
-            except StudentMission.DoesNotExist:
-                pass
-            else:
-                next_mission.is_unlocked = True
-                next_mission.save()
-
-        if not self.student.missions.exclude(is_complete=True).exists():
-            self.student.completed_at = timezone.now()
-            self.student.save()
-
-        if not self.answers.items():
-            return
-
-        answer_data = []
-
-        points_dict = {
-            1: 52,
-            2: 30,
-            3: 7,
-            4: 6,
-            5: 5
-        }
-        roles = {
-            "leader": "Лидер",
-            "specialist": "Специалист",
-            "idea": "Генератор идей",
-            "party": "Душа компании",
-            "expert": "Эксперт"
-        }
-        motivation = {
-            "achievement": "Достиженческий",
-            "process": "Процессный",
-            "material": "Материальный",
-            "ideological": "Идейный",
-            "team": "Командный"
-        }
-
-        for question, answers in self.answers.items():
-            question = self.mission.questions.get(question=question)
-            data = []
-            for answer in answers:
-                if not question.answers.get(answer):
-                    continue
-                else:
-                    data.extend(question.answers.get(answer))
-
-            if any(x in data for x in roles.keys()):
-                data.extend([key for key in roles.keys() if key not in data])
-
-                for i, key in enumerate(data, start=1):
-                    self.student.role[roles[key]] = points_dict[i]
-
-                self.student.save()
-                continue
-            elif any(x in data for x in motivation.keys()):
-                data.extend([key for key in motivation.keys() if key not in data])
-
-                for i, key in enumerate(data, start=1):
-                    self.student.motivation[motivation[key]] = points_dict[i]
-
-                self.student.save()
-                continue
-
-            answer_data.extend(data)
-
-        answer_data = Counter(answer_data)
-        skills_bulk = []
-        for value, count in answer_data.items():
-            if value.startswith("entrepreneurship"):
-                if value.endswith("1"):
-                    self.student.entrepreneurship = 16
-                elif value.endswith("2"):
-                    self.student.entrepreneurship = 57
-                else:
-                    self.student.entrepreneurship = 87
-                self.student.save()
-                continue
-
-            skill = self.student.skills.get(object=value.upper())
-            skill.points = count
-            skills_bulk.append(skill)
-
-        StudentSkill.objects.bulk_update(skills_bulk, ["points"])
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            apply_student_mission(self)
 
 
 class StudentSkill(models.Model):
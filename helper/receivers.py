@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .catalogue import bump_version
+from .models import Mission, MissionQuestion
+
+
+@receiver(post_save, sender=Mission)
+@receiver(post_delete, sender=Mission)
+@receiver(post_save, sender=MissionQuestion)
+@receiver(post_delete, sender=MissionQuestion)
+def invalidate_mission_catalogue(sender, **kwargs):
+    transaction.on_commit(bump_version)
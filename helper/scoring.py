@@ -0,0 +1,135 @@
+from collections import Counter
+
+from django.db.models import F
+from django.utils import timezone
+
+from .catalogue import get_catalogue
+
+POINTS = {
+    1: 52,
+    2: 30,
+    3: 7,
+    4: 6,
+    5: 5
+}
+ROLES = {
+    "leader": "Лидер",
+    "specialist": "Специалист",
+    "idea": "Генератор идей",
+    "party": "Душа компании",
+    "expert": "Эксперт"
+}
+MOTIVATION = {
+    "achievement": "Достиженческий",
+    "process": "Процессный",
+    "material": "Материальный",
+    "ideological": "Идейный",
+    "team": "Командный"
+}
+ENTREPRENEURSHIP = {
+    "1": 16,
+    "2": 57,
+}
+ENTREPRENEURSHIP_MAX = 87
+
+
+def rank(data, labels):
+    """
+    Complete ``data`` with the missing ``labels`` keys and give points by position.
+    """
+    data = data + [key for key in labels.keys() if key not in data]
+    return {labels[key]: POINTS[i] for i, key in enumerate(data, start=1)}
+
+
+def score_answers(answers, questions):
+    """
+    Score student ``answers`` (question text -> chosen answers) against the
+    mission ``questions`` (question text -> answer -> values) in memory.
+
+    Returns a dict which may contain ``role``, ``motivation`` and
+    ``entrepreneurship`` plus ``skills``, a Counter of skill object points.
+    """
+    result = {}
+    answer_data = []
+
+    for question, chosen in answers.items():
+        values = questions.get(question, {})
+        data = []
+        for answer in chosen:
+            if values.get(answer):
+                data.extend(values[answer])
+
+        if any(x in data for x in ROLES.keys()):
+            result["role"] = rank(data, ROLES)
+        elif any(x in data for x in MOTIVATION.keys()):
+            result["motivation"] = rank(data, MOTIVATION)
+        else:
+            answer_data.extend(data)
+
+    skills = Counter()
+    for value, count in Counter(answer_data).items():
+        if value.startswith("entrepreneurship"):
+            result["entrepreneurship"] = ENTREPRENEURSHIP.get(value[-1], ENTREPRENEURSHIP_MAX)
+            continue
+        skills[value.upper()] = count
+
+    result["skills"] = skills
+    return result
+
+
+def apply_student_mission(student_mission):
+    """
+    Apply a saved student mission to the student: coins, next mission
+    unlock, completion time and answer scoring.
+
+    Missions and questions come from the in-memory catalogue, skills are
+    loaded once and everything is written with
+    one skills ``bulk_update`` and one student ``UPDATE``, followed by the
+    student dashboard rebuild. Callers are expected to run it in the
+    transaction that saved ``student_mission``.
+    """
+    from account.dashboard import refresh_dashboards
+    from .models import StudentMission, StudentSkill
+
+    catalogue = get_catalogue()
+    student = student_mission.student
+    # Missions created in the current transaction are not in the catalogue yet
+    mission = catalogue.get(student_mission.mission_id) or student_mission.mission
+    student_fields = {}
+
+    if student_mission.is_complete:
+        student.coins += mission.coins
+        student_fields["coins"] = F("coins") + mission.coins
+
+        StudentMission.objects.filter(
+            student_id=student.pk,
+            mission__order=(mission.order + 1)
+        ).update(is_unlocked=True)
+
+        if not student.missions.exclude(is_complete=True).exists():
+            student.completed_at = timezone.now()
+            student_fields["completed_at"] = student.completed_at
+
+    if student_mission.answers:
+        result = score_answers(student_mission.answers, catalogue.question_answers(mission.pk))
+
+        if "role" in result:
+            student.role.update(result["role"])
+            student_fields["role"] = student.role
+        if "motivation" in result:
+            student.motivation.update(result["motivation"])
+            student_fields["motivation"] = student.motivation
+        if "entrepreneurship" in result:
+            student.entrepreneurship = result["entrepreneurship"]
+            student_fields["entrepreneurship"] = student.entrepreneurship
+
+        if result["skills"]:
+            skills = list(student.skills.filter(object__in=result["skills"].keys()))
+            for skill in skills:
+                skill.points = result["skills"][skill.object]
+            StudentSkill.objects.bulk_update(skills, ["points"])
+
+    if student_fields:
+        type(student)._base_manager.filter(pk=student.pk).update(**student_fields)
+
+    refresh_dashboards(student.pk)
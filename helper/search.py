@@ -0,0 +1,82 @@
+import re
+
+from django.db import connection
+
+from account.models import User, Employer, Professional, College
+from events.models import Event
+
+WORD_RE = re.compile(r"\w+")
+MAX_WORDS = 8
+
+# Result type -> (model, title field). Every table has a stored
+# ``search_vector`` column and a trigram index on the title, both
+# created by migrations
+SOURCES = {
+    "employers": (Employer, "company_name"),
+    "professionals": (Professional, "profession_name"),
+    "colleges": (College, "college_name"),
+    "events": (Event, "title"),
+}
+
+
+def make_tsquery(text):
+    """
+    Turn user input into a ``to_tsquery`` expression matching every word
+    as a prefix, so partially typed words are found too.
+    """
+    words = WORD_RE.findall(text.lower())[:MAX_WORDS]
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def source_sql(type, model, title):
+    table = model._meta.db_table
+    title = model._meta.get_field(title).column
+    if model is Event:
+        # Events are verified themselves, profiles through their user
+        join = ""
+        verified = "t.verification = 'VERIFIED'"
+    else:
+        join = f" JOIN {User._meta.db_table} u ON u.id = t.user_id"
+        verified = "u.verification = 'VERIFIED'"
+
+    return f"""
+        SELECT '{type}' AS type, t.{model._meta.pk.column} AS id, t.{title} AS title,
+               ts_rank(t.search_vector, q.tsquery) + word_similarity(%(text)s, t.{title}) AS rank
+        FROM {table} t{join}, q
+        WHERE {verified} AND (t.search_vector @@ q.tsquery OR %(text)s <%% t.{title})
+    """
+
+
+def search(text, types=None, limit=10, offset=0):
+    """
+    Return ``(count, hits)`` for ``text`` across ``types`` (all ``SOURCES``
+    by default), ``hits`` being a page of ``{type, id, title, rank}`` dicts.
+
+    Rows match by full text on Russian stems or, for misspelled words,
+    by trigram word similarity of their title. Matching, ranking, counting
+    and paging are done in one query.
+    """
+    tsquery = make_tsquery(text)
+    types = [type for type in (types or SOURCES) if type in SOURCES]
+    if not tsquery or not types:
+        return 0, []
+
+    sources = " UNION ALL ".join(source_sql(type, *SOURCES[type]) for type in types)
+    sql = f"""
+        WITH q AS (SELECT to_tsquery('russian', %(tsquery)s) AS tsquery)
+        SELECT type, id, title, rank, count(*) OVER () AS total
+        FROM ({sources}) AS hits
+        ORDER BY rank DESC, type, id
+        LIMIT %(limit)s OFFSET %(offset)s
+    """
+    params = {"text": text, "tsquery": tsquery, "limit": limit, "offset": offset}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    count = rows[0][4] if rows else 0
+    hits = [
+        {"type": type, "id": id, "title": title, "rank": round(rank, 4)}
+        for type, id, title, rank, _ in rows
+    ]
+    return count, hits
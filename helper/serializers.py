@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from .catalogue import get_catalogue
 from .models import (
     StudentSkill,
     StudentMission,
@@ -32,20 +33,26 @@ class QuestionSerializer(serializers.ModelSerializer):
 
 
 class StudentMissionSerializer(serializers.ModelSerializer):
-    questions_count = serializers.IntegerField(source="mission.questions.count")
+    questions_count = serializers.SerializerMethodField()
 
     class Meta:
         model = StudentMission
         exclude = ("student", "reaction", "answers")
 
+    def get_questions_count(self, obj):
+        return get_catalogue().questions_count(obj.mission_id)
+
 
 class StudentMissionCreateSerializer(serializers.ModelSerializer):
-    questions_count = serializers.IntegerField(source="mission.questions.count")
+    questions_count = serializers.SerializerMethodField()
 
     class Meta:
         model = StudentMission
         exclude = ("student",)
 
+    def get_questions_count(self, obj):
+        return get_catalogue().questions_count(obj.mission_id)
+
     def update(self, instance, validated_data):
         if validated_data.get("answers"):
             instance.answers.update(validated_data.pop("answers"))
@@ -63,3 +70,10 @@ class MissionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Mission
         exclude = ("coins",)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    type = serializers.CharField()
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    rank = serializers.FloatField()
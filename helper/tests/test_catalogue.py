@@ -0,0 +1,19 @@
+from django.test import SimpleTestCase
+
+from helper.catalogue import MissionCatalogue
+from helper.models import Mission, MissionQuestion
+
+
+class MissionCatalogueTest(SimpleTestCase):
+    def test_skips_questions_of_unknown_missions(self):
+        mission = Mission(pk=1, coins=10, order=1)
+        questions = [
+            MissionQuestion(pk=1, mission_id=1, question="Первый", order=1),
+            # Committed with its mission after the missions were read
+            MissionQuestion(pk=2, mission_id=2, question="Второй", order=1),
+        ]
+        catalogue = MissionCatalogue("version", [mission], questions)
+
+        self.assertEqual(catalogue.questions_count(1), 1)
+        self.assertEqual(catalogue.questions_count(2), 0)
+        self.assertIsNone(catalogue.get(2))
@@ -4,6 +4,7 @@ from .views import *
 
 router = DefaultRouter()
 router.register(r"missions", MissionViewset, basename="missions")
+router.register(r"search", SearchViewset, basename="search")
 
 urlpatterns = [
 ] + router.urls
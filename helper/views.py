@@ -1,10 +1,15 @@
 from rest_framework import viewsets
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
+from .catalogue import get_catalogue, to_int
 from .models import Mission
-from .serializers import MissionSerializer, QuestionSerializer
+from .search import search
+from .serializers import MissionSerializer, QuestionSerializer, SearchResultSerializer
 
 
 class MissionViewset(viewsets.GenericViewSet):
@@ -18,6 +23,50 @@ class MissionViewset(viewsets.GenericViewSet):
         serializer_class=QuestionSerializer
     )
     def questions(self, request, pk=None):
-        mission = self.get_object()
-        serialzier = self.serializer_class(mission.questions.all(), many=True)
+        catalogue = get_catalogue()
+        mission = catalogue.get(pk)
+        if mission is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        serialzier = self.serializer_class(catalogue.questions(mission.pk), many=True)
         return Response(serialzier.data, status=status.HTTP_200_OK)
+
+
+class SearchViewset(viewsets.GenericViewSet):
+    """
+    Ranked search over employers, professionals, colleges and events:
+    ``?q=`` text, ``?type=`` comma separated result types, ``?page=`` and
+    ``?page_size=`` as in the catalogue endpoints.
+    """
+    serializer_class = SearchResultSerializer
+    max_page_size = 100
+
+    def list(self, request, *args, **kwargs):
+        text = request.query_params.get("q", "").strip()
+        types = request.query_params.get("type")
+        types = types.split(",") if types else None
+
+        page = max(to_int(request.query_params.get("page")) or 1, 1)
+        page_size = to_int(request.query_params.get("page_size")) or api_settings.PAGE_SIZE
+        page_size = min(max(page_size, 1), self.max_page_size)
+
+        count, hits = search(text, types, limit=page_size, offset=(page - 1) * page_size)
+        if page > 1 and not hits:
+            raise NotFound("Неверная страница.")
+
+        url = request.build_absolute_uri()
+        next = replace_query_param(url, "page", page + 1) if page * page_size < count else None
+        if page == 1:
+            previous = None
+        elif page == 2:
+            previous = remove_query_param(url, "page")
+        else:
+            previous = replace_query_param(url, "page", page - 1)
+
+        serializer = self.serializer_class(hits, many=True)
+        return Response({
+            "count": count,
+            "next": next,
+            "previous": previous,
+            "results": serializer.data,
+        }, status=status.HTTP_200_OK)